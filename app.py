@@ -5,6 +5,7 @@ Main Application Entry Point
 import streamlit as st
 import sys
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 
 # Configure logging
@@ -19,7 +20,7 @@ ROOT_DIR = Path(__file__).parent
 sys.path.insert(0, str(ROOT_DIR))
 
 from styles.custom_css import CUSTOM_CSS
-from config.settings import APP_NAME, APP_TAGLINE, APP_VERSION
+from config.settings import APP_NAME, APP_TAGLINE, APP_VERSION, ADMIN_ENABLED
 
 # FORCE RELOAD DATA MODULES
 # This is required to fix the persistent "dummy data" issue caused by stale sys.modules cache
@@ -29,7 +30,7 @@ importlib.reload(data.final_tutorials)
 
 # Initialize database
 try:
-    from database.db import init_db, check_db_exists
+    from database.db import init_db, check_db_exists, upgrade_db
     from database.operations import DatabaseOperations
     
     @st.cache_resource
@@ -38,6 +39,8 @@ try:
         if not check_db_exists():
             logger.info("Initializing database for first time...")
             init_db()
+        # Existing databases pick up indexes added since they were created
+        upgrade_db()
         return True
     
     DB_AVAILABLE = initialize_database()
@@ -308,9 +311,20 @@ def render_home():
 
 def main():
     """Main application entry Point (V3 Stabilization)"""
+    # Share one database session across the whole rerun instead of one per call
+    with DatabaseOperations() if DB_AVAILABLE else nullcontext():
+        render_app()
+
+
+def render_app():
+    """Render navigation, the current page and the footer"""
     # Initialize current page
     if 'current_page' not in st.session_state:
         st.session_state.current_page = "home"
+    # The cache admin page has no nav button; open it with ?page=admin when ADMIN_ENABLED
+    if ADMIN_ENABLED and st.query_params.get("page") == "admin":
+        st.session_state.current_page = "admin"
+        del st.query_params["page"]
     
     # Render top navigation
     render_top_nav()
@@ -360,6 +374,9 @@ def main():
         ai_news.render()
     elif st.session_state.current_page == "search_results":
         render_search_results()
+    elif st.session_state.current_page == "admin" and ADMIN_ENABLED:
+        from pages import cache_admin
+        cache_admin.render()
     else:
         render_home()
     
@@ -377,16 +394,31 @@ def render_search_results():
         st.info("Enter a search term in the navigation bar above.")
         return
     
-    from data.final_prompts import search_prompts
-    from data.final_assets import search_tools
-    from data.final_tutorials import search_tutorials
+    from data.search_index import get_search_index, highlight_markdown
+    from data.search_service import get_search_service
+    
+    # One ranked, typo-tolerant lookup covers every source; repeat queries
+    # (every rerun of this page) come from the search service's cache
+    hits = get_search_service().search_grouped(query)
+    found_prompts = [hit.record for hit in hits['prompt']]
+    found_tools = [hit.record for hit in hits['tool']]
+    found_tutorials = [hit.record for hit in hits['tutorial']]
+    found_hacks = [hit.record for hit in hits['hack']]
+    # Matching excerpts (FTS5 backend only), keyed by (kind, id)
+    snippets = {
+        (hit.kind, hit.id): highlight_markdown(hit.snippet, hit.highlights)
+        for kind_hits in hits.values() for hit in kind_hits if hit.snippet
+    }
     
-    # Search all sources
-    found_prompts = search_prompts(query)
-    found_tools = search_tools(query)
-    found_tutorials = search_tutorials(query)
+    total = len(found_prompts) + len(found_tools) + len(found_tutorials) + len(found_hacks)
     
-    total = len(found_prompts) + len(found_tools) + len(found_tutorials)
+    suggestion = get_search_index().suggest(query)
+    if suggestion:
+        # Runs before the nav bar's search box is rebuilt, so it can rewrite that widget too
+        def use_suggestion():
+            st.session_state.global_search = suggestion
+            st.session_state.global_search_query = suggestion
+        st.button(f"🔤 Did you mean: {suggestion}?", key="sr_did_you_mean", on_click=use_suggestion)
     
     if total == 0:
         st.warning(f"No results found for '{query}'. Try a different search term.")
@@ -399,12 +431,14 @@ def render_search_results():
     st.success(f"Found **{total}** results across all categories")
     
     # Display results by category
-    tab1, tab2, tab3 = st.tabs([f"💡 Prompts ({len(found_prompts)})", f"🔧 Tools ({len(found_tools)})", f"📚 Tutorials ({len(found_tutorials)})"])
+    tab1, tab2, tab3, tab4 = st.tabs([f"💡 Prompts ({len(found_prompts)})", f"🔧 Tools ({len(found_tools)})", f"📚 Tutorials ({len(found_tutorials)})", f"🔥 Hacks ({len(found_hacks)})"])
     
     with tab1:
         if found_prompts:
             for p in found_prompts[:10]:
                 with st.expander(f"{p['title']}", expanded=False):
+                    if ('prompt', p['id']) in snippets:
+                        st.caption(snippets[('prompt', p['id'])])
                     st.markdown(f"**Category:** {p.get('category', 'General').replace('_', ' ').title()}")
                     st.code(p.get('prompt', '')[:300] + "...", language="markdown")
                     if st.button("View Full Prompt", key=f"sr_p_{p['id']}"):
@@ -417,6 +451,8 @@ def render_search_results():
         if found_tools:
             for t in found_tools[:10]:
                 with st.expander(f"{t.get('icon', '🔧')} {t['name']}", expanded=False):
+                    if ('tool', t['id']) in snippets:
+                        st.caption(snippets[('tool', t['id'])])
                     st.markdown(f"**Category:** {t.get('category', 'General').replace('_', ' ').title()}")
                     st.markdown(t.get('description', '')[:200])
                     if st.button("View Tool", key=f"sr_t_{t['id']}"):
@@ -430,6 +466,8 @@ def render_search_results():
         if found_tutorials:
             for tut in found_tutorials[:10]:
                 with st.expander(f"{tut.get('icon', '📚')} {tut['title']}", expanded=False):
+                    if ('tutorial', tut['id']) in snippets:
+                        st.caption(snippets[('tutorial', tut['id'])])
                     st.markdown(f"**Duration:** {tut.get('duration', 'N/A')} | **Difficulty:** {tut.get('difficulty', 'Beginner')}")
                     st.markdown(tut.get('description', '')[:200])
                     if st.button("Start Tutorial", key=f"sr_tut_{tut['id']}"):
@@ -439,6 +477,20 @@ def render_search_results():
         else:
             st.info("No tutorials found.")
     
+    with tab4:
+        if found_hacks:
+            for h in found_hacks[:10]:
+                with st.expander(f"{h.get('icon', '🔥')} {h['title']}", expanded=False):
+                    if ('hack', h['id']) in snippets:
+                        st.caption(snippets[('hack', h['id'])])
+                    st.markdown(f"**Tool:** {h.get('tool', 'N/A')} | **Difficulty:** {h.get('difficulty', 'Beginner')}")
+                    st.markdown(h.get('description', '')[:200])
+                    if st.button("View Hacks", key=f"sr_h_{h['id']}"):
+                        st.session_state.current_page = "hacks"
+                        st.rerun()
+        else:
+            st.info("No hacks found.")
+    
     st.markdown("<br>", unsafe_allow_html=True)
     if st.button("🔄 Clear Search & Return Home", use_container_width=True):
         st.session_state.global_search_query = ""
@@ -0,0 +1,104 @@
+"""
+AI Nexus - HTML Fragment Cache
+Process-wide cache of rendered content-card HTML, shared by every session
+"""
+from config.settings import FRAGMENT_CACHE_MAX_ENTRIES
+from utils.cache_namespaces import CacheNamespaces, get_cache_namespaces, namespace_of
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FragmentCache:
+    """
+    LRU of rendered HTML keyed by (kind, item id, content version, variant)
+    plus the kind's namespace version.
+
+    Catalog records are static between content edits, so a card's markup
+    only has to be built once per process; every later rerun, in any
+    session, reuses the string. The content version (ContentCatalog.version
+    for catalogs, a hash of the records) is part of the key, so editing a
+    catalog makes the old fragments unreachable and they age out of the LRU,
+    while reloading a data module with unchanged content keeps them warm. So does the version
+    token of the kind's cache namespace (utils/cache_namespaces.py), which
+    invalidating that namespace bumps. The variant covers per-user
+    differences such as a tutorial's completed badge.
+
+    Usage:
+        html = get_fragment_cache().get_or_render(
+            'prompt', prompt['id'], catalog.version, 'default',
+            lambda: prompt_card_html(prompt))
+    """
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_MAX_ENTRIES,
+                 namespaces: Optional[CacheNamespaces] = None):
+        self.max_entries = max_entries
+        self.namespaces = namespaces or get_cache_namespaces()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get_or_render(self, kind: str, item_id: Hashable, version: Hashable, variant: Hashable,
+                      render: Callable[[], str]) -> str:
+        """Cached HTML for the key, calling render() to build it on a miss"""
+        namespace = namespace_of(kind)
+        key = (kind, item_id, version, variant, self.namespaces.version(namespace))
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self._metrics['hits'] += 1
+        if html is not None:
+            self.namespaces.record(namespace, hits=1)
+            return html
+        with self._lock:
+            self._metrics['misses'] += 1
+        self.namespaces.record(namespace, misses=1)
+
+        # Build outside the lock; two sessions racing on one card just render it twice
+        html = render()
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0][0])
+                self._metrics['evictions'] += 1
+        for evicted_kind in evicted:
+            self.namespaces.record(namespace_of(evicted_kind), evictions=1)
+        return html
+
+    def invalidate(self, kind: Optional[str] = None):
+        """Drop every fragment, or only those of one kind"""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[key]
+            self._metrics['invalidations'] += 1
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['entries'] = len(self._entries)
+        lookups = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        return metrics
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_fragment_cache() -> FragmentCache:
+    """Get the process-wide fragment cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FragmentCache()
+        return _cache
@@ -3,7 +3,7 @@ AI Nexus - UI Components Library
 Reusable Streamlit components with premium styling
 """
 import streamlit as st
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Hashable, Sequence, Tuple
 
 
 def render_hero_section(title: str, subtitle: str, show_cta: bool = True):
@@ -180,3 +180,60 @@ def render_empty_state(icon: str, title: str, description: str):
             <p>{description}</p>
         </div>
     """, unsafe_allow_html=True)
+
+
+def paginate(items: Sequence, page: int, page_size: int) -> Tuple[Sequence, int, int]:
+    """One page of items -> (page_items, page, page_count); page is 0-based and clamped into range"""
+    page_count = max(1, -(-len(items) // page_size))
+    page = min(max(page, 0), page_count - 1)
+    start = page * page_size
+    return items[start:start + page_size], page, page_count
+
+
+def _step_page(state_key: str, step: int):
+    st.session_state[state_key] = st.session_state.get(state_key, 0) + step
+
+
+def render_paginated_grid(items: Sequence, render_item: Callable[[Any, int], None], key: str,
+                          columns: int = 3, page_size: int = 24, reset_on: Hashable = None):
+    """
+    Render one page of items as a grid, with previous/next controls underneath.
+
+    Only the visible page is sliced out and rendered, so a result list of
+    thousands of records costs the same per rerun as one of page_size; pass
+    the cached (catalog, search service) list as-is rather than a copy.
+    The page number lives in st.session_state[f"{key}_page"] and goes back
+    to the first page whenever reset_on (e.g. the active search and
+    filters) changes. render_item(item, index) gets the item's position in
+    the full list, for stable widget keys.
+    """
+    page_key, reset_key = f"{key}_page", f"{key}_reset_on"
+    if st.session_state.get(reset_key) != reset_on:
+        st.session_state[reset_key] = reset_on
+        st.session_state[page_key] = 0
+
+    page_items, page, page_count = paginate(items, st.session_state.get(page_key, 0), page_size)
+    st.session_state[page_key] = page
+    offset = page * page_size
+
+    for i in range(0, len(page_items), columns):
+        cols = st.columns(columns)
+        for j in range(columns):
+            if i + j < len(page_items):
+                with cols[j]:
+                    render_item(page_items[i + j], offset + i + j)
+
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("◀ Previous", key=f"{key}_prev", use_container_width=True, disabled=page == 0,
+                      on_click=_step_page, args=(page_key, -1))
+        with col2:
+            st.markdown(
+                f"<p style='text-align: center; color: #64748B; margin-top: 0.5rem;'>Page {page + 1} of {page_count} "
+                f"· {offset + 1}–{offset + len(page_items)} of {len(items)}</p>",
+                unsafe_allow_html=True
+            )
+        with col3:
+            st.button("Next ▶", key=f"{key}_next", use_container_width=True, disabled=page == page_count - 1,
+                      on_click=_step_page, args=(page_key, 1))
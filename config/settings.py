@@ -1,12 +1,109 @@
 """
 AI Nexus - Configuration Settings
 """
+import os
 
 # Application Settings
 APP_NAME = "AI Nexus"
 APP_VERSION = "2.6.0"
 APP_TAGLINE = "Enterprise Cognitive Architecture & Engineering System"
 
+# Database Engine Profiles
+# Pick one with AINEXUS_DB_PROFILE; any single key can be overridden with
+# AINEXUS_DB_<KEY>, e.g. AINEXUS_DB_SYNCHRONOUS=FULL or AINEXUS_DB_POOL_SIZE=16
+DB_ENGINE_PROFILES = {
+    # SQLite's stock settings - what the app shipped with before profiles existed
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size_kib": 2000,
+        "mmap_size_bytes": 0,
+        "busy_timeout_ms": 5000,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+    },
+    # WAL lets readers run alongside a writer; NORMAL only fsyncs at checkpoints
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size_kib": 65536,
+        "mmap_size_bytes": 268435456,
+        "busy_timeout_ms": 5000,
+        "pool_size": 8,
+        "max_overflow": 8,
+        "pool_pre_ping": False,
+    },
+}
+DB_ENGINE_PROFILE = os.getenv("AINEXUS_DB_PROFILE", "production")
+
+# Activity Event Writer (track_activity is queued and bulk-inserted off the request path)
+ACTIVITY_BATCH_SIZE = 200
+ACTIVITY_FLUSH_INTERVAL_SECONDS = 1.0
+ACTIVITY_QUEUE_MAX_SIZE = 10000
+
+# Activity retention (scripts/activity_retention.py)
+# Raw rows older than this are archived once rolled up into activity_daily_rollups
+ACTIVITY_RETENTION_DAYS = 90
+ACTIVITY_RETENTION_BATCH_SIZE = 2000
+
+# Per-user favorites / completed-tutorial cache (utils.helpers membership checks)
+USER_CACHE_MAX_USERS = 1024
+USER_CACHE_TTL_SECONDS = 300
+
+# Search backend: "memory" (in-process BM25 index) or "fts5" (SQLite FTS5 table in data/search.db)
+SEARCH_BACKEND = os.getenv("AINEXUS_SEARCH_BACKEND", "memory")
+
+# Search result cache (data.search_service); news results expire with the feed cache
+SEARCH_CACHE_MAX_ENTRIES = 512
+NEWS_SEARCH_TTL_SECONDS = 600
+
+# Tutorial content store (data/tutorial_content.py) - resident tutorials / section bodies
+TUTORIAL_CACHE_MAX_TUTORIALS = 64
+TUTORIAL_CACHE_MAX_SECTIONS = 32
+
+# Rendered content-card HTML shared by all sessions (components/fragment_cache.py)
+FRAGMENT_CACHE_MAX_ENTRIES = 2048
+
+# Cache admin page (pages/cache_admin.py, opened with ?page=admin). Its buttons invalidate the caches
+# of every session, so the route is only mounted when AINEXUS_ADMIN_ENABLED=1
+ADMIN_ENABLED = os.getenv("AINEXUS_ADMIN_ENABLED", "0") == "1"
+
+# RSS fetching (data/ai_news.py) - per-source timeouts and one total budget for all feeds
+NEWS_FETCH_CONNECT_TIMEOUT_SECONDS = 3.0
+NEWS_FETCH_READ_TIMEOUT_SECONDS = 5.0
+NEWS_FETCH_DEADLINE_SECONDS = 8.0
+NEWS_FETCH_MAX_WORKERS = 8
+
+# Feed parsing: "streaming" (data/feed_parser.py - stops after the entries it keeps, bounded memory)
+# or "feedparser" (whole document). Bodies past NEWS_FEED_MAX_BYTES are abandoned either way
+NEWS_FEED_PARSER = os.getenv("AINEXUS_NEWS_FEED_PARSER", "streaming")
+NEWS_FEED_MAX_BYTES = 5 * 1024 * 1024
+
+# News ingestion (data/news_ingest.py): feeds are refreshed in the background every interval.
+# Set AINEXUS_NEWS_INGEST_IN_APP=0 when scripts/news_ingest.py runs as its own process instead
+NEWS_REFRESH_INTERVAL_SECONDS = 600
+NEWS_INGEST_IN_APP = os.getenv("AINEXUS_NEWS_INGEST_IN_APP", "1") != "0"
+
+# Per-source polling (data/feed_health.py): each feed is fetched every half of its observed gap
+# between posts, within these bounds; new sources start at NEWS_REFRESH_INTERVAL_SECONDS
+NEWS_POLL_MIN_SECONDS = 300
+NEWS_POLL_MAX_SECONDS = 6 * 3600
+
+# Circuit breaker: this many consecutive failures pause a source; retries back off exponentially
+NEWS_BREAKER_FAILURE_THRESHOLD = 3
+NEWS_BACKOFF_BASE_SECONDS = 60
+NEWS_BACKOFF_MAX_SECONDS = 6 * 3600
+
+# Stored news history (database/news_store.py) - most rows any listing query returns
+NEWS_MAX_ARTICLES = 500
+
+# Trending topics (data/trending.py): a headline's weight halves every half-life; at most
+# MAX_TERMS counters are kept and the CANDIDATES heaviest are tracked for top-K reads
+NEWS_TRENDING_HALF_LIFE_HOURS = 24.0
+NEWS_TRENDING_MAX_TERMS = 20000
+NEWS_TRENDING_CANDIDATES = 50
+
 # Theme Colors
 COLORS = {
     "primary": "#2563EB",
@@ -2,6 +2,7 @@
 AI Nexus - AI Hacks Database
 Curated productivity hacks, tips, and tricks for AI tools
 """
+from data.content_registry import ContentCatalog, register_catalog
 
 AI_HACKS = [
     {
@@ -1277,30 +1278,43 @@ git push
 ]
 
 
+HACKS_CATALOG = register_catalog('hacks', ContentCatalog(AI_HACKS, facets={
+    'category': ('category', True),
+    'tool': ('tool', True),
+    'difficulty': ('difficulty', True),
+    'tag': ('tags', True),
+}))
+
+
 def get_all_hacks():
     """Get all AI hacks"""
     return AI_HACKS
 
 
+def get_hack_by_id(hack_id):
+    """Get a single hack by ID"""
+    return HACKS_CATALOG.get(hack_id)
+
+
 def get_hacks_by_category(category):
     """Get hacks filtered by category"""
     if category == "All":
         return AI_HACKS
-    return [h for h in AI_HACKS if h['category'].lower() == category.lower()]
+    return HACKS_CATALOG.lookup('category', category)
 
 
 def get_hacks_by_tool(tool):
     """Get hacks filtered by tool"""
     if tool == "All":
         return AI_HACKS
-    return [h for h in AI_HACKS if h['tool'].lower() == tool.lower()]
+    return HACKS_CATALOG.lookup('tool', tool)
 
 
 def get_hacks_by_difficulty(difficulty):
     """Get hacks filtered by difficulty"""
     if difficulty == "All":
         return AI_HACKS
-    return [h for h in AI_HACKS if h['difficulty'].lower() == difficulty.lower()]
+    return HACKS_CATALOG.lookup('difficulty', difficulty)
 
 
 def search_hacks(query):
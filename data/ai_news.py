@@ -2,9 +2,27 @@
 AI Nexus - AI News Aggregator
 Real-time AI news from top sources using RSS feeds
 """
-import feedparser
+from config.settings import (
+    NEWS_FETCH_CONNECT_TIMEOUT_SECONDS, NEWS_FETCH_READ_TIMEOUT_SECONDS,
+    NEWS_FETCH_DEADLINE_SECONDS, NEWS_FETCH_MAX_WORKERS,
+    NEWS_FEED_PARSER, NEWS_FEED_MAX_BYTES
+)
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import streamlit as st
+from typing import Dict, List, Optional
+from database import news_store
+from data.feed_parser import SUMMARY_CHARS, FeedParseError, StreamingFeedParser, utc_now
+from data.trending import get_trending_engine
+import feedparser
+import requests
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+FEED_USER_AGENT = "AI-Nexus news aggregator"
+ARTICLES_PER_FEED = 10
 
 # Top AI News RSS Feeds
 AI_NEWS_SOURCES = [
@@ -59,69 +77,268 @@ AI_NEWS_SOURCES = [
 ]
 
 
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def fetch_news_from_source(source):
-    """Fetch news from a single RSS source"""
-    try:
-        feed = feedparser.parse(source['url'])
-        articles = []
+class FeedTimeout(Exception):
+    """A feed did not finish downloading within its deadline"""
+
+
+class FeedTooLarge(Exception):
+    """A feed body went past NEWS_FEED_MAX_BYTES before it yielded its entries"""
+
+
+@dataclass
+class FeedResult:
+    """
+    Outcome of fetching one source: its articles, or the reason there are none.
+
+    not_modified means the server answered a conditional request with 304,
+    so nothing was downloaded or parsed and the caller's previous articles
+    are still current. etag / last_modified are the validators to send on
+    the next fetch; bytes and parse_ms record what this fetch cost.
+    """
+    source: str
+    articles: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    not_modified: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    bytes: int = 0
+    parse_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """The response's cache validators, in the shape fetch_feed() accepts"""
+        return {k: v for k, v in (('etag', self.etag), ('last_modified', self.last_modified)) if v}
+
+
+@dataclass(frozen=True)
+class FeedDownload:
+    """
+    A feed response: its body, or not_modified for a 304, plus the validators
+    it carried. body is empty when the download was streamed into a parser;
+    size is the number of bytes read either way.
+    """
+    body: bytes = b""
+    not_modified: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: int = 0
+
+
+def parse_feed(content: bytes, source: Dict, parser: str = NEWS_FEED_PARSER) -> List[Dict]:
+    """Article dicts for the newest entries of a downloaded RSS/Atom document"""
+    if parser == "streaming":
+        streaming = StreamingFeedParser(source, ARTICLES_PER_FEED)
+        streaming.feed(content)
+        return streaming.close()
+    
+    feed = feedparser.parse(content)
+    articles = []
+    
+    for entry in feed.entries[:ARTICLES_PER_FEED]:
+        # Parse published date
+        published = None
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+            published = datetime(*entry.updated_parsed[:6])
         
-        for entry in feed.entries[:10]:  # Get latest 10 articles
-            # Parse published date
-            published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                published = datetime(*entry.updated_parsed[:6])
-            
-            article = {
-                'title': entry.get('title', 'No Title'),
-                'link': entry.get('link', '#'),
-                'summary': entry.get('summary', entry.get('description', 'No summary available'))[:300],
-                'published': published,
-                'source': source['name'],
-                'category': source['category'],
-                'icon': source['icon']
-            }
-            articles.append(article)
+        articles.append({
+            'title': entry.get('title', 'No Title'),
+            'link': entry.get('link', '#'),
+            'summary': entry.get('summary', entry.get('description', 'No summary available'))[:SUMMARY_CHARS],
+            'published': published,
+            'source': source['name'],
+            'category': source['category'],
+            'icon': source['icon']
+        })
+    
+    return articles
+
+
+def download_feed(url: str, deadline: float, validators: Optional[Dict[str, str]] = None,
+                  connect_timeout: float = NEWS_FETCH_CONNECT_TIMEOUT_SECONDS,
+                  read_timeout: float = NEWS_FETCH_READ_TIMEOUT_SECONDS,
+                  max_bytes: int = NEWS_FEED_MAX_BYTES,
+                  parser: Optional[StreamingFeedParser] = None) -> FeedDownload:
+    """
+    Response for url, or FeedTimeout once time.monotonic() passes deadline.
+
+    validators ({'etag', 'last_modified'} from the previous fetch) turn the
+    request into a conditional GET; an unchanged feed then comes back as a
+    bodiless 304. requests' read timeout only bounds the gap between two
+    packets, so the body is streamed and the deadline checked per chunk -
+    a server that trickles bytes cannot hold the fetch open past its budget.
+    
+    With a parser, chunks go straight into it instead of being kept, and
+    the download stops as soon as the parser has its entries. A body that
+    runs past max_bytes first raises FeedTooLarge.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise FeedTimeout("no time left before the deadline")
+    
+    headers = {'User-Agent': FEED_USER_AGENT}
+    validators = validators or {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    
+    timeout = (min(connect_timeout, remaining), min(read_timeout, remaining))
+    with requests.get(url, timeout=timeout, stream=True, headers=headers) as response:
+        # A 304 may omit the validators; the ones just sent are still current then
+        etag = response.headers.get('ETag') or validators.get('etag')
+        last_modified = response.headers.get('Last-Modified') or validators.get('last_modified')
+        if response.status_code == 304:
+            return FeedDownload(not_modified=True, etag=etag, last_modified=last_modified)
         
-        return articles
+        response.raise_for_status()
+        declared = response.headers.get('Content-Length', '')
+        if parser is None and declared.isdigit() and int(declared) > max_bytes:
+            # Without a streaming parser the whole body would be needed; don't start on it
+            raise FeedTooLarge(f"body of {declared} bytes exceeds {max_bytes}")
+        chunks = []
+        size = 0
+        for chunk in _iter_body(response.raw):
+            size += len(chunk)
+            if parser is not None:
+                parser.feed(chunk)
+                if parser.done:
+                    break
+            else:
+                chunks.append(chunk)
+            if size > max_bytes:
+                raise FeedTooLarge(f"body exceeds {max_bytes} bytes")
+            if time.monotonic() > deadline:
+                raise FeedTimeout("deadline exceeded while reading")
+        return FeedDownload(b"".join(chunks), etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified'), size=size)
+
+
+def _iter_body(raw):
+    """Body chunks as they arrive (read1 returns what is buffered instead of waiting for a full chunk)"""
+    if hasattr(raw, 'read1'):  # urllib3 >= 2.3
+        read = lambda: raw.read1(65536, decode_content=True)
+    else:
+        read = lambda: raw.read(1024, decode_content=True)
+    while True:
+        chunk = read()
+        if not chunk:
+            return
+        yield chunk
+
+
+def fetch_feed(source: Dict, deadline: float, validators: Optional[Dict[str, str]] = None) -> FeedResult:
+    """Download and parse one source (skipping the parse on a 304); failures are captured in the result, never raised"""
+    start = time.monotonic()
+    try:
+        streaming = StreamingFeedParser(source, ARTICLES_PER_FEED) if NEWS_FEED_PARSER == "streaming" else None
+        download = download_feed(source['url'], deadline, validators, parser=streaming)
+        if download.not_modified:
+            return FeedResult(source['name'], elapsed=time.monotonic() - start, not_modified=True,
+                              etag=download.etag, last_modified=download.last_modified)
+        
+        if streaming is not None:
+            articles = streaming.close()
+            parse_ms = streaming.parse_ms
+        else:
+            parse_start = time.perf_counter()
+            articles = parse_feed(download.body, source, parser="feedparser")
+            parse_ms = (time.perf_counter() - parse_start) * 1000
+        return FeedResult(source['name'], articles, elapsed=time.monotonic() - start,
+                          etag=download.etag, last_modified=download.last_modified,
+                          bytes=download.size, parse_ms=parse_ms)
+    except (requests.RequestException, FeedTimeout, FeedTooLarge, FeedParseError) as e:
+        logger.warning(f"Could not fetch from {source['name']}: {e}")
+        return FeedResult(source['name'], error=str(e) or type(e).__name__, elapsed=time.monotonic() - start)
     except Exception as e:
-        st.warning(f"Could not fetch from {source['name']}: {str(e)}")
-        return []
+        logger.error(f"Error parsing feed from {source['name']}: {e}")
+        return FeedResult(source['name'], error=str(e), elapsed=time.monotonic() - start)
 
 
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def get_all_news():
-    """Fetch news from all sources"""
-    all_articles = []
-    
-    for source in AI_NEWS_SOURCES:
-        articles = fetch_news_from_source(source)
-        all_articles.extend(articles)
+def fetch_all_feeds(sources: Optional[List[Dict]] = None,
+                    deadline_seconds: float = NEWS_FETCH_DEADLINE_SECONDS,
+                    max_workers: int = NEWS_FETCH_MAX_WORKERS,
+                    validators: Optional[Dict[str, Dict[str, str]]] = None) -> List[FeedResult]:
+    """
+    Fetch every source concurrently, returning within deadline_seconds.
+
+    Each source gets its own connect/read timeouts, and all of them share
+    one total budget. Sources still outstanding when it runs out are
+    reported as timed out, so a single hung feed costs at most the budget
+    and the others' articles are still returned. validators maps a source
+    name to the etag/last_modified of its previous fetch (see
+    FeedResult.validators). Results follow the order of sources.
+    """
+    validators = validators or {}
+    sources = AI_NEWS_SOURCES if sources is None else sources
+    if not sources:
+        return []
     
-    # Sort by published date (newest first)
+    deadline = time.monotonic() + deadline_seconds
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(sources)), thread_name_prefix="news-fetch")
+    try:
+        futures = [pool.submit(fetch_feed, source, deadline, validators.get(source['name'])) for source in sources]
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        results = []
+        for source, future in zip(sources, futures):
+            if future.done():
+                results.append(future.result())
+            else:
+                logger.warning(f"Could not fetch from {source['name']}: deadline exceeded")
+                results.append(FeedResult(source['name'], error="deadline exceeded", elapsed=deadline_seconds))
+        return results
+    finally:
+        # Stragglers stop at their own deadline check; don't wait for them here
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_news_from_source(source):
+    """Fetch news from a single RSS source (empty on failure)"""
+    return fetch_feed(source, time.monotonic() + NEWS_FETCH_DEADLINE_SECONDS).articles
+
+
+def merge_articles(results: List[FeedResult]) -> List[Dict]:
+    """Articles of every successful fetch, newest first"""
+    all_articles = [article for result in results for article in result.articles]
     all_articles.sort(key=lambda x: x['published'] if x['published'] else datetime.min, reverse=True)
-    
     return all_articles
 
 
+def _ensure_ingestion():
+    """Start the background ingestor; on a first start with nothing stored yet, wait for its initial fetch"""
+    from data.news_ingest import get_news_ingestor
+    ingestor = get_news_ingestor()
+    if ingestor.snapshot().is_empty and ingestor.is_running():
+        ingestor.wait_until_ready(NEWS_FETCH_DEADLINE_SECONDS + 2)
+    return ingestor
+
+
+def get_all_news():
+    """Latest stored articles, newest first (indexed query; never fetches on the page's thread once warm)"""
+    ingestor = _ensure_ingestion()
+    # The snapshot still has the last fetch if the article store could not be read
+    return news_store.recent_articles() or list(ingestor.snapshot().articles)
+
+
 def get_news_by_category(category):
     """Get news filtered by category"""
-    all_news = get_all_news()
-    
     if category == "All":
-        return all_news
+        return get_all_news()
     
-    return [article for article in all_news if article['category'] == category]
+    _ensure_ingestion()
+    return news_store.articles_by_category(category)
 
 
 def get_news_by_timeframe(hours=24):
     """Get news from the last N hours"""
-    all_news = get_all_news()
-    cutoff = datetime.now() - timedelta(hours=hours)
-    
-    return [article for article in all_news if article['published'] and article['published'] > cutoff]
+    _ensure_ingestion()
+    return news_store.articles_since(utc_now() - timedelta(hours=hours))
 
 
 def search_news(query):
@@ -129,30 +346,15 @@ def search_news(query):
     if not query:
         return []
     
-    all_news = get_all_news()
-    query = query.lower()
-    
-    return [
-        article for article in all_news
-        if query in article['title'].lower() or query in article['summary'].lower()
-    ]
+    _ensure_ingestion()
+    return news_store.search_articles(query)
 
 
-def get_trending_topics():
-    """Extract trending topics from news titles"""
-    all_news = get_all_news()
-    
-    # Simple keyword extraction (can be enhanced with NLP)
-    keywords = {}
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'just', 'don', 'now', 'new'}
-    
-    for article in all_news[:50]:  # Analyze recent 50 articles
-        words = article['title'].lower().split()
-        for word in words:
-            word = word.strip('.,!?;:()[]{}"\'-')
-            if len(word) > 3 and word not in common_words:
-                keywords[word] = keywords.get(word, 0) + 1
-    
-    # Get top 10 trending topics
-    trending = sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:10]
-    return [{'topic': word.title(), 'count': count} for word, count in trending]
+def get_trending_topics(limit=10):
+    """Top terms and bigrams of recent headlines, weighted by recency (data/trending.py)"""
+    ingestor = _ensure_ingestion()
+    engine = get_trending_engine()
+    if not ingestor.is_running():
+        # Counters are saved by scripts/news_ingest.py when ingestion runs out of process
+        engine.reload_if_changed()
+    return [{'topic': term.title(), 'count': max(1, round(weight))} for term, weight in engine.top(limit)]
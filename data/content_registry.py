@@ -0,0 +1,119 @@
+"""
+AI Nexus - Content Registry
+Precomputed O(1) lookup indexes over the static content catalogs
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+import importlib
+import hashlib
+import json
+
+# Data module that registers each catalog when it is imported
+CATALOG_MODULES = {
+    'prompts': 'data.final_prompts',
+    'tools': 'data.final_assets',
+    'tutorials': 'data.final_tutorials',
+    'hacks': 'data.ai_hacks',
+}
+
+_catalogs: Dict[str, 'ContentCatalog'] = {}
+
+
+class ContentCatalog:
+    """
+    Dict indexes over one list of content records.
+
+    Built once when the data module is imported. Every facet maps a key to
+    the list of records carrying it, so filtered views are a single dict
+    lookup instead of a scan. Facets are declared as
+    name -> (field, case_insensitive); list-valued fields (roles, tags)
+    index the record under each element.
+
+    Returned lists are shared between callers and must not be mutated.
+    `version` is a hash of the records, so caches derived from them
+    (rendered cards, for example) can key on it: it changes when the
+    content does, and stays put when a module reload rebuilds the same data.
+
+    Usage:
+        catalog = ContentCatalog(PROMPTS_DATABASE, facets={'category': ('category', True)})
+        catalog.get('p-1')
+        catalog.lookup('category', 'Coding')
+    """
+
+    def __init__(self, items: List[Dict], facets: Optional[Dict[str, Tuple[str, bool]]] = None,
+                 include: Optional[Callable[[Dict], bool]] = None):
+        self.items = items
+        self.facets = dict(facets or {})
+        self.include = include
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute every index (call after mutating the source list)"""
+        self.visible = [item for item in self.items if self.include(item)] if self.include else self.items
+        self.by_id = {item['id']: item for item in self.items if 'id' in item}
+        self._indexes = {}
+        for name, (field, case_insensitive) in self.facets.items():
+            index = {}
+            for item in self.visible:
+                for key in _facet_keys(item.get(field), case_insensitive):
+                    index.setdefault(key, []).append(item)
+            self._indexes[name] = index
+        self._ranked = {}
+        self.version = content_version(self.items)
+
+    def get(self, item_id: str) -> Optional[Dict]:
+        """Record by id, or None"""
+        return self.by_id.get(item_id)
+
+    def lookup(self, facet: str, value: Any) -> List[Dict]:
+        """Records whose facet field equals (or, for lists, contains) value"""
+        _, case_insensitive = self.facets[facet]
+        if case_insensitive and isinstance(value, str):
+            value = value.lower()
+        return self._indexes[facet].get(value, [])
+
+    def facet_values(self, facet: str) -> List[Hashable]:
+        """Distinct keys present for a facet"""
+        return list(self._indexes[facet])
+
+    def ranked(self, field: str) -> List[Dict]:
+        """Visible records sorted by a numeric field, highest first (sorted once, then cached)"""
+        ranked = self._ranked.get(field)
+        if ranked is None:
+            ranked = sorted(self.visible, key=lambda item: item.get(field, 0), reverse=True)
+            self._ranked[field] = ranked
+        return ranked
+
+    def __len__(self):
+        return len(self.visible)
+
+
+def content_version(items: List[Dict]) -> str:
+    """Stable hash of a list of records (equal content -> equal version)"""
+    payload = json.dumps(items, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _facet_keys(value: Any, case_insensitive: bool) -> Iterable[Hashable]:
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    for v in values:
+        if v is None or isinstance(v, (dict, list)):
+            continue
+        yield v.lower() if case_insensitive and isinstance(v, str) else v
+
+
+def register_catalog(name: str, catalog: ContentCatalog) -> ContentCatalog:
+    """Make a data module's catalog available through get_catalog"""
+    _catalogs[name] = catalog
+    return catalog
+
+
+def get_catalog(name: str) -> ContentCatalog:
+    """Get a catalog by name ('prompts', 'tools', 'tutorials', 'hacks'), importing its data module if needed"""
+    if name not in _catalogs:
+        importlib.import_module(CATALOG_MODULES[name])
+    return _catalogs[name]
+
+
+def get_all_catalogs() -> Dict[str, ContentCatalog]:
+    """Every registered catalog, loading all content modules"""
+    return {name: get_catalog(name) for name in CATALOG_MODULES}
@@ -0,0 +1,216 @@
+"""
+AI Nexus - Feed Health
+Per-source circuit breaker, failure backoff and publish-rate-driven polling for the news feeds
+"""
+from config.settings import (
+    NEWS_REFRESH_INTERVAL_SECONDS, NEWS_POLL_MIN_SECONDS, NEWS_POLL_MAX_SECONDS,
+    NEWS_BREAKER_FAILURE_THRESHOLD, NEWS_BACKOFF_BASE_SECONDS, NEWS_BACKOFF_MAX_SECONDS
+)
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import statistics
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Weight of the newest sample in the latency and publish-gap averages
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class SourceHealth:
+    """
+    One source's breaker state and running stats. Times are epoch seconds;
+    publish_gap is the smoothed time between the feed's posts and
+    poll_interval the resulting time between fetches.
+    """
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    fetches: int = 0
+    failures: int = 0
+    not_modified: int = 0
+    last_error: Optional[str] = None
+    last_success_at: Optional[float] = None
+    last_failure_at: Optional[float] = None
+    next_fetch_at: float = 0.0
+    poll_interval: float = NEWS_REFRESH_INTERVAL_SECONDS
+    publish_gap: Optional[float] = None
+    latency_ms: Optional[float] = None
+    last_latency_ms: Optional[float] = None
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        return None if not self.fetches else 1 - self.failures / self.fetches
+
+    def to_dict(self) -> Dict:
+        return dict(asdict(self), success_rate=self.success_rate)
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> 'SourceHealth':
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in payload.items() if k in names})
+
+
+def publish_gap(articles: List[Dict]) -> Optional[float]:
+    """Median seconds between a feed's consecutive dated entries (None with fewer than two)"""
+    dates = sorted((a['published'] for a in articles if a.get('published')), reverse=True)
+    gaps = [(newer - older).total_seconds() for newer, older in zip(dates, dates[1:])]
+    gaps = [gap for gap in gaps if gap > 0]
+    return statistics.median(gaps) if gaps else None
+
+
+def _smooth(previous: Optional[float], sample: float) -> float:
+    return sample if previous is None else EWMA_ALPHA * sample + (1 - EWMA_ALPHA) * previous
+
+
+class FeedHealth:
+    """
+    Decides which sources to fetch each cycle and records how they did.
+
+    Circuit breaker: failure_threshold consecutive failures open a
+    source's circuit, and it is skipped - even on a manual refresh -
+    until its backoff (base_backoff doubled per further failure, capped
+    at max_backoff) runs out. Then it goes half-open: one probe fetch
+    closes the circuit again on success or reopens it with a longer
+    backoff. Failures below the threshold are retried after the same
+    backoff, so a flaky source is not hammered either.
+
+    Adaptive polling: a healthy source is fetched every half of its
+    smoothed publish gap (the median spacing of its entries' dates),
+    clamped to [min_interval, max_interval] - fast feeds are polled often,
+    feeds that post weekly a few times a day at most.
+
+    Usage:
+        health = FeedHealth()
+        for source in health.due(sources):
+            ...
+        health.record(result)
+        health.stats()  # {'OpenAI Blog': {'state': 'closed', 'latency_ms': 140.2, ...}}
+    """
+
+    def __init__(self, failure_threshold: int = NEWS_BREAKER_FAILURE_THRESHOLD,
+                 base_backoff: float = NEWS_BACKOFF_BASE_SECONDS,
+                 max_backoff: float = NEWS_BACKOFF_MAX_SECONDS,
+                 min_interval: float = NEWS_POLL_MIN_SECONDS,
+                 max_interval: float = NEWS_POLL_MAX_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sources: Dict[str, SourceHealth] = {}
+
+    def _get(self, name: str) -> SourceHealth:
+        health = self._sources.get(name)
+        if health is None:
+            health = self._sources[name] = SourceHealth()
+        return health
+
+    # ==================== SCHEDULING ====================
+
+    def due(self, sources: List[Dict], force: bool = False) -> List[Dict]:
+        """
+        Sources to fetch now: those whose next fetch time has come, or with
+        force every source whose circuit is not open. An open circuit whose
+        backoff has run out is moved to half-open and returned as a probe.
+        """
+        now = self._clock()
+        selected = []
+        with self._lock:
+            for source in sources:
+                health = self._get(source['name'])
+                if now < health.next_fetch_at and (not force or health.state == OPEN):
+                    continue
+                if health.state == OPEN:
+                    health.state = HALF_OPEN
+                    logger.info(f"Probing {source['name']} after {health.consecutive_failures} failures")
+                selected.append(source)
+        return selected
+
+    def next_due_in(self, sources: List[Dict]) -> float:
+        """Seconds until the earliest scheduled fetch among sources (0 if one is due)"""
+        now = self._clock()
+        with self._lock:
+            soonest = min((self._get(s['name']).next_fetch_at for s in sources), default=now)
+        return max(0.0, soonest - now)
+
+    # ==================== OUTCOMES ====================
+
+    def record(self, result):
+        """Update a source's breaker and stats from its FeedResult"""
+        now = self._clock()
+        with self._lock:
+            health = self._get(result.source)
+            health.fetches += 1
+            health.last_latency_ms = round(result.elapsed * 1000, 1)
+            if result.ok:
+                self._succeeded(health, result, now)
+            else:
+                self._failed(result.source, health, result.error, now)
+
+    def _succeeded(self, health: SourceHealth, result, now: float):
+        health.latency_ms = round(_smooth(health.latency_ms, health.last_latency_ms), 1)
+        health.state = CLOSED
+        health.consecutive_failures = 0
+        health.last_success_at = now
+        if result.not_modified:
+            health.not_modified += 1
+        else:
+            gap = publish_gap(result.articles)
+            if gap is not None:
+                health.publish_gap = round(_smooth(health.publish_gap, gap), 1)
+        if health.publish_gap is not None:
+            health.poll_interval = min(self.max_interval, max(self.min_interval, health.publish_gap / 2))
+        health.next_fetch_at = now + health.poll_interval
+
+    def _failed(self, name: str, health: SourceHealth, error: Optional[str], now: float):
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_error = error
+        health.last_failure_at = now
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** (health.consecutive_failures - 1))
+        if health.state == HALF_OPEN or health.consecutive_failures >= self.failure_threshold:
+            if health.state != OPEN:
+                logger.warning(f"Circuit open for {name} after {health.consecutive_failures} failures: {error}")
+            health.state = OPEN
+        health.next_fetch_at = now + backoff
+
+    # ==================== READS & PERSISTENCE ====================
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-source health as plain dicts (also the persisted form)"""
+        with self._lock:
+            return {name: health.to_dict() for name, health in self._sources.items()}
+
+    def restore(self, stats: Dict[str, Dict]):
+        """Resume from stats() saved by an earlier process"""
+        with self._lock:
+            for name, payload in stats.items():
+                try:
+                    self._sources[name] = SourceHealth.from_dict(payload)
+                except TypeError as e:
+                    logger.error(f"Ignoring saved health of {name}: {e}")
+
+
+def describe(health: Dict) -> str:
+    """One-line summary of a source's health dict, for the page and scripts"""
+    if health['state'] == OPEN:
+        retry = datetime.fromtimestamp(health['next_fetch_at']).strftime('%H:%M')
+        return f"circuit open after {health['consecutive_failures']} failures, next probe {retry}"
+    parts = [health['state'].replace('_', '-')]
+    if health.get('latency_ms') is not None:
+        parts.append(f"{health['latency_ms']:.0f} ms")
+    if health.get('success_rate') is not None:
+        parts.append(f"{health['success_rate']:.0%} ok")
+    parts.append(f"every {health['poll_interval'] / 60:.0f} min")
+    return ", ".join(parts)
@@ -0,0 +1,257 @@
+"""
+AI Nexus - Streaming Feed Parser
+Incremental RSS/Atom parsing that keeps only the first entries and never builds the document tree
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from xml.parsers import expat
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Characters of summary text kept per article
+SUMMARY_CHARS = 300
+
+# Longest title, link or date text kept; anything beyond is markup abuse, not content
+FIELD_CHARS = 1024
+
+ENTRY_ELEMENTS = frozenset({'item', 'entry'})
+
+# Entry child element (local name, any namespace) -> article field
+FIELD_ELEMENTS = {
+    'title': 'title',
+    'link': 'link',
+    'guid': 'guid',
+    'description': 'summary',
+    'summary': 'summary',
+    'encoded': 'content',  # content:encoded
+    'content': 'content',
+    'pubDate': 'published',
+    'published': 'published',
+    'issued': 'published',
+    'date': 'published',  # dc:date
+    'updated': 'updated',
+    'modified': 'updated',
+}
+
+_TEXT_FIELDS = frozenset({'title', 'summary', 'content'})
+
+
+class FeedParseError(Exception):
+    """A feed was malformed or unsafe and yielded no entries"""
+
+
+class _TextCollector(HTMLParser):
+    """
+    Plain text of streamed HTML (tags dropped, entities decoded), keeping
+    only the first limit characters - the rest of the input is ignored
+    rather than buffered.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.length = 0
+        self.parts: List[str] = []
+        self._skip = 0
+
+    @property
+    def full(self) -> bool:
+        return self.length >= self.limit
+
+    def add(self, data: str):
+        if not self.full:
+            self.feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+        elif tag in ('p', 'br', 'div', 'li'):
+            self._append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._append(data)
+
+    def _append(self, data: str):
+        if not self.full:
+            data = data[:self.limit - self.length + 1]
+            self.parts.append(data)
+            self.length += len(data)
+
+    def text(self) -> str:
+        self.close()
+        return " ".join("".join(self.parts).split())[:self.limit]
+
+
+def utc_now() -> datetime:
+    """Current time as naive UTC, the form published dates are parsed and stored in"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """RFC 822 (RSS) or ISO 8601 (Atom) date as naive UTC, like feedparser's *_parsed fields"""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class StreamingFeedParser:
+    """
+    Incremental RSS 2.0 / RSS 1.0 / Atom parser built on expat.
+
+    Body chunks are pushed in as they are downloaded. Only the fields of
+    the first max_entries entries are collected, each capped in length,
+    and summaries are reduced to plain text while streaming - so memory
+    stays bounded however large the feed is. done turns true once enough
+    entries were read, and the caller can stop downloading.
+
+    Entity declarations are rejected outright (no "billion laughs"
+    expansion) and external entities are never fetched. A malformed
+    document keeps the entries completed before the error.
+
+    Usage:
+        parser = StreamingFeedParser(source, max_entries=10)
+        for chunk in chunks:
+            parser.feed(chunk)
+            if parser.done:
+                break
+        articles = parser.close()
+    """
+
+    def __init__(self, source: Dict, max_entries: int, summary_chars: int = SUMMARY_CHARS):
+        self.source = source
+        self.max_entries = max_entries
+        self.summary_chars = summary_chars
+        self.articles: List[Dict] = []
+        self.bytes = 0
+        self.parse_ms = 0.0
+        self.error: Optional[str] = None
+        self._depth = 0
+        self._entry_depth = None
+        self._entry: Dict = {}
+        self._field = None
+        self._field_depth = None
+        self._collector = None
+
+        self._parser = expat.ParserCreate(namespace_separator=' ')
+        self._parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_NEVER)
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._text
+        self._parser.EntityDeclHandler = self._reject_entities
+
+    @property
+    def done(self) -> bool:
+        """Enough entries were read, or the document is broken - no point feeding more"""
+        return len(self.articles) >= self.max_entries or self.error is not None
+
+    def feed(self, chunk: bytes):
+        """Parse the next piece of the body"""
+        if self.done:
+            return
+        self.bytes += len(chunk)
+        self._parse(chunk, False)
+
+    def close(self) -> List[Dict]:
+        """Finish parsing; the articles read, or FeedParseError if a broken feed yielded none"""
+        if not self.done:
+            self._parse(b"", True)
+        if self.error is not None and not self.articles:
+            raise FeedParseError(self.error)
+        if self.error is not None:
+            logger.debug(f"Kept {len(self.articles)} entries of malformed feed {self.source['name']}: {self.error}")
+        return self.articles
+
+    def _parse(self, data: bytes, final: bool):
+        start = time.perf_counter()
+        try:
+            self._parser.Parse(data, final)
+        except (expat.ExpatError, FeedParseError) as e:
+            self.error = str(e)
+        finally:
+            self.parse_ms += (time.perf_counter() - start) * 1000
+
+    # ==================== EXPAT HANDLERS ====================
+
+    def _reject_entities(self, *args):
+        raise FeedParseError("feed declares XML entities")
+
+    def _start(self, name: str, attrs: Dict[str, str]):
+        self._depth += 1
+        local = name.rpartition(' ')[2]
+        if self._entry_depth is None:
+            if local in ENTRY_ELEMENTS and not self.done:
+                self._entry_depth = self._depth
+                self._entry = {}
+            return
+        if self._field is not None or self._depth != self._entry_depth + 1:
+            return
+
+        field_name = FIELD_ELEMENTS.get(local)
+        if field_name is None or field_name in self._entry:
+            return
+        if field_name == 'link' and 'href' in attrs:
+            # Atom: the link is an attribute; prefer the alternate (article) link
+            if attrs.get('rel', 'alternate') == 'alternate':
+                self._entry['link'] = attrs['href'][:FIELD_CHARS]
+            return
+        if field_name == 'guid' and attrs.get('isPermaLink') == 'false':
+            return
+        self._field = field_name
+        self._field_depth = self._depth
+        limit = self.summary_chars if field_name in ('summary', 'content') else FIELD_CHARS
+        self._collector = _TextCollector(limit) if field_name in _TEXT_FIELDS else []
+
+    def _text(self, data: str):
+        if self._field is None:
+            return
+        if isinstance(self._collector, _TextCollector):
+            self._collector.add(data)
+        elif sum(map(len, self._collector)) < FIELD_CHARS:
+            self._collector.append(data)
+
+    def _end(self, name: str):
+        if self._field is not None and self._depth == self._field_depth:
+            if isinstance(self._collector, _TextCollector):
+                value = self._collector.text()
+            else:
+                value = "".join(self._collector).strip()[:FIELD_CHARS]
+            self._entry[self._field] = value
+            self._field = self._collector = self._field_depth = None
+        elif self._depth == self._entry_depth:
+            self.articles.append(self._article(self._entry))
+            self._entry_depth = None
+            self._entry = {}
+        self._depth -= 1
+
+    def _article(self, entry: Dict) -> Dict:
+        """Article dict in the shape data.ai_news produces"""
+        published = parse_date(entry.get('published', '')) or parse_date(entry.get('updated', ''))
+        return {
+            'title': entry.get('title') or 'No Title',
+            'link': entry.get('link') or entry.get('guid') or '#',
+            'summary': entry.get('summary') or entry.get('content') or 'No summary available',
+            'published': published,
+            'source': self.source['name'],
+            'category': self.source['category'],
+            'icon': self.source['icon'],
+        }
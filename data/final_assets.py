@@ -2,6 +2,7 @@
 AI Nexus - Curated Technical Assets
 100% Manual Curation - No Dummy Data
 """
+from data.content_registry import ContentCatalog, register_catalog
 
 AI_TOOLS_DATABASE = [
     # Code Generation & Assistance
@@ -92,16 +93,22 @@ AI_TOOLS_DATABASE = [
     {"id": "groq", "name": "Groq", "category": "productivity", "icon": "🚀", "description": "Ultra-fast LLM inference with specialized hardware.", "rating": 4.7, "pricing": "Freemium", "pricing_details": "Free tier, pay-as-you-go", "features": ["Fast inference", "Low latency", "Llama models"], "integrations": ["OpenAI SDK compatible"], "best_for": ["Speed-critical apps"], "url": "https://groq.com", "is_featured": True},
 ]
 
+TOOLS_CATALOG = register_catalog('tools', ContentCatalog(AI_TOOLS_DATABASE, facets={
+    'category': ('category', True),
+    'pricing': ('pricing', True),
+    'featured': ('is_featured', False),
+}))
+
 def get_all_tools():
     return AI_TOOLS_DATABASE
 
 def get_tools_by_category(category: str):
     if not category or category.lower() == 'all':
         return AI_TOOLS_DATABASE
-    return [t for t in AI_TOOLS_DATABASE if t.get("category", "").lower() == category.lower()]
+    return TOOLS_CATALOG.lookup('category', category)
 
 def get_featured_tools():
-    return [t for t in AI_TOOLS_DATABASE if t.get("is_featured", False)]
+    return TOOLS_CATALOG.lookup('featured', True)
 
 def search_tools(query: str):
     if not query: return []
@@ -109,7 +116,4 @@ def search_tools(query: str):
     return [t for t in AI_TOOLS_DATABASE if query in t.get("name", "").lower() or query in t.get("description", "").lower()]
 
 def get_tool_by_id(tool_id: str):
-    for tool in AI_TOOLS_DATABASE:
-        if tool.get("id") == tool_id:
-            return tool
-    return None
+    return TOOLS_CATALOG.get(tool_id)
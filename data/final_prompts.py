@@ -2,6 +2,7 @@
 AI Nexus - Curated Prompt Engineering Assets
 100% Manual Curation - No Dummy Data
 """
+from data.content_registry import ContentCatalog, register_catalog
 
 PROMPTS_DATABASE = [
     # Coding & Development
@@ -749,17 +750,23 @@ PROMPTS_DATABASE = [
     }
 ]
 
+PROMPTS_CATALOG = register_catalog('prompts', ContentCatalog(PROMPTS_DATABASE, facets={
+    'category': ('category', True),
+    'difficulty': ('difficulty', False),
+    'tag': ('tags', True),
+}))
+
 def get_all_prompts():
     return PROMPTS_DATABASE
 
 def get_prompts_by_category(category: str):
     if not category or category.lower() == 'all':
         return PROMPTS_DATABASE
-    return [p for p in PROMPTS_DATABASE if p.get("category", "").lower() == category.lower()]
+    return PROMPTS_CATALOG.lookup('category', category)
 
 def get_prompts_by_difficulty(difficulty: str):
     if not difficulty: return []
-    return [p for p in PROMPTS_DATABASE if p.get("difficulty") == difficulty]
+    return PROMPTS_CATALOG.lookup('difficulty', difficulty)
 
 def search_prompts(query: str):
     if not query: return []
@@ -767,10 +774,7 @@ def search_prompts(query: str):
     return [p for p in PROMPTS_DATABASE if query in p.get("title", "").lower() or query in p.get("prompt", "").lower()]
 
 def get_popular_prompts(limit: int = 10):
-    return sorted(PROMPTS_DATABASE, key=lambda x: x.get("uses", 0), reverse=True)[:limit]
+    return PROMPTS_CATALOG.ranked("uses")[:limit]
 
 def get_prompt_by_id(prompt_id: str):
-    for p in PROMPTS_DATABASE:
-        if p.get("id") == prompt_id:
-            return p
-    return None
+    return PROMPTS_CATALOG.get(prompt_id)
@@ -2,6 +2,7 @@
 AI Nexus - Curated Learning Path Assets
 100% Manual Curation - No Dummy Data
 """
+from data.content_registry import ContentCatalog, register_catalog
 
 REAL_TUTORIALS_DB = [
     # Quick Wins
@@ -414,22 +415,33 @@ REAL_TUTORIALS_DB = [
     }
 ]
 
+# Strict filter to ensure no ghost data leaks through - applied once when the indexes are built
+TUTORIALS_CATALOG = register_catalog('tutorials', ContentCatalog(REAL_TUTORIALS_DB, facets={
+    'category': ('category', True),
+    'role': ('role', False),
+    'difficulty': ('difficulty', False),
+    'tag': ('topics', True),
+}, include=lambda t: str(t.get('id', '')).startswith(('qw-', 'dd-', 'mt-'))))
+
 def get_all_tutorials():
-    # Strict filter to ensure no ghost data leaks through
-    return [t for t in REAL_TUTORIALS_DB if str(t.get('id', '')).startswith(('qw-', 'dd-', 'mt-'))]
+    return TUTORIALS_CATALOG.visible
+
+def get_tutorial_by_id(tutorial_id: str):
+    tutorial = TUTORIALS_CATALOG.get(tutorial_id)
+    return tutorial if tutorial is not None and TUTORIALS_CATALOG.include(tutorial) else None
 
 def get_tutorials_by_category(category: str):
     if not category or category.lower() == 'all':
-        return REAL_TUTORIALS_DB
-    return [t for t in REAL_TUTORIALS_DB if t.get("category", "").lower() == category.lower()]
+        return TUTORIALS_CATALOG.visible
+    return TUTORIALS_CATALOG.lookup('category', category)
 
 def get_tutorials_by_role(role: str):
     if not role: return []
-    return [t for t in REAL_TUTORIALS_DB if role in t.get("role", [])]
+    return TUTORIALS_CATALOG.lookup('role', role)
 
 def get_tutorials_by_difficulty(difficulty: str):
     if not difficulty: return []
-    return [t for t in REAL_TUTORIALS_DB if t.get("difficulty") == difficulty]
+    return TUTORIALS_CATALOG.lookup('difficulty', difficulty)
 
 def search_tutorials(query: str):
     if not query: return []
@@ -437,4 +449,4 @@ def search_tutorials(query: str):
     return [t for t in REAL_TUTORIALS_DB if query in t.get("title", "").lower() or query in t.get("description", "").lower()]
 
 def get_popular_tutorials(limit: int = 10):
-    return sorted(REAL_TUTORIALS_DB, key=lambda x: x.get("completions", 0), reverse=True)[:limit]
\ No newline at end of file
+    return TUTORIALS_CATALOG.ranked("completions")[:limit]
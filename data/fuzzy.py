@@ -0,0 +1,116 @@
+"""
+AI Nexus - Fuzzy Term Matching
+Trigram candidate index with Levenshtein scoring for typo-tolerant search
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from Levenshtein import distance as _levenshtein
+except ImportError:
+    logger.warning("python-Levenshtein not installed, using pure-Python edit distance")
+    _levenshtein = None
+
+GRAM_SIZE = 3
+
+# Tokens shorter than this are never corrected (too many near neighbours)
+MIN_FUZZY_LENGTH = 3
+
+# A correction scores this fraction of an exact match
+FUZZY_WEIGHT = 0.6
+
+
+def max_edits(term: str) -> int:
+    """Edit budget for a term: 1 for short words, 2 otherwise"""
+    return 1 if len(term) <= 4 else 2
+
+
+def _grams(term: str) -> List[str]:
+    padded = f"${term}$"
+    return [padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)]
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 once it is known to exceed limit"""
+    if _levenshtein is not None:
+        return _levenshtein(a, b, score_cutoff=limit)
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+class FuzzyIndex:
+    """
+    Typo-tolerant lookup over a search vocabulary.
+
+    Every term is indexed by its padded trigrams. A misspelling within k
+    edits still shares most of its trigrams with the intended word (each
+    edit destroys at most GRAM_SIZE of them), so candidates come from the
+    trigram postings and edit distance is only computed for that
+    shortlist - never for the whole vocabulary.
+
+    Usage:
+        fuzzy = FuzzyIndex({'pytest': 12, 'langchain': 7})
+        fuzzy.corrections("pytset")  # [('pytest', 2)]
+    """
+
+    def __init__(self, terms: Dict[str, int]):
+        # term -> document frequency, used to break ties between equally close terms
+        self.terms = dict(terms)
+        self._postings: Dict[str, List[str]] = {}
+        for term in self.terms:
+            for gram in set(_grams(term)):
+                self._postings.setdefault(gram, []).append(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def candidates(self, term: str, edits: int) -> List[str]:
+        """Terms sharing enough trigrams (and close enough in length) to be within edits"""
+        grams = set(_grams(term))
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        # q-gram lemma, but always require one shared gram so short words don't match everything
+        needed = max(1, len(grams) - edits * GRAM_SIZE)
+        return [
+            candidate for candidate, count in shared.items()
+            if count >= needed and abs(len(candidate) - len(term)) <= edits
+        ]
+
+    def corrections(self, term: str, limit: int = 3) -> List[Tuple[str, int]]:
+        """Closest vocabulary terms as (term, distance), nearest and most common first"""
+        if len(term) < MIN_FUZZY_LENGTH:
+            return []
+        edits = max_edits(term)
+        scored = []
+        for candidate in self.candidates(term, edits):
+            if candidate == term:
+                continue
+            distance = edit_distance(term, candidate, edits)
+            if distance <= edits:
+                scored.append((distance, -self.terms[candidate], candidate))
+        scored.sort()
+        return [(candidate, distance) for distance, _, candidate in scored[:limit]]
+
+    def suggest(self, tokens: Sequence[str], known: Iterable[str]) -> Optional[str]:
+        """Query with every unknown token replaced by its best correction, or None if nothing changed"""
+        known = set(known)
+        corrected, changed = [], False
+        for token in tokens:
+            if token not in known:
+                best = self.corrections(token, limit=1)
+                if best:
+                    token = best[0][0]
+                    changed = True
+            corrected.append(token)
+        return " ".join(corrected) if changed else None
@@ -0,0 +1,375 @@
+"""
+AI Nexus - News Ingestion Worker
+Refreshes the RSS feeds on a schedule in the background and persists the latest snapshot
+"""
+from config.settings import NEWS_REFRESH_INTERVAL_SECONDS, NEWS_FETCH_DEADLINE_SECONDS, NEWS_INGEST_IN_APP
+from data.ai_news import AI_NEWS_SOURCES, FeedResult, fetch_all_feeds, merge_articles
+from data.feed_health import FeedHealth
+from data.feed_parser import utc_now
+from data.trending import get_trending_engine
+from database.news_store import upsert_articles
+from utils.cache_namespaces import NEWS, get_cache_namespaces
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import atexit
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PATH = Path(__file__).parent / "news_snapshot.json"
+
+
+@dataclass(frozen=True)
+class NewsSnapshot:
+    """
+    Articles from the last refresh, plus each source's last outcome.
+
+    by_source keeps every source's most recent successful articles, so a
+    feed that fails one cycle keeps showing what it had. articles is the
+    merged, newest-first list that pages read; it is shared between
+    callers and must not be mutated. health is each source's breaker
+    state and stats (data/feed_health.py) as of this snapshot.
+    """
+    articles: List[Dict] = field(default_factory=list)
+    by_source: Dict[str, List[Dict]] = field(default_factory=dict)
+    sources: Dict[str, Dict] = field(default_factory=dict)
+    fetched_at: Optional[datetime] = None
+    health: Dict[str, Dict] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.fetched_at is None
+
+
+class NewsIngestor:
+    """
+    Background refresher for the news feeds.
+
+    A daemon thread fetches the sources that are due, upserts
+    the new articles into the articles table (database/news_store.py,
+    which is what the pages query), counts the ones not seen before into
+    the trending engine (data/trending.py) and swaps in a new NewsSnapshot
+    of per-source status, also written to snapshot_path. No visitor waits
+    for a fetch, except on the very first start, before anything exists.
+
+    Which sources are due is up to FeedHealth: each is polled at a rate
+    matching how often it publishes, and one that keeps failing has its
+    circuit opened and is left alone until a backoff runs out. The worker
+    sleeps until the next source is due, at most interval seconds.
+
+    Each source's ETag / Last-Modified is kept in the snapshot and sent
+    back on the next fetch, so an unchanged feed answers 304 and keeps its
+    previous articles without being downloaded or parsed; stats() reports
+    what each cycle cost in bytes and parse time.
+
+    When ingestion runs in a separate process (scripts/news_ingest.py),
+    the app reads the file that process writes: snapshot() reloads it
+    whenever its mtime moves.
+
+    Whenever the stored articles change (or a newer snapshot is picked
+    up) the news cache namespace is invalidated, so cached news search
+    results and cards are rebuilt while every other cache stays warm.
+
+    Usage:
+        ingestor = NewsIngestor()
+        ingestor.start()
+        ingestor.snapshot().articles
+        ingestor.refresh()  # fetch now and wait for the result
+        ingestor.close()
+    """
+
+    def __init__(self, interval: float = NEWS_REFRESH_INTERVAL_SECONDS,
+                 snapshot_path: Optional[Path] = SNAPSHOT_PATH,
+                 sources: Optional[List[Dict]] = None,
+                 fetch: Callable[..., List[FeedResult]] = fetch_all_feeds,
+                 health: Optional[FeedHealth] = None):
+        self.interval = interval
+        self.snapshot_path = snapshot_path
+        self.sources = AI_NEWS_SOURCES if sources is None else sources
+        self._fetch = fetch
+        self._thread = None
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._in_flight = False
+        self._force_next = False
+        self._completed = 0
+        self._snapshot_mtime = None
+        self._snapshot = self._load() or NewsSnapshot()
+        self.health = health or FeedHealth()
+        self.health.restore(self._snapshot.health)
+        self._metrics = {
+            'refreshes': 0,
+            'failed_sources': 0,
+            'last_refresh_ms': 0.0,
+            'last_bytes': 0,
+            'last_parse_ms': 0.0,
+            'last_not_modified': 0,
+            'bytes_downloaded': 0,
+            'parse_ms': 0.0,
+            'not_modified': 0,
+            'last_fetched_sources': 0,
+            'last_inserted': 0,
+            'last_duplicates': 0,
+            'inserted': 0,
+        }
+
+    # ==================== READ SIDE ====================
+
+    def snapshot(self) -> NewsSnapshot:
+        """The latest snapshot (picks up a newer file written by another process)"""
+        if self.snapshot_path is not None and not self.is_running():
+            mtime = self._file_mtime()
+            if mtime is not None and mtime != self._snapshot_mtime:
+                loaded = self._load()
+                if loaded is not None:
+                    with self._lock:
+                        self._snapshot = loaded
+                    get_cache_namespaces().invalidate(NEWS)
+        return self._snapshot
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until there is a snapshot - only waits on a first start with no file on disk"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._snapshot.is_empty, timeout)
+
+    def stats(self) -> Dict:
+        """Refresh counters and the age of the current snapshot"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            snapshot = self._snapshot
+        metrics.update({
+            'articles': len(snapshot.articles),
+            'fetched_at': snapshot.fetched_at,
+            'running': self.is_running(),
+        })
+        return metrics
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self):
+        """Start the background worker (idempotent); the first refresh runs immediately"""
+        with self._lock:
+            if self.is_running():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="news-ingest", daemon=True)
+            self._thread.start()
+
+    def is_running(self) -> bool:
+        """Check whether the background worker is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Stop the worker (an in-flight fetch is abandoned at its own deadline)"""
+        self._stop.set()
+        self._wake.set()
+        if self.is_running():
+            self._thread.join(timeout)
+
+    def refresh(self, timeout: Optional[float] = NEWS_FETCH_DEADLINE_SECONDS + 2) -> bool:
+        """Fetch every source now (except open circuits) instead of when due, and wait - False on timeout"""
+        if not self.is_running():
+            self.refresh_once()
+            return True
+        with self._cond:
+            # A fetch already under way may have started before the caller's request
+            target = self._completed + (2 if self._in_flight else 1)
+            self._force_next = True
+            self._wake.set()
+            return self._cond.wait_for(lambda: self._completed >= target, timeout)
+
+    # ==================== WORKER SIDE ====================
+
+    def _run(self):
+        """Worker loop: refresh due sources, then sleep until the next is due or refresh() is called"""
+        while not self._stop.is_set():
+            with self._lock:
+                forced, self._force_next = self._force_next, False
+            self.refresh_once(scheduled=not forced)
+            self._wake.wait(min(self.interval, max(1.0, self.health.next_due_in(self.sources))))
+            self._wake.clear()
+
+    def refresh_once(self, scheduled: bool = False):
+        """
+        Fetch once and publish the new snapshot: every source whose circuit
+        is not open, or with scheduled only the ones due by their polling
+        interval or backoff.
+        """
+        with self._lock:
+            self._in_flight = True
+        start = time.perf_counter()
+        fetched_at = utc_now()
+        due = self.health.due(self.sources, force=not scheduled)
+        if not due:
+            with self._cond:
+                self._in_flight = False
+                self._completed += 1
+                self._cond.notify_all()
+            return
+        try:
+            results = self._fetch(due, validators=self._validators())
+        except Exception as e:
+            logger.error(f"News refresh failed: {e}")
+            results = [FeedResult(source['name'], error=str(e)) for source in due]
+        for result in results:
+            self.health.record(result)
+
+        snapshot = self._merge(results, fetched_at)
+        if self.snapshot_path is not None:
+            self._save(snapshot)
+        stored = self._store([a for r in results if r.ok and not r.not_modified for a in r.articles])
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._cond:
+            self._snapshot = snapshot
+            self._in_flight = False
+            self._completed += 1
+            self._metrics['refreshes'] += 1
+            self._metrics['failed_sources'] += sum(1 for r in results if not r.ok)
+            self._metrics['last_fetched_sources'] = len(results)
+            self._metrics['last_refresh_ms'] = elapsed_ms
+            # What the cycle cost: an unchanged feed answers 304 and downloads/parses nothing
+            self._metrics['last_bytes'] = sum(r.bytes for r in results)
+            self._metrics['last_parse_ms'] = sum(r.parse_ms for r in results)
+            self._metrics['last_not_modified'] = sum(1 for r in results if r.not_modified)
+            self._metrics['bytes_downloaded'] += self._metrics['last_bytes']
+            self._metrics['parse_ms'] += self._metrics['last_parse_ms']
+            self._metrics['not_modified'] += self._metrics['last_not_modified']
+            self._metrics['last_inserted'] = stored.get('inserted', 0)
+            self._metrics['last_duplicates'] = stored.get('duplicates', 0)
+            self._metrics['inserted'] += self._metrics['last_inserted']
+            self._cond.notify_all()
+        if stored.get('inserted') or stored.get('updated'):
+            get_cache_namespaces().invalidate(NEWS)
+
+    def _store(self, articles: List[Dict]) -> Dict[str, int]:
+        """Upsert this cycle's fetched articles into the article store and count the new ones as trending"""
+        if not articles:
+            return {}
+        # Before the upsert: a first-use engine seeds itself from the stored articles
+        engine = get_trending_engine()
+        new_articles = []
+        try:
+            counts = upsert_articles(articles, inserted=new_articles)
+        except Exception as e:
+            logger.error(f"Error storing {len(articles)} articles: {e}")
+            return {}
+        if new_articles:
+            engine.add_articles(new_articles)
+            engine.save()
+        return counts
+
+    def _validators(self) -> Dict[str, Dict[str, str]]:
+        """ETag/Last-Modified per source - only for sources whose articles the snapshot still has"""
+        snapshot = self._snapshot
+        return {
+            name: {k: status[k] for k in ('etag', 'last_modified') if status.get(k)}
+            for name, status in snapshot.sources.items()
+            if name in snapshot.by_source
+        }
+
+    def _merge(self, results: List[FeedResult], fetched_at: datetime) -> NewsSnapshot:
+        """
+        New snapshot from this cycle's results, keeping the old articles of
+        sources that failed, were unchanged or were not due this cycle
+        """
+        previous = self._snapshot
+        fetched = {result.source for result in results}
+        by_source = {name: items for name, items in previous.by_source.items() if name not in fetched}
+        sources = {name: status for name, status in previous.sources.items() if name not in fetched}
+        for result in results:
+            validators = result.validators
+            if result.ok and not result.not_modified:
+                by_source[result.source] = result.articles
+            elif result.source in previous.by_source:
+                by_source[result.source] = previous.by_source[result.source]
+                if not result.ok:
+                    old = previous.sources.get(result.source, {})
+                    validators = {k: old[k] for k in ('etag', 'last_modified') if old.get(k)}
+            sources[result.source] = {
+                'ok': result.ok,
+                'error': result.error,
+                'not_modified': result.not_modified,
+                'elapsed_ms': round(result.elapsed * 1000, 1),
+                'bytes': result.bytes,
+                'parse_ms': round(result.parse_ms, 2),
+                'articles': len(by_source.get(result.source, [])),
+                **validators,
+            }
+        articles = merge_articles([FeedResult(name, items) for name, items in by_source.items()])
+        return NewsSnapshot(articles, by_source, sources, fetched_at, self.health.stats())
+
+    # ==================== PERSISTENCE ====================
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.snapshot_path).st_mtime
+        except OSError:
+            return None
+
+    def _save(self, snapshot: NewsSnapshot):
+        """Write the snapshot atomically (readers never see a half-written file)"""
+        payload = {
+            'fetched_at': snapshot.fetched_at.isoformat(),
+            'sources': snapshot.sources,
+            'health': snapshot.health,
+            'by_source': {
+                name: [dict(a, published=a['published'].isoformat() if a['published'] else None) for a in items]
+                for name, items in snapshot.by_source.items()
+            },
+        }
+        tmp_path = self.snapshot_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.snapshot_path)
+            self._snapshot_mtime = self._file_mtime()
+        except OSError as e:
+            logger.error(f"Error saving news snapshot: {e}")
+
+    def _load(self) -> Optional[NewsSnapshot]:
+        """Snapshot from snapshot_path, or None if there is none (or it is unreadable)"""
+        if self.snapshot_path is None:
+            return None
+        mtime = self._file_mtime()
+        if mtime is None:
+            return None
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                payload = json.load(f)
+            by_source = {
+                name: [dict(a, published=datetime.fromisoformat(a['published']) if a['published'] else None)
+                       for a in items]
+                for name, items in payload['by_source'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Error loading news snapshot: {e}")
+            return None
+        self._snapshot_mtime = mtime
+        articles = merge_articles([FeedResult(name, items) for name, items in by_source.items()])
+        return NewsSnapshot(articles, by_source, payload.get('sources', {}),
+                            datetime.fromisoformat(payload['fetched_at']), payload.get('health', {}))
+
+
+_ingestor = None
+_ingestor_lock = threading.Lock()
+
+
+def get_news_ingestor() -> NewsIngestor:
+    """Get the process-wide ingestor, starting its worker on first use (unless NEWS_INGEST_IN_APP is off)"""
+    global _ingestor
+    with _ingestor_lock:
+        if _ingestor is None:
+            _ingestor = NewsIngestor()
+            if NEWS_INGEST_IN_APP:
+                _ingestor.start()
+                atexit.register(_ingestor.close)
+        return _ingestor
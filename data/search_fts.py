@@ -0,0 +1,295 @@
+"""
+AI Nexus - SQLite FTS5 Search Index
+Persistent full-text index over the content catalogs, synced incrementally by content hash
+"""
+from data.search_index import FIELD_WEIGHTS, MIN_PREFIX_LENGTH, SearchHit, iter_documents, tokenize
+from data.content_registry import get_catalog
+from data.fuzzy import FuzzyIndex
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import bisect
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEARCH_DB_PATH = Path(__file__).parent / "search.db"
+
+# Column order of the FTS table; bm25() weights follow the same order
+FTS_COLUMNS = ('title', 'tags', 'description', 'body')
+
+# Catalog name for each document kind
+KIND_CATALOGS = {'prompt': 'prompts', 'tool': 'tools', 'tutorial': 'tutorials', 'hack': 'hacks'}
+
+# Markers wrapped around matches by snippet(); stripped out again to compute offsets
+_MARK_START, _MARK_END = "\x02", "\x03"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS search_docs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    UNIQUE (kind, doc_id)
+);
+CREATE TABLE IF NOT EXISTS search_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    {', '.join(FTS_COLUMNS)},
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3 4'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_vocab USING fts5vocab(search_fts, 'row');
+"""
+
+
+def fts5_available() -> bool:
+    """Whether this Python's SQLite was compiled with FTS5"""
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        conn.close()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _content_hash(fields: Dict[str, str]) -> str:
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _parse_marks(marked: str) -> Tuple[str, Tuple[Tuple[int, int], ...]]:
+    """Strip match markers and return (text, ((start, end), ...)) offsets into the clean text"""
+    text, offsets, start = [], [], None
+    length = 0
+    for ch in marked:
+        if ch == _MARK_START:
+            start = length
+        elif ch == _MARK_END:
+            if start is not None:
+                offsets.append((start, length))
+            start = None
+        else:
+            text.append(ch)
+            length += 1
+    return "".join(text), tuple(offsets)
+
+
+def _catalog_record(kind: str, doc_id: str) -> Optional[dict]:
+    """Current catalog record for an indexed document"""
+    return get_catalog(KIND_CATALOGS[kind]).get(doc_id)
+
+
+def _is_typing(query: str, tokens: List[str]) -> bool:
+    """Whether the last token is a word still being typed (matched as a prefix)"""
+    return bool(tokens) and len(tokens[-1]) >= MIN_PREFIX_LENGTH and not query[-1:].isspace()
+
+
+def build_match_query(query: str, extra_terms: Sequence[str] = ()) -> str:
+    """
+    Translate free text into an FTS5 MATCH expression.
+
+    Tokens are quoted (so FTS5 syntax in user input is inert) and OR'ed
+    for BM25-style ranking; the last one becomes a prefix query while the
+    word is still being typed. extra_terms (fuzzy corrections) are OR'ed in.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return ""
+    terms = [f'"{t}"' for t in tokens]
+    if _is_typing(query, tokens):
+        terms[-1] = f'"{tokens[-1]}"*'
+    terms.extend(f'"{t}"' for t in extra_terms)
+    return " OR ".join(terms)
+
+
+class FtsSearchIndex:
+    """
+    Search index stored in an FTS5 virtual table.
+
+    sync() hashes every document's fields and rewrites only the rows
+    whose hash changed (plus deletes for removed records). When the hash
+    of the whole corpus matches the stored one, nothing is re-tokenized,
+    so a cold start just opens the file. Results carry a snippet with
+    highlight offsets; records themselves are read back from the content
+    catalogs (or the resolve callable) rather than stored twice.
+
+    Usage:
+        index = FtsSearchIndex()
+        index.sync()
+        index.search("rag pinecone", limit=10)
+    """
+
+    def __init__(self, path: Path = SEARCH_DB_PATH, resolve: Optional[Callable[[str, str], Optional[dict]]] = None):
+        self.path = Path(path)
+        self.resolve = resolve or _catalog_record
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._vocabulary: List[str] = []
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self.last_sync = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'sync_ms': 0.0}
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (Streamlit sessions run in their own threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ==================== SYNC ====================
+
+    def sync(self, documents: Optional[Iterable[Tuple[str, dict, Dict[str, str]]]] = None) -> Dict:
+        """Bring the FTS table in line with the catalogs, touching only changed documents"""
+        start = time.perf_counter()
+        docs = {}
+        for kind, record, fields in (documents if documents is not None else iter_documents()):
+            docs[(kind, str(record.get('id')))] = (fields, _content_hash(fields))
+        corpus_hash = hashlib.sha1("".join(
+            f"{kind}:{doc_id}:{h}" for (kind, doc_id), (_, h) in sorted(docs.items())
+        ).encode("utf-8")).hexdigest()
+
+        stats = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        with self._sync_lock:
+            conn = self._connection()
+            stored_hash = conn.execute("SELECT value FROM search_meta WHERE key = 'corpus_hash'").fetchone()
+            if stored_hash and stored_hash[0] == corpus_hash:
+                stats['unchanged'] = len(docs)
+            else:
+                with conn:
+                    stored = {
+                        (kind, doc_id): (rowid, content_hash)
+                        for rowid, kind, doc_id, content_hash in conn.execute(
+                            "SELECT id, kind, doc_id, content_hash FROM search_docs")
+                    }
+                    for key, (fields, content_hash) in docs.items():
+                        existing = stored.pop(key, None)
+                        if existing and existing[1] == content_hash:
+                            stats['unchanged'] += 1
+                            continue
+                        values = [fields.get(column, "") for column in FTS_COLUMNS]
+                        if existing:
+                            rowid = existing[0]
+                            conn.execute("DELETE FROM search_fts WHERE rowid = ?", (rowid,))
+                            conn.execute("UPDATE search_docs SET content_hash = ? WHERE id = ?", (content_hash, rowid))
+                            stats['updated'] += 1
+                        else:
+                            rowid = conn.execute(
+                                "INSERT INTO search_docs (kind, doc_id, content_hash) VALUES (?, ?, ?)",
+                                (key[0], key[1], content_hash),
+                            ).lastrowid
+                            stats['inserted'] += 1
+                        conn.execute(
+                            f"INSERT INTO search_fts (rowid, {', '.join(FTS_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                            (rowid, *values),
+                        )
+                    for rowid, _ in stored.values():
+                        conn.execute("DELETE FROM search_fts WHERE rowid = ?", (rowid,))
+                        conn.execute("DELETE FROM search_docs WHERE id = ?", (rowid,))
+                        stats['deleted'] += 1
+                    conn.execute(
+                        "INSERT INTO search_meta (key, value) VALUES ('corpus_hash', ?) "
+                        "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                        (corpus_hash,),
+                    )
+        if stats['inserted'] or stats['updated'] or stats['deleted']:
+            self._fuzzy = None
+        stats['sync_ms'] = (time.perf_counter() - start) * 1000
+        self.last_sync = stats
+        logger.info(f"FTS search index synced: {stats}")
+        return stats
+
+    # ==================== QUERIES ====================
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Trigram index over the FTS vocabulary, loaded on the first fuzzy query"""
+        if self._fuzzy is None:
+            rows = self._connection().execute("SELECT term, doc FROM search_vocab").fetchall()
+            self._vocabulary = sorted(term for term, _ in rows)
+            self._fuzzy = FuzzyIndex(dict(rows))
+        return self._fuzzy
+
+    def _unknown_tokens(self, query: str) -> Tuple[List[str], List[str]]:
+        """(tokens, tokens not in the vocabulary) - a last word with completions isn't unknown"""
+        fuzzy = self.fuzzy
+        tokens = tokenize(query)
+        unknown = [t for t in tokens if t not in fuzzy.terms]
+        if unknown and unknown[-1] == tokens[-1] and _is_typing(query, tokens):
+            i = bisect.bisect_left(self._vocabulary, tokens[-1])
+            if i < len(self._vocabulary) and self._vocabulary[i].startswith(tokens[-1]):
+                unknown.pop()
+        return tokens, unknown
+
+    def suggest(self, query: str) -> Optional[str]:
+        """'Did you mean' rewrite of query with misspelled words corrected, or None"""
+        tokens, unknown = self._unknown_tokens(query)
+        return self.fuzzy.suggest(tokens, set(tokens) - set(unknown)) if tokens else None
+
+    def search(self, query: str, kinds: Optional[Sequence[str]] = None, limit: int = 50,
+               fuzzy: bool = False) -> List[SearchHit]:
+        """Top `limit` documents by FTS5 bm25(), with snippets and highlight offsets"""
+        corrections = []
+        if fuzzy:
+            for token in self._unknown_tokens(query)[1]:
+                corrections.extend(term for term, _ in self.fuzzy.corrections(token))
+        match = build_match_query(query, corrections)
+        if not match:
+            return []
+        weights = ", ".join(str(FIELD_WEIGHTS[column]) for column in FTS_COLUMNS)
+        sql = (
+            "SELECT d.kind, d.doc_id, -bm25(search_fts, " + weights + ") AS score, "
+            f"snippet(search_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', 16) "
+            "FROM search_fts JOIN search_docs d ON d.id = search_fts.rowid "
+            "WHERE search_fts MATCH ?"
+        )
+        params = [match]
+        if kinds is not None:
+            kinds = list(kinds)
+            sql += f" AND d.kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+
+        hits = []
+        for kind, doc_id, score, marked in self._connection().execute(sql, params):
+            record = self.resolve(kind, doc_id)
+            if record is None:
+                continue
+            snippet, highlights = _parse_marks(marked or "")
+            hits.append(SearchHit(kind, doc_id, score, record, snippet, highlights))
+        return hits
+
+    def grouped_hits(self, query: str, limit_per_kind: int = 50,
+                     fuzzy: bool = False) -> Dict[str, List[SearchHit]]:
+        """Ranked hits per kind, same shape as SearchIndex.grouped_hits"""
+        return {
+            kind: self.search(query, kinds=[kind], limit=limit_per_kind, fuzzy=fuzzy)
+            for kind in KIND_CATALOGS
+        }
+
+    def search_grouped(self, query: str, limit_per_kind: int = 50) -> Dict[str, List[dict]]:
+        """Ranked records per kind, same shape as SearchIndex.search_grouped"""
+        return {
+            kind: [hit.record for hit in hits]
+            for kind, hits in self.grouped_hits(query, limit_per_kind).items()
+        }
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM search_docs").fetchone()[0]
@@ -0,0 +1,309 @@
+"""
+AI Nexus - Global Search Index
+In-memory inverted index with BM25 ranking over prompts, tools, tutorials and hacks
+"""
+from data.fuzzy import FUZZY_WEIGHT, FuzzyIndex
+from utils.cache_namespaces import CATALOGS, get_cache_namespaces
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term-frequency weight per field - a hit in a title counts more than one in a body
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'description': 1.5,
+    'body': 1.0,
+}
+
+# Only tokens at least this long are expanded as prefixes of the word being typed,
+# and a completed word scores this fraction of an exact match
+MIN_PREFIX_LENGTH = 3
+PREFIX_WEIGHT = 0.7
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words dropped from queries and indexed text (also the base of data/trending.py's headline stopwords)
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have how i if in into is it its of on or so that the their
+then there these this to was we were what when which will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens without stopwords"""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result (snippet and highlight offsets come from the FTS5 backend)"""
+    kind: str
+    id: str
+    score: float
+    record: dict
+    snippet: str = ""
+    highlights: Tuple[Tuple[int, int], ...] = ()
+
+
+def highlight_markdown(text: str, highlights: Sequence[Tuple[int, int]]) -> str:
+    """Wrap each (start, end) highlight range of text in markdown bold"""
+    parts, last = [], 0
+    for start, end in highlights:
+        parts.append(text[last:start])
+        parts.append(f"**{text[start:end]}**")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _join(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value or "")
+
+
+def iter_documents() -> Iterable[Tuple[str, dict, Dict[str, str]]]:
+    """Yield (kind, record, fields) for every searchable record"""
+    from data.final_prompts import PROMPTS_DATABASE
+    from data.final_assets import AI_TOOLS_DATABASE
+    from data.final_tutorials import get_all_tutorials
+    from data.ai_hacks import AI_HACKS
+    from data.tutorial_content import TUTORIAL_CONTENT
+
+    for p in PROMPTS_DATABASE:
+        yield 'prompt', p, {
+            'title': p.get('title', ''),
+            'tags': _join(p.get('tags')) + " " + p.get('category', ''),
+            'description': "",
+            'body': p.get('prompt', ''),
+        }
+    for t in AI_TOOLS_DATABASE:
+        yield 'tool', t, {
+            'title': t.get('name', ''),
+            'tags': t.get('category', '') + " " + _join(t.get('best_for')),
+            'description': t.get('description', ''),
+            'body': _join(t.get('features')) + " " + _join(t.get('integrations')),
+        }
+    for t in get_all_tutorials():
+        content = TUTORIAL_CONTENT.get(t['id']) or {}
+        sections = " ".join(
+            f"{s.get('title', '')} {s.get('content', '')}" for s in content.get('sections', [])
+        )
+        yield 'tutorial', t, {
+            'title': t.get('title', ''),
+            'tags': _join(t.get('topics')) + " " + t.get('category', ''),
+            'description': t.get('description', ''),
+            'body': sections,
+        }
+    for h in AI_HACKS:
+        yield 'hack', h, {
+            'title': h.get('title', ''),
+            'tags': _join(h.get('tags')) + " " + h.get('tool', '') + " " + h.get('category', ''),
+            'description': h.get('description', ''),
+            'body': h.get('hack', ''),
+        }
+
+
+class SearchIndex:
+    """
+    Inverted index with BM25 scoring.
+
+    Each document is the weighted bag of terms from its fields (see
+    FIELD_WEIGHTS). Postings map a term to (doc, weighted tf) pairs, so a
+    query only touches the documents that contain its terms. The last
+    query token is also matched as a prefix, so results appear while a
+    word is still being typed.
+
+    Usage:
+        index = SearchIndex.build()
+        index.search("rag pinecone", limit=10)
+        index.search("prompt", kinds={'prompt'})
+    """
+
+    def __init__(self):
+        self.docs: List[Tuple[str, str, dict]] = []
+        self.doc_lengths: List[float] = []
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.idf: Dict[str, float] = {}
+        self.vocabulary: List[str] = []
+        self.avg_length = 0.0
+        self.build_ms = 0.0
+        self._fuzzy: Optional[FuzzyIndex] = None
+
+    @classmethod
+    def build(cls, documents: Optional[Iterable[Tuple[str, dict, Dict[str, str]]]] = None) -> 'SearchIndex':
+        """Index documents (default: all content catalogs)"""
+        start = time.perf_counter()
+        index = cls()
+        for kind, record, fields in (documents if documents is not None else iter_documents()):
+            index._add(kind, record, fields)
+        index._finalize()
+        index.build_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Search index built: {len(index.docs)} documents, "
+                    f"{len(index.postings)} terms in {index.build_ms:.1f} ms")
+        return index
+
+    def _add(self, kind: str, record: dict, fields: Dict[str, str]):
+        doc_id = len(self.docs)
+        self.docs.append((kind, record.get('id'), record))
+        weighted_tf: Dict[str, float] = {}
+        length = 0.0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for token in tokenize(text):
+                weighted_tf[token] = weighted_tf.get(token, 0.0) + weight
+                length += weight
+        self.doc_lengths.append(length)
+        for term, tf in weighted_tf.items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+
+    def _finalize(self):
+        n = len(self.docs)
+        self.avg_length = (sum(self.doc_lengths) / n) if n else 0.0
+        self.idf = {
+            term: math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for term, plist in self.postings.items()
+        }
+        self.vocabulary = sorted(self.postings)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with prefix"""
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Trigram index over the vocabulary, built on the first fuzzy query"""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex({term: len(plist) for term, plist in self.postings.items()})
+        return self._fuzzy
+
+    def query_terms(self, query: str, fuzzy: bool = False) -> Dict[str, float]:
+        """
+        Indexed query terms and their weights.
+
+        The last token is also expanded as a prefix unless the query ends
+        in whitespace (the word is finished); completions count a little
+        less than an exact match. With fuzzy, tokens that match nothing
+        are replaced by their closest vocabulary terms at FUZZY_WEIGHT.
+        """
+        tokens = tokenize(query)
+        terms = {t: 1.0 for t in tokens if t in self.postings}
+        completions = []
+        if tokens and len(tokens[-1]) >= MIN_PREFIX_LENGTH and not query[-1:].isspace():
+            completions = self._expand_prefix(tokens[-1])
+            for term in completions:
+                terms.setdefault(term, PREFIX_WEIGHT)
+        if fuzzy:
+            for token in self._unknown_tokens(tokens, completions):
+                for term, _ in self.fuzzy.corrections(token):
+                    terms.setdefault(term, FUZZY_WEIGHT)
+        return terms
+
+    def _unknown_tokens(self, tokens: List[str], completions: List[str]) -> List[str]:
+        """Tokens that are neither indexed nor (for the last one) a prefix being typed"""
+        unknown = [t for t in tokens if t not in self.postings]
+        if completions and unknown and unknown[-1] == tokens[-1]:
+            unknown.pop()
+        return unknown
+
+    def suggest(self, query: str) -> Optional[str]:
+        """'Did you mean' rewrite of query with misspelled words corrected, or None"""
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        known = {t for t in tokens if t in self.postings}
+        if len(tokens[-1]) >= MIN_PREFIX_LENGTH and self._expand_prefix(tokens[-1]):
+            known.add(tokens[-1])
+        return self.fuzzy.suggest(tokens, known)
+
+    def search(self, query: str, kinds: Optional[Sequence[str]] = None, limit: int = 50,
+               fuzzy: bool = False) -> List[SearchHit]:
+        """Top `limit` documents for query by BM25 score, optionally limited to some kinds"""
+        scores: Dict[int, float] = {}
+        avg_length = self.avg_length or 1.0
+        for term, weight in self.query_terms(query, fuzzy).items():
+            idf = self.idf[term] * weight
+            for doc_id, tf in self.postings[term]:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        if kinds is not None:
+            kinds = set(kinds)
+            scores = {d: s for d, s in scores.items() if self.docs[d][0] in kinds}
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchHit(self.docs[d][0], self.docs[d][1], score, self.docs[d][2]) for d, score in top]
+
+    def grouped_hits(self, query: str, limit_per_kind: int = 50,
+                     fuzzy: bool = False) -> Dict[str, List[SearchHit]]:
+        """Ranked hits per kind: {'prompt': [...], 'tool': [...], 'tutorial': [...], 'hack': [...]}"""
+        grouped = {'prompt': [], 'tool': [], 'tutorial': [], 'hack': []}
+        for hit in self.search(query, limit=len(self.docs), fuzzy=fuzzy):
+            bucket = grouped.setdefault(hit.kind, [])
+            if len(bucket) < limit_per_kind:
+                bucket.append(hit)
+        return grouped
+
+    def search_grouped(self, query: str, limit_per_kind: int = 50) -> Dict[str, List[dict]]:
+        """Ranked records per kind, in the same shape as grouped_hits"""
+        return {
+            kind: [hit.record for hit in hits]
+            for kind, hits in self.grouped_hits(query, limit_per_kind).items()
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _build_index():
+    """Build the index for the configured SEARCH_BACKEND"""
+    from config.settings import SEARCH_BACKEND
+    if SEARCH_BACKEND == "fts5":
+        from data.search_fts import FtsSearchIndex, fts5_available
+        if fts5_available():
+            index = FtsSearchIndex()
+            index.sync()
+            return index
+        logger.warning("SQLite was built without FTS5, falling back to the in-memory search index")
+    return SearchIndex.build()
+
+
+def get_search_index():
+    """Get the process-wide search index (SearchIndex or FtsSearchIndex), building it on first use"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = _build_index()
+    return _index
+
+
+def reset_search_index():
+    """Drop the shared index so the next search rebuilds it, and retire cached catalog results and cards (after content changes)"""
+    global _index
+    with _index_lock:
+        _index = None
+    get_cache_namespaces().invalidate(CATALOGS)
@@ -0,0 +1,283 @@
+"""
+AI Nexus - Search Service
+As-you-type search with an LRU result cache that narrows cached prefixes
+"""
+from data.search_index import FIELD_WEIGHTS, PREFIX_WEIGHT, get_search_index, iter_documents, tokenize
+from config.settings import SEARCH_CACHE_MAX_ENTRIES, NEWS_SEARCH_TTL_SECONDS
+from utils.cache_namespaces import CATALOGS, CacheNamespaces, get_cache_namespaces, namespace_of
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import bisect
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Searchable (record, fields) pairs for one scope
+DocumentLoader = Callable[[], Iterable[Tuple[dict, Dict[str, str]]]]
+
+# Ranked fallback for queries that match no record word-for-word
+Fallback = Callable[[str], List[dict]]
+
+
+def normalize_query(query: str) -> str:
+    """Cache key form of a query: lowercase tokens without stopwords, single-spaced"""
+    return " ".join(tokenize(query or ""))
+
+
+def _has_prefix(tokens: Tuple[str, ...], prefix: str) -> bool:
+    i = bisect.bisect_left(tokens, prefix)
+    return i < len(tokens) and tokens[i].startswith(prefix)
+
+
+class _Document:
+    """One record with its sorted token tuples, overall and per weighted field"""
+
+    __slots__ = ('record', 'tokens', 'fields')
+
+    def __init__(self, record: dict, fields: Dict[str, str]):
+        self.record = record
+        self.fields = [
+            (FIELD_WEIGHTS.get(name, 1.0), tuple(sorted(set(tokenize(text)))))
+            for name, text in fields.items() if text
+        ]
+        self.tokens = tuple(sorted({t for _, tokens in self.fields for t in tokens}))
+
+    def matches(self, terms: Sequence[str]) -> bool:
+        """Every query term starts some word of the record"""
+        return all(_has_prefix(self.tokens, term) for term in terms)
+
+    def score(self, terms: Sequence[str]) -> float:
+        """Best field weight per term; a prefix-only match counts PREFIX_WEIGHT of it"""
+        total = 0.0
+        for term in terms:
+            best = 0.0
+            for weight, tokens in self.fields:
+                i = bisect.bisect_left(tokens, term)
+                if i < len(tokens) and tokens[i].startswith(term):
+                    best = max(best, weight if tokens[i] == term else weight * PREFIX_WEIGHT)
+            total += best
+        return total
+
+
+class _Scope:
+    """A registered searchable collection and its loaded documents"""
+
+    __slots__ = ('loader', 'fallback', 'ttl', 'namespace', 'documents', 'loaded_at', 'loaded_version', 'generation')
+
+    def __init__(self, loader: DocumentLoader, fallback: Optional[Fallback], ttl: Optional[float], namespace: str):
+        self.loader = loader
+        self.fallback = fallback
+        self.ttl = ttl
+        self.namespace = namespace
+        self.documents: Optional[List[_Document]] = None
+        self.loaded_at = 0.0
+        self.loaded_version = None
+        self.generation = 0
+
+
+class SearchService:
+    """
+    Cached search for the page search boxes and the global search.
+
+    Results are cached per (scope, normalized query) in a bounded LRU.
+    Page scopes match as-you-type: every word of the query must start a
+    word of the record. Under that rule, typing more characters (or
+    another word) can only remove matches, so when a query extends a
+    cached one the service re-checks just the cached candidates instead
+    of the whole scope. Queries matching nothing word-for-word go to the
+    scope's fallback (the ranked, typo-tolerant search index).
+
+    Each scope belongs to a cache namespace (utils/cache_namespaces.py):
+    when that namespace is invalidated the scope reloads its documents
+    and its cached results stop matching, and lookups are counted
+    against it.
+
+    Usage:
+        service = get_search_service()
+        service.search('prompt', "sql opt")
+        service.search_grouped("langchain agents")  # global search
+        service.stats()['hit_rate']
+    """
+
+    def __init__(self, max_entries: int = SEARCH_CACHE_MAX_ENTRIES, namespaces: Optional[CacheNamespaces] = None):
+        self.max_entries = max_entries
+        self.namespaces = namespaces or get_cache_namespaces()
+        self._scopes: Dict[str, _Scope] = {}
+        # (scope, generation, normalized query) -> (candidate positions, records)
+        self._entries = OrderedDict()
+        self._global_generation = 0
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'narrowed': 0, 'misses': 0, 'fallbacks': 0, 'evictions': 0, 'invalidations': 0}
+
+    def register(self, scope: str, loader: DocumentLoader, fallback: Optional[Fallback] = None,
+                 ttl: Optional[float] = None):
+        """Add a scope; ttl reloads its documents (and drops its cached results) periodically"""
+        with self._lock:
+            self._scopes[scope] = _Scope(loader, fallback, ttl, namespace_of(scope))
+
+    # ==================== QUERIES ====================
+
+    def search(self, scope: str, query: str) -> List[dict]:
+        """Ranked records of one scope matching query"""
+        key_query = normalize_query(query)
+        if not key_query:
+            return []
+        terms = key_query.split(" ")
+        state = self._scopes[scope]
+        documents, generation = self._documents(state)
+
+        with self._lock:
+            entry = self._entries.get((scope, generation, key_query))
+            if entry is not None:
+                self._entries.move_to_end((scope, generation, key_query))
+                self._metrics['hits'] += 1
+        if entry is not None:
+            self.namespaces.record(state.namespace, hits=1)
+            return entry[1]
+        with self._lock:
+            # Longest cached query this one extends
+            base = None
+            for end in range(len(key_query) - 1, 0, -1):
+                base = self._entries.get((scope, generation, key_query[:end]))
+                if base is not None:
+                    break
+            self._metrics['narrowed' if base is not None else 'misses'] += 1
+        # A narrowed lookup still avoided scanning the scope, so it counts as a hit
+        self.namespaces.record(state.namespace, hits=int(base is not None), misses=int(base is None))
+
+        candidates = base[0] if base is not None else range(len(documents))
+        matched = [i for i in candidates if documents[i].matches(terms)]
+        matched.sort(key=lambda i: documents[i].score(terms), reverse=True)
+        if matched or state.fallback is None:
+            records = [documents[i].record for i in matched]
+        else:
+            records = state.fallback(query)
+            with self._lock:
+                self._metrics['fallbacks'] += 1
+        self._store((scope, generation, key_query), (tuple(matched), records))
+        return records
+
+    def search_grouped(self, query: str, limit_per_kind: int = 50) -> Dict:
+        """
+        Global search hits per kind (see SearchIndex.grouped_hits), cached per
+        normalized query. The ranked index is used as-is, so there is no
+        narrowing here - only repeated queries are served from cache.
+        """
+        # A trailing space changes prefix matching in the index, so it is part of the key
+        key_query = normalize_query(query) + (" " if query[-1:].isspace() else "")
+        generation = (self._global_generation, self.namespaces.version(CATALOGS))
+        key = ('global', generation, key_query, limit_per_kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._metrics['hits'] += 1
+            else:
+                self._metrics['misses'] += 1
+        self.namespaces.record(CATALOGS, hits=int(entry is not None), misses=int(entry is None))
+        if entry is not None:
+            return entry
+        grouped = get_search_index().grouped_hits(query, limit_per_kind, fuzzy=True)
+        self._store(key, grouped)
+        return grouped
+
+    # ==================== MAINTENANCE ====================
+
+    def invalidate(self, scope: Optional[str] = None):
+        """Reload one scope (or every scope and the global results) on next use"""
+        with self._lock:
+            for name, state in self._scopes.items():
+                if scope is None or name == scope:
+                    state.documents = None
+                    state.generation += 1
+            if scope is None:
+                self._global_generation += 1
+            self._metrics['invalidations'] += 1
+
+    def stats(self) -> Dict:
+        """Hit/narrow/miss counters and cache size"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['entries'] = len(self._entries)
+        lookups = metrics['hits'] + metrics['narrowed'] + metrics['misses']
+        metrics['lookups'] = lookups
+        metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        metrics['narrow_rate'] = metrics['narrowed'] / lookups if lookups else 0.0
+        return metrics
+
+    # ==================== INTERNALS ====================
+
+    def _documents(self, state: _Scope) -> Tuple[List[_Document], int]:
+        """A scope's documents (loading or reloading them if needed) and their generation"""
+        namespace_version = self.namespaces.version(state.namespace)
+        with self._lock:
+            documents, generation = state.documents, state.generation
+            expired = ((state.ttl is not None and time.monotonic() - state.loaded_at >= state.ttl)
+                       or state.loaded_version != namespace_version)
+            if documents is not None and not expired:
+                return documents, generation
+            if expired and documents is not None:
+                state.generation += 1
+                generation = state.generation
+
+        # Tokenize outside the lock; a concurrent loader doing the same work is harmless
+        documents = [_Document(record, fields) for record, fields in state.loader()]
+        with self._lock:
+            if state.generation == generation:
+                state.documents = documents
+                state.loaded_at = time.monotonic()
+                state.loaded_version = namespace_version
+        return documents, generation
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0][0])
+                self._metrics['evictions'] += 1
+        for scope in evicted:
+            self.namespaces.record(namespace_of(scope), evictions=1)
+
+
+def _catalog_loader(kind: str) -> DocumentLoader:
+    def load():
+        return [(record, fields) for k, record, fields in iter_documents() if k == kind]
+    return load
+
+
+def _index_fallback(kind: str) -> Fallback:
+    def fallback(query: str) -> List[dict]:
+        return [hit.record for hit in get_search_index().search(query, kinds=[kind], limit=200, fuzzy=True)]
+    return fallback
+
+
+def _news_documents():
+    from data.ai_news import get_all_news
+    return [
+        (article, {
+            'title': article.get('title', ''),
+            'tags': f"{article.get('source', '')} {article.get('category', '')}",
+            'description': article.get('summary', ''),
+        })
+        for article in get_all_news()
+    ]
+
+
+_service: Optional[SearchService] = None
+_service_lock = threading.Lock()
+
+
+def get_search_service() -> SearchService:
+    """Get the process-wide search service with the prompt, tool, tutorial, hack and news scopes"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SearchService()
+            for kind in ('prompt', 'tool', 'tutorial', 'hack'):
+                _service.register(kind, _catalog_loader(kind), fallback=_index_fallback(kind))
+            _service.register('news', _news_documents, ttl=NEWS_SEARCH_TTL_SECONDS)
+        return _service
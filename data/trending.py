@@ -0,0 +1,246 @@
+"""
+AI Nexus - Trending Topics Engine
+Time-decayed term and bigram counts over news headlines, updated as articles are ingested
+"""
+from config.settings import NEWS_TRENDING_HALF_LIFE_HOURS, NEWS_TRENDING_MAX_TERMS, NEWS_TRENDING_CANDIDATES
+from data.search_index import STOPWORDS
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+STATE_PATH = Path(__file__).parent / "news_trending.json"
+
+# Headline filler on top of the search stopwords
+HEADLINE_STOPWORDS = STOPWORDS | frozenset("""
+about after all also amid back been being can could did does doing don get gets got had he her here his
+just like may might more most much must new news no not now off one only other our out over says said
+she should some such than them they those through too two up us very via vs was way week why would year
+""".split())
+
+# Words keep inner '-', '.', '+' and '#' so "gpt-4.5", "c++" and "c#" stay one token
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+# Rebase the stored weights before exp() gets anywhere near float overflow
+_MAX_EXPONENT = 50.0
+
+# A bigram this close to one of its words' weight replaces that word in the top list
+_BIGRAM_SUBSUMES = 0.8
+
+
+def headline_terms(title: str) -> List[str]:
+    """
+    Unigrams and adjacent-word bigrams of a headline, stopwords removed.
+    Short words only count inside bigrams ("AI agents", "Claude 3"), as
+    words they are noise.
+    """
+    words = _TOKEN_PATTERN.findall(title.lower())
+    unigrams = [w for w in words
+                if w not in HEADLINE_STOPWORDS and (len(w) > 2 or (len(w) > 1 and any(c.isdigit() for c in w)))]
+    bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])
+               if a not in HEADLINE_STOPWORDS and b not in HEADLINE_STOPWORDS]
+    return unigrams + bigrams
+
+
+class TrendingEngine:
+    """
+    Exponentially decayed term counts with an always-current top list.
+
+    Uses forward decay: an occurrence at time t adds exp(rate * (t - base))
+    instead of 1, so old weights never need touching as time passes - every
+    weight decays by the same factor, which changes no ranking. Weights
+    therefore only grow, and a bounded min-heap of the NEWS_TRENDING_CANDIDATES
+    heaviest terms stays exact with one comparison per update (entries of
+    terms already in it are refreshed lazily, when they reach the root);
+    top(k) reads the candidates without touching the other counters. When the exponent grows large everything is rebased,
+    and past max_terms the lightest terms are dropped (compaction).
+
+    Usage:
+        engine = TrendingEngine()
+        engine.add_articles(new_articles)
+        engine.top(10)  # [('open source', 3.7), ...]
+        engine.save()
+    """
+
+    def __init__(self, half_life_hours: float = NEWS_TRENDING_HALF_LIFE_HOURS,
+                 max_terms: int = NEWS_TRENDING_MAX_TERMS,
+                 candidates: int = NEWS_TRENDING_CANDIDATES,
+                 path: Optional[Path] = STATE_PATH):
+        self.rate = math.log(2) / (half_life_hours * 3600)
+        self.max_terms = max_terms
+        self.candidates = candidates
+        self.path = path
+        self._lock = threading.Lock()
+        self._weights: Dict[str, float] = {}
+        self._base = time.time()
+        self._heap: List[Tuple[float, str]] = []
+        self._in_heap: Dict[str, float] = {}
+        self._mtime = None
+        self.articles = 0
+
+    # ==================== UPDATES ====================
+
+    def add(self, title: str, when: Optional[datetime] = None):
+        """Count one headline published at when (default now; naive datetimes are UTC, as stored)"""
+        if when is None:
+            timestamp = time.time()
+        else:
+            timestamp = (when.replace(tzinfo=timezone.utc) if when.tzinfo is None else when).timestamp()
+        with self._lock:
+            exponent = self.rate * (timestamp - self._base)
+            if exponent > _MAX_EXPONENT:
+                self._rebase(timestamp)
+                exponent = 0.0
+            increment = math.exp(exponent)
+            for term in set(headline_terms(title)):
+                weight = self._weights.get(term, 0.0) + increment
+                self._weights[term] = weight
+                self._offer(term, weight)
+            self.articles += 1
+            if len(self._weights) > self.max_terms:
+                self._compact()
+
+    def add_articles(self, articles: Iterable[Dict]):
+        """Count article dicts by title and published time"""
+        for article in articles:
+            self.add(article.get('title', ''), article.get('published'))
+
+    def _offer(self, term: str, weight: float):
+        """Keep the candidate heap equal to the heaviest terms after term grew to weight"""
+        if term in self._in_heap:
+            # Its heap entry goes stale (too low) and is fixed up only if it reaches the root
+            self._in_heap[term] = weight
+            return
+        while len(self._heap) >= self.candidates and weight > self._heap[0][0]:
+            stored, root = self._heap[0]
+            current = self._in_heap[root]
+            if current > stored:
+                heapq.heapreplace(self._heap, (current, root))
+                continue
+            heapq.heapreplace(self._heap, (weight, term))
+            del self._in_heap[root]
+            self._in_heap[term] = weight
+            return
+        if len(self._heap) < self.candidates:
+            heapq.heappush(self._heap, (weight, term))
+            self._in_heap[term] = weight
+
+    def _rebase(self, timestamp: float):
+        """Move the decay origin to timestamp, scaling every weight down to match"""
+        factor = math.exp(-self.rate * (timestamp - self._base))
+        self._base = timestamp
+        self._weights = {t: w * factor for t, w in self._weights.items() if w * factor > 1e-9}
+        self._heap = [(w, t) for t, w in ((t, self._weights.get(t)) for t in self._in_heap) if w is not None]
+        heapq.heapify(self._heap)
+        self._in_heap = {t: w for w, t in self._heap}
+
+    def _compact(self):
+        """Drop the lightest terms down to 90% of max_terms (candidates are always kept)"""
+        excess = len(self._weights) - int(self.max_terms * 0.9)
+        droppable = ((w, t) for t, w in self._weights.items() if t not in self._in_heap)
+        for _, term in heapq.nsmallest(excess, droppable):
+            del self._weights[term]
+
+    # ==================== READS ====================
+
+    def top(self, k: int = 10, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        The k heaviest terms with their decayed weight as of now (roughly
+        "occurrences in the last half-life"). A bigram that carries most of
+        a word's weight replaces the word, so "open source" is listed
+        instead of "open" and "source".
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            ranked = sorted(((w, t) for t, w in self._in_heap.items()), reverse=True)
+            decay = math.exp(-self.rate * (now - self._base))
+
+        weights = dict((t, w) for w, t in ranked)
+        subsumed = set()
+        for weight, term in ranked:
+            if " " in term:
+                for word in term.split(" "):
+                    if weight >= _BIGRAM_SUBSUMES * weights.get(word, math.inf):
+                        subsumed.add(word)
+        return [(term, weight * decay) for weight, term in ranked if term not in subsumed][:k]
+
+    def __len__(self):
+        return len(self._weights)
+
+    # ==================== PERSISTENCE ====================
+
+    def save(self):
+        """Write the counters atomically to path"""
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {'base': self._base, 'articles': self.articles, 'weights': self._weights}
+            tmp_path = self.path.with_suffix('.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, separators=(',', ':'))
+                os.replace(tmp_path, self.path)
+                self._mtime = os.stat(self.path).st_mtime
+            except OSError as e:
+                logger.error(f"Error saving trending state: {e}")
+
+    def load(self) -> bool:
+        """Replace the counters with those saved at path - False if there are none"""
+        if self.path is None:
+            return False
+        try:
+            mtime = os.stat(self.path).st_mtime
+            with open(self.path, encoding='utf-8') as f:
+                payload = json.load(f)
+            weights = {str(t): float(w) for t, w in payload['weights'].items()}
+            base = float(payload['base'])
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Error loading trending state: {e}")
+            return False
+
+        with self._lock:
+            self._weights, self._base, self._mtime = weights, base, mtime
+            self.articles = int(payload.get('articles', 0))
+            self._heap = heapq.nlargest(self.candidates, ((w, t) for t, w in weights.items()))
+            heapq.heapify(self._heap)
+            self._in_heap = {t: w for w, t in self._heap}
+        return True
+
+    def reload_if_changed(self):
+        """Pick up counters saved by another process (scripts/news_ingest.py)"""
+        if self.path is None:
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self.load()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_trending_engine() -> TrendingEngine:
+    """Get the process-wide engine: saved counters, or seeded from the article store on first use"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            engine = TrendingEngine()
+            if not engine.load():
+                from database.news_store import recent_articles
+                engine.add_articles(recent_articles())
+            _engine = engine
+        return _engine
@@ -0,0 +1,214 @@
+"""
+AI Nexus - Activity Event Writer
+Buffers activity events in memory and bulk-inserts them from a background thread
+"""
+from database.models import utc_now
+from database.operations import DatabaseOperations
+from config.settings import ACTIVITY_BATCH_SIZE, ACTIVITY_FLUSH_INTERVAL_SECONDS, ACTIVITY_QUEUE_MAX_SIZE
+from typing import Dict, Optional
+import atexit
+import queue
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _FlushRequest:
+    """Queue marker asking the worker to write everything queued before it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class ActivityWriter:
+    """
+    Asynchronous, batched writer for Activity rows.
+
+    enqueue() never blocks the caller: events go into a bounded queue and a
+    daemon thread drains it, writing a batch when batch_size events are
+    waiting or flush_interval seconds have passed. When the queue is full
+    new events are dropped and counted instead of stalling the page render.
+
+    Usage:
+        writer = ActivityWriter()
+        writer.start()
+        writer.enqueue(user_id, 'tool_viewed', 'cursor', {'name': 'Cursor'})
+        writer.close()  # flushes whatever is still queued
+    """
+
+    def __init__(self, batch_size: int = ACTIVITY_BATCH_SIZE,
+                 flush_interval: float = ACTIVITY_FLUSH_INTERVAL_SECONDS,
+                 max_queue_size: int = ACTIVITY_QUEUE_MAX_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._metrics = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'failed': 0,
+            'flushes': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+        }
+
+    # ==================== PRODUCER SIDE ====================
+
+    def enqueue(self, user_id: int, activity_type: str, item_id: str = None, details: dict = None) -> bool:
+        """Queue an activity event - returns False if it was dropped because the buffer is full"""
+        event = {
+            'user_id': user_id,
+            'activity_type': activity_type,
+            'item_id': item_id,
+            'details': details or {},
+            'created_at': utc_now(),
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._metrics['dropped'] += 1
+            logger.warning("Activity queue full, dropping event")
+            return False
+
+        with self._lock:
+            self._metrics['enqueued'] += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything queued so far is written - returns False on timeout"""
+        if not self.is_running():
+            self._drain_inline()
+            return True
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def stats(self) -> Dict:
+        """Queue depth and flush latency metrics"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        flushes = metrics.pop('flushes')
+        total_flush_ms = metrics.pop('total_flush_ms')
+        metrics.update({
+            'queue_depth': self._queue.qsize(),
+            'queue_capacity': self._queue.maxsize,
+            'flushes': flushes,
+            'avg_flush_ms': total_flush_ms / flushes if flushes else 0.0,
+            'running': self.is_running(),
+        })
+        return metrics
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self):
+        """Start the background worker (idempotent)"""
+        with self._lock:
+            if self.is_running():
+                return
+            self._thread = threading.Thread(target=self._run, name="activity-writer", daemon=True)
+            self._thread.start()
+
+    def is_running(self) -> bool:
+        """Check whether the background worker is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Stop the worker after writing everything still queued"""
+        if self.is_running():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        self._drain_inline()
+
+    # ==================== WORKER SIDE ====================
+
+    def _run(self):
+        """Worker loop: collect events into batches and write them"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            elif isinstance(item, _FlushRequest):
+                self._write(batch)
+                batch = []
+                item.done.set()
+                continue
+            elif item is _STOP:
+                self._write(batch)
+                return
+
+            # Batch is full or the flush interval elapsed
+            self._write(batch)
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+
+    def _drain_inline(self):
+        """Write anything left in the queue from the calling thread"""
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, dict):
+                batch.append(item)
+            elif isinstance(item, _FlushRequest):
+                item.done.set()
+        for start in range(0, len(batch), self.batch_size):
+            self._write(batch[start:start + self.batch_size])
+
+    def _write(self, batch):
+        """Bulk-insert one batch and record flush latency"""
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        try:
+            written = DatabaseOperations.bulk_track_activities(batch)
+            failed = 0
+        except Exception as e:
+            logger.error(f"Error writing activity batch of {len(batch)}: {e}")
+            written, failed = 0, len(batch)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._metrics['written'] += written
+            self._metrics['failed'] += failed
+            self._metrics['flushes'] += 1
+            self._metrics['last_flush_ms'] = elapsed_ms
+            self._metrics['max_flush_ms'] = max(self._metrics['max_flush_ms'], elapsed_ms)
+            self._metrics['total_flush_ms'] += elapsed_ms
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_activity_writer() -> ActivityWriter:
+    """Get the process-wide activity writer, starting it on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ActivityWriter()
+            _writer.start()
+            atexit.register(_writer.close)
+        return _writer
@@ -1,10 +1,13 @@
 """
 AI Nexus - Database Connection and Session Management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 from database.models import Base
+from database.migrate import migrate
+from config.settings import DB_ENGINE_PROFILES, DB_ENGINE_PROFILE
 import os
 import logging
 from pathlib import Path
@@ -18,16 +21,82 @@ DATABASE_DIR.mkdir(exist_ok=True)
 DATABASE_PATH = DATABASE_DIR / "ainexus.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-# Create engine with connection pooling settings
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
-    echo=False,  # Set to True for SQL debugging
-    pool_pre_ping=True,  # Verify connections before use
-)
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def get_engine_profile(name: str = None) -> dict:
+    """
+    Resolve an engine profile from config.settings.
+
+    Each key can be overridden with an AINEXUS_DB_<KEY> environment
+    variable; values are coerced to the type of the profile default.
+    """
+    name = name or DB_ENGINE_PROFILE
+    if name not in DB_ENGINE_PROFILES:
+        raise ValueError(f"Unknown database profile: {name}")
+
+    profile = dict(DB_ENGINE_PROFILES[name])
+    for key, default in profile.items():
+        raw = os.getenv(f"AINEXUS_DB_{key.upper()}")
+        if raw is None:
+            continue
+        if isinstance(default, bool):
+            profile[key] = raw.strip().lower() in ("1", "true", "yes", "on")
+        elif isinstance(default, int):
+            profile[key] = int(raw)
+        else:
+            profile[key] = raw.strip().upper()
+
+    if profile["journal_mode"] not in JOURNAL_MODES:
+        raise ValueError(f"Invalid journal_mode: {profile['journal_mode']}")
+    if profile["synchronous"] not in SYNCHRONOUS_MODES:
+        raise ValueError(f"Invalid synchronous mode: {profile['synchronous']}")
+    profile["name"] = name
+    return profile
+
+
+def create_sqlite_engine(url: str, profile: dict = None):
+    """
+    Create a file-backed SQLite engine tuned by an engine profile.
+
+    PRAGMAs are applied once per pooled DBAPI connection through a
+    connect listener. A QueuePool keeps connections (and their page
+    cache / mmap) alive between checkouts; pre-ping is left to the
+    profile since a local file has no server to drop the connection.
+    """
+    profile = profile or get_engine_profile()
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},  # Needed for SQLite
+        echo=False,  # Set to True for SQL debugging
+        poolclass=QueuePool,
+        pool_size=profile["pool_size"],
+        max_overflow=profile["max_overflow"],
+        pool_pre_ping=profile["pool_pre_ping"],
+    )
+
+    @event.listens_for(sqlite_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout={int(profile['busy_timeout_ms'])}")
+            cursor.execute(f"PRAGMA journal_mode={profile['journal_mode']}")
+            cursor.execute(f"PRAGMA synchronous={profile['synchronous']}")
+            cursor.execute(f"PRAGMA cache_size=-{int(profile['cache_size_kib'])}")
+            cursor.execute(f"PRAGMA mmap_size={int(profile['mmap_size_bytes'])}")
+        finally:
+            cursor.close()
+
+    return sqlite_engine
+
+
+# Create engine with the configured profile
+engine = create_sqlite_engine(DATABASE_URL)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps returned ORM objects readable after the session closes
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create scoped session for thread safety
 ScopedSession = scoped_session(SessionLocal)
@@ -46,6 +115,25 @@ def init_db():
         return False
 
 
+def upgrade_db(bind=None):
+    """
+    Bring an existing database up to the current schema.
+
+    Applies pending migrations from database/migrations in order (see
+    database.migrate). When the schema is already current this costs one
+    SELECT on schema_version, so it is safe to call on every startup.
+    """
+    bind = bind or engine
+    try:
+        applied = migrate(bind)
+        if applied:
+            logger.info(f"Applied migrations: {', '.join(m.name for m in applied)}")
+        return True
+    except Exception as e:
+        logger.error(f"Error upgrading database: {e}")
+        return False
+
+
 @contextmanager
 def get_db_context():
     """
@@ -83,10 +171,27 @@ def get_db_session():
     return SessionLocal()
 
 
+def get_pinned_db_session():
+    """
+    Get a session pinned to one pooled connection for its whole lifetime.
+
+    A regular session hands its connection back to the pool after every
+    commit; a pinned session keeps it checked out until close_db_session,
+    so a unit of work touches the pool once.
+    """
+    connection = SessionLocal.kw['bind'].connect()
+    db = SessionLocal(bind=connection)
+    db.info['pinned_connection'] = connection
+    return db
+
+
 def close_db_session(db):
     """Close database session (legacy - prefer get_db_context)"""
     if db:
         db.close()
+        connection = db.info.pop('pinned_connection', None)
+        if connection is not None:
+            connection.close()
 
 
 def reset_db():
@@ -114,6 +219,7 @@ def get_db_info():
         "path": str(DATABASE_PATH),
         "exists": check_db_exists(),
         "url": DATABASE_URL,
+        "profile": DB_ENGINE_PROFILE,
         "size_bytes": DATABASE_PATH.stat().st_size if check_db_exists() else 0
     }
 
@@ -0,0 +1,190 @@
+"""
+AI Nexus - Schema Migrations
+Versioned, ordered schema upgrades tracked in a schema_version table
+"""
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import importlib
+import pkgutil
+import re
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_PACKAGE = "database.migrations"
+_MODULE_PATTERN = re.compile(r"^m(\d{3,})_\w+$")
+
+# Engines already confirmed current in this process - makes repeat startup checks free
+_current_engines = set()
+_migrate_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One ordered migration script"""
+    version: int
+    name: str
+    description: str
+    upgrade: Callable[[Engine], None]
+
+
+def discover_migrations() -> List[Migration]:
+    """
+    Load every database/migrations/mNNN_*.py module, ordered by version.
+
+    Each module defines DESCRIPTION and upgrade(engine). Migrations get the
+    engine rather than a connection so they can split long work into
+    several short transactions.
+    """
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+    migrations = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        match = _MODULE_PATTERN.match(module_info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{MIGRATIONS_PACKAGE}.{module_info.name}")
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=module_info.name,
+            description=getattr(module, "DESCRIPTION", ""),
+            upgrade=module.upgrade,
+        ))
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions in {MIGRATIONS_PACKAGE}")
+    return migrations
+
+
+def latest_version() -> int:
+    """Highest migration version shipped with the code"""
+    migrations = discover_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def _ensure_version_table(engine: Engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_version ("
+            " version INTEGER PRIMARY KEY,"
+            " name VARCHAR(200) NOT NULL,"
+            " applied_at DATETIME NOT NULL,"
+            " duration_ms FLOAT)"
+        ))
+
+
+def current_version(engine: Engine) -> int:
+    """Highest applied migration version (0 for a database that has never been migrated)"""
+    if not inspect(engine).has_table("schema_version"):
+        return 0
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
+
+
+def applied_migrations(engine: Engine) -> List[Dict]:
+    """Rows from schema_version, oldest first"""
+    if not inspect(engine).has_table("schema_version"):
+        return []
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT version, name, applied_at, duration_ms FROM schema_version ORDER BY version"
+        )).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    """Migrations newer than the database's current version"""
+    version = current_version(engine)
+    return [m for m in discover_migrations() if m.version > version]
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """
+    Apply pending migrations in order, up to target (default: latest).
+
+    Each migration is recorded in schema_version as soon as it finishes,
+    so an interrupted upgrade resumes where it stopped. When the schema
+    is already current this is a single SELECT, and nothing at all on
+    later calls in the same process.
+    """
+    if target is None and engine in _current_engines:
+        return []
+
+    with _migrate_lock:
+        pending = [m for m in pending_migrations(engine) if target is None or m.version <= target]
+        if pending:
+            _ensure_version_table(engine)
+        for migration in pending:
+            logger.info(f"Applying migration {migration.name}: {migration.description}")
+            start = time.perf_counter()
+            migration.upgrade(engine)
+            duration_ms = (time.perf_counter() - start) * 1000
+            with engine.begin() as conn:
+                conn.execute(
+                    text("INSERT OR IGNORE INTO schema_version (version, name, applied_at, duration_ms) "
+                         "VALUES (:version, :name, CURRENT_TIMESTAMP, :duration_ms)"),
+                    {"version": migration.version, "name": migration.name, "duration_ms": duration_ms},
+                )
+        if target is None:
+            _current_engines.add(engine)
+        return pending
+
+
+# ==================== HELPERS FOR MIGRATION SCRIPTS ====================
+
+def create_index(engine: Engine, name: str, table: str, columns: List[str], unique: bool = False):
+    """
+    Build an index in its own short transaction.
+
+    Under WAL readers keep going while the index builds; only writers
+    wait, and only for this one statement.
+    """
+    if any(index["name"] == name for index in inspect(engine).get_indexes(table)):
+        return
+    unique_sql = "UNIQUE " if unique else ""
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+        ))
+
+
+def add_column(engine: Engine, table: str, column: str, ddl_type: str):
+    """Add a nullable column if it doesn't exist yet (fresh databases already have it)"""
+    if any(col["name"] == column for col in inspect(engine).get_columns(table)):
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def backfill_in_batches(engine: Engine, table: str, set_sql: str, where_sql: str = "1=1",
+                        batch_size: int = 5000, params: Optional[Dict] = None) -> int:
+    """
+    Run an UPDATE over a large table in rowid ranges, one commit per batch.
+
+    Each batch holds the write lock only briefly, so the table stays
+    readable (and writable between batches) during the backfill.
+    Returns the number of rows updated.
+    """
+    params = dict(params or {})
+    with engine.connect() as conn:
+        bounds = conn.execute(text(f"SELECT MIN(rowid), MAX(rowid) FROM {table}")).one()
+    if bounds[0] is None:
+        return 0
+
+    updated = 0
+    low, high = bounds
+    while low <= high:
+        with engine.begin() as conn:
+            result = conn.execute(
+                text(f"UPDATE {table} SET {set_sql} "
+                     f"WHERE rowid >= :_low AND rowid < :_high AND ({where_sql})"),
+                {**params, "_low": low, "_high": low + batch_size},
+            )
+            updated += result.rowcount
+        low += batch_size
+    return updated
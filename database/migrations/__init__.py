@@ -0,0 +1,7 @@
+"""
+AI Nexus - Migration Scripts
+
+Each mNNN_<name>.py module defines DESCRIPTION and upgrade(engine) and is
+applied in version order by database.migrate. Migrations must be safe to
+run against a database created by create_all from the current models.
+"""
@@ -0,0 +1,10 @@
+"""
+Create the tables defined in database.models that don't exist yet
+"""
+from database.models import Base
+
+DESCRIPTION = "Initial schema"
+
+
+def upgrade(engine):
+    Base.metadata.create_all(bind=engine)
@@ -0,0 +1,14 @@
+"""
+Compound indexes matching the DatabaseOperations query shapes
+"""
+from database.migrate import create_index
+
+DESCRIPTION = "Compound indexes for favorites, progress, activities and saved prompts"
+
+
+def upgrade(engine):
+    create_index(engine, "ix_favorites_user_created", "favorites", ["user_id", "created_at"])
+    create_index(engine, "ix_favorites_user_type_created", "favorites", ["user_id", "item_type", "created_at"])
+    create_index(engine, "ix_progress_user_completed", "progress", ["user_id", "completed", "tutorial_id"])
+    create_index(engine, "ix_activities_user_created", "activities", ["user_id", "created_at"])
+    create_index(engine, "ix_saved_prompts_user_created", "saved_prompts", ["user_id", "created_at"])
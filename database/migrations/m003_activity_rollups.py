@@ -0,0 +1,11 @@
+"""
+Daily activity rollups and retention watermarks
+"""
+from database.models import ActivityDailyRollup, RetentionState
+
+DESCRIPTION = "Daily per-user activity rollup table and retention_state watermarks"
+
+
+def upgrade(engine):
+    ActivityDailyRollup.__table__.create(bind=engine, checkfirst=True)
+    RetentionState.__table__.create(bind=engine, checkfirst=True)
@@ -0,0 +1,12 @@
+"""
+Persistent news articles with their search index
+"""
+from database.models import Article
+from database.news_store import create_article_search
+
+DESCRIPTION = "articles table (deduplicated news history) and its FTS5 search index"
+
+
+def upgrade(engine):
+    Article.__table__.create(bind=engine, checkfirst=True)
+    create_article_search(engine)
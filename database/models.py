@@ -2,7 +2,7 @@
 AI Nexus - Database Models
 SQLAlchemy models for data persistence
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Float, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, JSON, Text, Float, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import DeclarativeBase, relationship
 from datetime import datetime, timezone
 
@@ -47,6 +47,9 @@ class Favorite(Base):
     __tablename__ = 'favorites'
     __table_args__ = (
         UniqueConstraint('user_id', 'item_type', 'item_id', name='unique_user_favorite'),
+        # get_favorites: newest first, with and without an item_type filter
+        Index('ix_favorites_user_created', 'user_id', 'created_at'),
+        Index('ix_favorites_user_type_created', 'user_id', 'item_type', 'created_at'),
     )
     
     id = Column(Integer, primary_key=True)
@@ -64,6 +67,8 @@ class Progress(Base):
     __tablename__ = 'progress'
     __table_args__ = (
         UniqueConstraint('user_id', 'tutorial_id', name='unique_user_progress'),
+        # get_completed_tutorials: covering index, the table itself is never read
+        Index('ix_progress_user_completed', 'user_id', 'completed', 'tutorial_id'),
     )
     
     id = Column(Integer, primary_key=True)
@@ -81,6 +86,10 @@ class Progress(Base):
 class Activity(Base):
     """User activity tracking"""
     __tablename__ = 'activities'
+    __table_args__ = (
+        # get_recent_activities: SQLite walks this backwards for created_at DESC, no sort step
+        Index('ix_activities_user_created', 'user_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -97,6 +106,8 @@ class SavedPrompt(Base):
     __tablename__ = 'saved_prompts'
     __table_args__ = (
         UniqueConstraint('user_id', 'prompt_id', name='unique_user_prompt'),
+        # get_saved_prompts: newest first per user
+        Index('ix_saved_prompts_user_created', 'user_id', 'created_at'),
     )
     
     id = Column(Integer, primary_key=True)
@@ -141,3 +152,51 @@ class UserStats(Base):
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
     
     user = relationship("User", back_populates="stats")
+
+
+class ActivityDailyRollup(Base):
+    """Daily per-user, per-type activity counts rolled up from raw Activity rows"""
+    __tablename__ = 'activity_daily_rollups'
+    __table_args__ = (
+        # Upsert target for the rollup job; also serves the weekly chart (user_id, day range)
+        UniqueConstraint('user_id', 'day', 'activity_type', name='unique_user_day_type'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    day = Column(Date, nullable=False)
+    activity_type = Column(String(100), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class RetentionState(Base):
+    """Watermarks for incremental maintenance jobs"""
+    __tablename__ = 'retention_state'
+
+    name = Column(String(100), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
+
+
+class Article(Base):
+    """A news article ingested from an RSS source (see database/news_store.py)"""
+    __tablename__ = 'articles'
+    __table_args__ = (
+        # Newest-first listings, the timeframe filter and category pages
+        Index('ix_articles_published', 'published'),
+        Index('ix_articles_category_published', 'category', 'published'),
+        # Syndicated copies of a story share a content hash under different URLs
+        Index('ix_articles_content_hash', 'content_hash'),
+    )
+
+    url_hash = Column(String(40), primary_key=True)
+    content_hash = Column(String(40), nullable=False)
+    url = Column(Text, nullable=False)
+    title = Column(Text, nullable=False)
+    summary = Column(Text)
+    source = Column(String(200), nullable=False)
+    category = Column(String(100), nullable=False)
+    icon = Column(String(20))
+    published = Column(DateTime)
+    first_seen_at = Column(DateTime(timezone=True), default=utc_now)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
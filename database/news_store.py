@@ -0,0 +1,279 @@
+"""
+AI Nexus - News Article Store
+Deduplicated article history in the articles table, read back through indexed queries
+"""
+from database.db import SessionLocal
+from database.models import Article, utc_now
+from config.settings import NEWS_MAX_ARTICLES
+from sqlalchemy import or_, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import hashlib
+import html
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only identify the referrer, never the story
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'cmpid', 'ncid', 'ocid'})
+
+# Leading characters of the normalized summary that go into the content hash
+CONTENT_HASH_SUMMARY_CHARS = 160
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_ARTICLE_COLUMNS = (Article.url, Article.title, Article.summary, Article.published,
+                    Article.source, Article.category, Article.icon)
+
+# Engines whose articles_fts table has been confirmed to exist
+_fts_engines = set()
+
+
+def _bind(bind: Optional[Engine]) -> Engine:
+    return bind or SessionLocal.kw['bind']
+
+
+# ==================== NORMALIZATION ====================
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL: scheme, "www.", fragment, trailing
+    slash and tracking parameters dropped, remaining parameters sorted.
+    http/https and utm-tagged copies of a link all normalize the same.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def url_hash(url: str) -> str:
+    """Primary key of an article: SHA-1 of its normalized URL"""
+    return hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def _normalize_text(value: Optional[str]) -> str:
+    text_only = _TAG_PATTERN.sub(" ", html.unescape(value or ""))
+    return _NON_WORD_PATTERN.sub(" ", text_only.lower()).strip()
+
+
+def content_hash(title: str, summary: Optional[str]) -> str:
+    """
+    Fingerprint of the story itself: normalized title plus the start of the
+    normalized summary, so markup, case and punctuation differences between
+    syndicated copies don't matter.
+    """
+    fingerprint = f"{_normalize_text(title)}\n{_normalize_text(summary)[:CONTENT_HASH_SUMMARY_CHARS]}"
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+
+# ==================== WRITES ====================
+
+def upsert_articles(articles: Iterable[Dict], bind: Optional[Engine] = None,
+                    inserted: Optional[List[Dict]] = None) -> Dict[str, int]:
+    """
+    Store freshly fetched articles (data.ai_news article dicts).
+
+    A URL already stored is updated in place when its title, summary or
+    date changed (feeds do fix typos) and left alone otherwise. A new URL
+    whose content hash matches a story stored under another URL is a
+    syndicated copy and is skipped. Returns inserted / updated /
+    unchanged / duplicates counts; pass a list as inserted to also get
+    the article dicts that were new.
+    """
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0}
+    rows = {}
+    originals = {}
+    for article in articles:
+        link = article.get('link')
+        if not link or link == '#':
+            continue
+        row = {
+            'url_hash': url_hash(link),
+            'content_hash': content_hash(article.get('title', ''), article.get('summary')),
+            'url': link,
+            'title': article.get('title', ''),
+            'summary': article.get('summary'),
+            'published': article.get('published'),
+            'source': article.get('source', ''),
+            'category': article.get('category', ''),
+            'icon': article.get('icon'),
+        }
+        if row['url_hash'] in rows:
+            counts['duplicates'] += 1
+        else:
+            rows[row['url_hash']] = row
+            originals[row['url_hash']] = article
+    if not rows:
+        return counts
+
+    with _bind(bind).begin() as conn:
+        stored = {
+            r.url_hash: r for r in conn.execute(
+                select(Article.url_hash, Article.content_hash, Article.title, Article.summary, Article.published)
+                .where(Article.url_hash.in_(list(rows)))
+            )
+        }
+        content_owners = dict(conn.execute(
+            select(Article.content_hash, Article.url_hash)
+            .where(Article.content_hash.in_({row['content_hash'] for row in rows.values()}))
+        ).all())
+
+        to_write = []
+        for key, row in rows.items():
+            old = stored.get(key)
+            if old is not None:
+                if (old.title, old.summary, old.published) == (row['title'], row['summary'], row['published']):
+                    counts['unchanged'] += 1
+                    continue
+                counts['updated'] += 1
+            elif row['content_hash'] in content_owners:
+                counts['duplicates'] += 1
+                continue
+            else:
+                counts['inserted'] += 1
+                content_owners[row['content_hash']] = key
+                if inserted is not None:
+                    inserted.append(originals[key])
+            to_write.append(dict(row, first_seen_at=utc_now(), updated_at=utc_now()))
+
+        if to_write:
+            stmt = sqlite_insert(Article.__table__)
+            conn.execute(stmt.on_conflict_do_update(
+                index_elements=[Article.__table__.c.url_hash],
+                set_={column: getattr(stmt.excluded, column)
+                      for column in ('content_hash', 'title', 'summary', 'published', 'updated_at')},
+            ), to_write)
+    return counts
+
+
+# ==================== READS ====================
+
+def _to_dicts(rows) -> List[Dict]:
+    """Rows of _ARTICLE_COLUMNS as the article dicts the pages render"""
+    return [
+        {'title': r.title, 'link': r.url, 'summary': r.summary or '', 'published': r.published,
+         'source': r.source, 'category': r.category, 'icon': r.icon}
+        for r in rows
+    ]
+
+
+def _query(description: str, stmt, bind: Optional[Engine]) -> List[Dict]:
+    try:
+        with _bind(bind).connect() as conn:
+            return _to_dicts(conn.execute(stmt))
+    except Exception as e:
+        logger.error(f"Error loading {description}: {e}")
+        return []
+
+
+def recent_articles(limit: int = NEWS_MAX_ARTICLES, bind: Optional[Engine] = None) -> List[Dict]:
+    """Newest articles first (walks ix_articles_published backwards; undated ones last)"""
+    stmt = select(*_ARTICLE_COLUMNS).order_by(Article.published.desc()).limit(limit)
+    return _query("recent articles", stmt, bind)
+
+
+def articles_since(cutoff: datetime, limit: int = NEWS_MAX_ARTICLES, bind: Optional[Engine] = None) -> List[Dict]:
+    """Articles published after cutoff, newest first (range scan on ix_articles_published)"""
+    stmt = (select(*_ARTICLE_COLUMNS).where(Article.published > cutoff)
+            .order_by(Article.published.desc()).limit(limit))
+    return _query("articles by timeframe", stmt, bind)
+
+
+def articles_by_category(category: str, limit: int = NEWS_MAX_ARTICLES, bind: Optional[Engine] = None) -> List[Dict]:
+    """One category's articles, newest first (served by ix_articles_category_published)"""
+    stmt = (select(*_ARTICLE_COLUMNS).where(Article.category == category)
+            .order_by(Article.published.desc()).limit(limit))
+    return _query("articles by category", stmt, bind)
+
+
+def search_articles(query: str, limit: int = NEWS_MAX_ARTICLES, bind: Optional[Engine] = None) -> List[Dict]:
+    """
+    Articles matching every word of query (prefix match), best first.
+
+    Uses the articles_fts index when the database has it; SQLite builds
+    without FTS5 fall back to a LIKE scan.
+    """
+    tokens = _TOKEN_PATTERN.findall(query.lower())
+    if not tokens:
+        return []
+    bind = _bind(bind)
+    if _has_article_search(bind):
+        match = " ".join(f'"{token}"*' for token in tokens)
+        stmt = text(
+            "SELECT a.url, a.title, a.summary, a.published, a.source, a.category, a.icon "
+            "FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid "
+            "WHERE articles_fts MATCH :match ORDER BY bm25(articles_fts, 2.0, 1.0) LIMIT :limit"
+        ).columns(Article.url, Article.title, Article.summary, Article.published,
+                  Article.source, Article.category, Article.icon)
+        try:
+            with bind.connect() as conn:
+                return _to_dicts(conn.execute(stmt, {'match': match, 'limit': limit}))
+        except Exception as e:
+            logger.error(f"Error searching articles: {e}")
+            return []
+
+    conditions = [or_(Article.title.ilike(f"%{token}%"), Article.summary.ilike(f"%{token}%")) for token in tokens]
+    stmt = select(*_ARTICLE_COLUMNS).where(*conditions).order_by(Article.published.desc()).limit(limit)
+    return _query("article search", stmt, bind)
+
+
+# ==================== SEARCH INDEX ====================
+
+def create_article_search(bind: Optional[Engine] = None) -> bool:
+    """
+    Create the articles_fts FTS5 index plus the triggers that keep it in
+    step with articles, and index existing rows. Returns False (and leaves
+    search on the LIKE fallback) when SQLite lacks FTS5.
+    """
+    bind = _bind(bind)
+    statements = [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+        " title, summary, content='articles', content_rowid='rowid',"
+        " tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        "CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN"
+        " INSERT INTO articles_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary); END",
+        "CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN"
+        " INSERT INTO articles_fts(articles_fts, rowid, title, summary)"
+        " VALUES ('delete', old.rowid, old.title, old.summary); END",
+        "CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN"
+        " INSERT INTO articles_fts(articles_fts, rowid, title, summary)"
+        " VALUES ('delete', old.rowid, old.title, old.summary);"
+        " INSERT INTO articles_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary); END",
+        "INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')",
+    ]
+    try:
+        with bind.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    except Exception as e:
+        logger.warning(f"Article search index unavailable, falling back to LIKE: {e}")
+        return False
+    _fts_engines.add(bind)
+    return True
+
+
+def _has_article_search(bind: Engine) -> bool:
+    if bind in _fts_engines:
+        return True
+    with bind.connect() as conn:
+        exists = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        )).first() is not None
+    if exists:
+        _fts_engines.add(bind)
+    return exists
@@ -2,39 +2,125 @@
 AI Nexus - Database Operations
 CRUD operations for all models
 """
-from database.db import get_db_session, close_db_session
-from database.models import User, Favorite, Progress, Activity, SavedPrompt, Badge, UserStats
-from datetime import datetime
+from database.db import get_db_session, get_pinned_db_session, close_db_session
+from database.models import (
+    User, Favorite, Progress, Activity, SavedPrompt, Badge, UserStats, ActivityDailyRollup, RetentionState, utc_now,
+)
+from database.retention import ROLLUP_WATERMARK
+from sqlalchemy import bindparam, func, insert, literal, null, select, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from database.snapshot import UserSnapshot
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-thread unit-of-work state (Streamlit runs each session's script in its own thread)
+_uow_state = threading.local()
+
+
+@contextmanager
+def _session_scope():
+    """
+    Yield the session for a single operation.
+
+    Inside a unit of work the shared session is reused, otherwise a
+    short-lived session is opened for the call. Only the outermost
+    operation commits, so helpers like _update_stats join the caller's
+    transaction instead of committing on their own.
+    """
+    db = getattr(_uow_state, 'session', None)
+    owns_session = db is None
+    if owns_session:
+        db = get_db_session()
+        _uow_state.session = db
+        _uow_state.depth = 0
+
+    outermost = _uow_state.depth == 0
+    _uow_state.depth += 1
+    try:
+        yield db
+        if outermost:
+            db.commit()
+    except Exception:
+        if outermost:
+            db.rollback()
+        raise
+    finally:
+        _uow_state.depth -= 1
+        if owns_session:
+            _uow_state.session = None
+            close_db_session(db)
+
 
 class DatabaseOperations:
-    """Database operations wrapper"""
-    
+    """
+    Database operations wrapper.
+
+    Every operation can be called statically and gets its own session, or
+    inside a unit of work that shares one session across many calls:
+
+        with DatabaseOperations() as ops:
+            ops.get_completed_tutorials(user_id)
+            ops.add_favorite(user_id, 'tool', 'cursor', data)
+
+    Static calls made while a unit of work is active on the same thread
+    (e.g. from utils.helpers during a Streamlit rerun) join it as well.
+    Each write still commits as its own transaction together with its
+    stats update.
+    """
+
+    def __init__(self):
+        self.session = None
+        self._owns_session = False
+
+    def __enter__(self):
+        self.session = getattr(_uow_state, 'session', None)
+        if self.session is None:
+            self.session = get_pinned_db_session()
+            self._owns_session = True
+            _uow_state.session = self.session
+            _uow_state.depth = 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._owns_session:
+            return False
+        try:
+            # st.rerun() / st.stop() unwind with BaseException subclasses - those aren't errors
+            if exc_type is None or not issubclass(exc_type, Exception):
+                self.session.commit()
+            else:
+                self.session.rollback()
+        finally:
+            _uow_state.session = None
+            close_db_session(self.session)
+            self.session = None
+            self._owns_session = False
+        return False
+
     # ==================== USER OPERATIONS ====================
-    
+
     @staticmethod
     def create_user(username: str, email: str = None, **kwargs) -> Optional[Dict]:
         """Create a new user - returns dict with user data"""
-        db = get_db_session()
         try:
-            user = User(username=username, email=email, **kwargs)
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            
-            user_id = user.id
-            
-            # Create user stats
-            stats = UserStats(user_id=user_id)
-            db.add(stats)
-            db.commit()
-            
+            with _session_scope() as db:
+                user = User(username=username, email=email, **kwargs)
+                db.add(user)
+                db.flush()
+
+                user_id = user.id
+
+                # Create user stats
+                db.add(UserStats(user_id=user_id))
+
             logger.info(f"Created user: {username}")
-            
+
             # Return dict instead of ORM object
             return {
                 'id': user_id,
@@ -42,403 +128,526 @@ class DatabaseOperations:
                 'email': email
             }
         except Exception as e:
-            db.rollback()
             logger.error(f"Error creating user: {e}")
             return None
-        finally:
-            close_db_session(db)
-    
+
+    @staticmethod
+    def _user_to_dict(user: User) -> Dict:
+        """Serialize a User row to the dict shape returned by the getters"""
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'role': user.role,
+            'industry': user.industry,
+            'skill_level': user.skill_level,
+            'tech_stack': user.tech_stack,
+            'learning_style': user.learning_style,
+            'preferences': user.preferences,
+            'created_at': user.created_at.isoformat() if user.created_at else None,
+            'updated_at': user.updated_at.isoformat() if user.updated_at else None
+        }
+
     @staticmethod
     def get_user_by_id(user_id: int) -> Optional[Dict]:
         """Get user by ID - returns dict"""
-        db = get_db_session()
         try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if user:
-                return {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'role': user.role,
-                    'industry': user.industry,
-                    'skill_level': user.skill_level,
-                    'tech_stack': user.tech_stack,
-                    'learning_style': user.learning_style,
-                    'preferences': user.preferences,
-                    'created_at': user.created_at.isoformat() if user.created_at else None,
-                    'updated_at': user.updated_at.isoformat() if user.updated_at else None
-                }
-            return None
+            with _session_scope() as db:
+                user = db.query(User).filter(User.id == user_id).first()
+                return DatabaseOperations._user_to_dict(user) if user else None
         except Exception as e:
             logger.error(f"Error getting user: {e}")
             return None
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def get_user_by_username(username: str) -> Optional[Dict]:
         """Get user by username - returns dict"""
-        db = get_db_session()
         try:
-            user = db.query(User).filter(User.username == username).first()
-            if user:
-                return {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'role': user.role,
-                    'industry': user.industry,
-                    'skill_level': user.skill_level,
-                    'tech_stack': user.tech_stack,
-                    'learning_style': user.learning_style,
-                    'preferences': user.preferences,
-                    'created_at': user.created_at.isoformat() if user.created_at else None,
-                    'updated_at': user.updated_at.isoformat() if user.updated_at else None
-                }
-            return None
+            with _session_scope() as db:
+                user = db.query(User).filter(User.username == username).first()
+                return DatabaseOperations._user_to_dict(user) if user else None
         except Exception as e:
             logger.error(f"Error getting user: {e}")
             return None
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def update_user(user_id: int, **kwargs) -> bool:
         """Update user profile"""
-        db = get_db_session()
         try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if user:
+            with _session_scope() as db:
+                user = db.query(User).filter(User.id == user_id).first()
+                if not user:
+                    return False
                 for key, value in kwargs.items():
                     setattr(user, key, value)
                 user.updated_at = datetime.utcnow()
-                db.commit()
-                return True
-            return False
+            return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error updating user: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     # ==================== FAVORITES OPERATIONS ====================
-    
+
     @staticmethod
     def add_favorite(user_id: int, item_type: str, item_id: str, item_data: dict) -> bool:
         """Add item to favorites"""
-        db = get_db_session()
         try:
-            # Check if already favorited
-            existing = db.query(Favorite).filter(
-                Favorite.user_id == user_id,
-                Favorite.item_type == item_type,
-                Favorite.item_id == item_id
-            ).first()
-            
-            if existing:
-                return True  # Already favorited
-            
-            favorite = Favorite(
-                user_id=user_id,
-                item_type=item_type,
-                item_id=item_id,
-                item_data=item_data
-            )
-            db.add(favorite)
-            db.commit()
-            
-            # Update stats
-            if item_type == 'tool':
-                DatabaseOperations._update_stats(user_id, tools_favorited=1)
-            
+            with _session_scope() as db:
+                # Check if already favorited
+                existing = db.query(Favorite).filter(
+                    Favorite.user_id == user_id,
+                    Favorite.item_type == item_type,
+                    Favorite.item_id == item_id
+                ).first()
+
+                if existing:
+                    return True  # Already favorited
+
+                db.add(Favorite(
+                    user_id=user_id,
+                    item_type=item_type,
+                    item_id=item_id,
+                    item_data=item_data
+                ))
+
+                # Update stats in the same transaction
+                if item_type == 'tool':
+                    DatabaseOperations._update_stats(user_id, tools_favorited=1)
+
             logger.info(f"Added favorite: {item_type} {item_id} for user {user_id}")
             return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error adding favorite: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def remove_favorite(user_id: int, item_type: str, item_id: str) -> bool:
         """Remove item from favorites"""
-        db = get_db_session()
         try:
-            favorite = db.query(Favorite).filter(
-                Favorite.user_id == user_id,
-                Favorite.item_type == item_type,
-                Favorite.item_id == item_id
-            ).first()
-            
-            if favorite:
+            with _session_scope() as db:
+                favorite = db.query(Favorite).filter(
+                    Favorite.user_id == user_id,
+                    Favorite.item_type == item_type,
+                    Favorite.item_id == item_id
+                ).first()
+
+                if not favorite:
+                    return False
                 db.delete(favorite)
-                db.commit()
-                return True
-            return False
+            return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error removing favorite: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def get_favorites(user_id: int, item_type: str = None) -> List[Favorite]:
         """Get user favorites"""
-        db = get_db_session()
         try:
-            query = db.query(Favorite).filter(Favorite.user_id == user_id)
-            if item_type:
-                query = query.filter(Favorite.item_type == item_type)
-            return query.order_by(Favorite.created_at.desc()).all()
+            with _session_scope() as db:
+                query = db.query(Favorite).filter(Favorite.user_id == user_id)
+                if item_type:
+                    query = query.filter(Favorite.item_type == item_type)
+                return query.order_by(Favorite.created_at.desc()).all()
         except Exception as e:
             logger.error(f"Error getting favorites: {e}")
             return []
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def is_favorite(user_id: int, item_type: str, item_id: str) -> bool:
         """Check if item is favorited"""
-        db = get_db_session()
         try:
-            favorite = db.query(Favorite).filter(
-                Favorite.user_id == user_id,
-                Favorite.item_type == item_type,
-                Favorite.item_id == item_id
-            ).first()
-            return favorite is not None
+            with _session_scope() as db:
+                favorite = db.query(Favorite).filter(
+                    Favorite.user_id == user_id,
+                    Favorite.item_type == item_type,
+                    Favorite.item_id == item_id
+                ).first()
+                return favorite is not None
         except Exception as e:
             logger.error(f"Error checking favorite: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     # ==================== PROGRESS OPERATIONS ====================
-    
+
     @staticmethod
     def mark_tutorial_complete(user_id: int, tutorial_id: str) -> bool:
         """Mark tutorial as complete"""
-        db = get_db_session()
         try:
-            progress = db.query(Progress).filter(
-                Progress.user_id == user_id,
-                Progress.tutorial_id == tutorial_id
-            ).first()
-            
-            if progress:
-                if not progress.completed:
-                    progress.completed = True
-                    progress.progress_percent = 100
-                    progress.completed_at = datetime.utcnow()
-                    db.commit()
+            with _session_scope() as db:
+                progress = db.query(Progress).filter(
+                    Progress.user_id == user_id,
+                    Progress.tutorial_id == tutorial_id
+                ).first()
+
+                if progress:
+                    if not progress.completed:
+                        progress.completed = True
+                        progress.progress_percent = 100
+                        progress.completed_at = datetime.utcnow()
+                        DatabaseOperations._update_stats(user_id, tutorials_completed=1)
+                else:
+                    db.add(Progress(
+                        user_id=user_id,
+                        tutorial_id=tutorial_id,
+                        completed=True,
+                        progress_percent=100,
+                        completed_at=datetime.utcnow()
+                    ))
                     DatabaseOperations._update_stats(user_id, tutorials_completed=1)
-            else:
-                progress = Progress(
-                    user_id=user_id,
-                    tutorial_id=tutorial_id,
-                    completed=True,
-                    progress_percent=100,
-                    completed_at=datetime.utcnow()
-                )
-                db.add(progress)
-                db.commit()
-                DatabaseOperations._update_stats(user_id, tutorials_completed=1)
-            
+
             logger.info(f"Marked tutorial {tutorial_id} complete for user {user_id}")
             return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error marking tutorial complete: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def get_completed_tutorials(user_id: int) -> List[str]:
         """Get list of completed tutorial IDs"""
-        db = get_db_session()
         try:
-            completed = db.query(Progress).filter(
-                Progress.user_id == user_id,
-                Progress.completed == True
-            ).all()
-            return [p.tutorial_id for p in completed]
+            with _session_scope() as db:
+                # Only tutorial_id is selected so ix_progress_user_completed covers the query
+                completed = db.query(Progress.tutorial_id).filter(
+                    Progress.user_id == user_id,
+                    Progress.completed == True
+                ).all()
+                return [row.tutorial_id for row in completed]
         except Exception as e:
             logger.error(f"Error getting completed tutorials: {e}")
             return []
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def is_tutorial_complete(user_id: int, tutorial_id: str) -> bool:
         """Check if tutorial is complete"""
-        db = get_db_session()
         try:
-            progress = db.query(Progress).filter(
-                Progress.user_id == user_id,
-                Progress.tutorial_id == tutorial_id,
-                Progress.completed == True
-            ).first()
-            return progress is not None
+            with _session_scope() as db:
+                progress = db.query(Progress).filter(
+                    Progress.user_id == user_id,
+                    Progress.tutorial_id == tutorial_id,
+                    Progress.completed == True
+                ).first()
+                return progress is not None
         except Exception as e:
             logger.error(f"Error checking tutorial completion: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     # ==================== ACTIVITY OPERATIONS ====================
-    
+
     @staticmethod
     def track_activity(user_id: int, activity_type: str, item_id: str = None, details: dict = None) -> bool:
         """Track user activity"""
-        db = get_db_session()
         try:
-            activity = Activity(
-                user_id=user_id,
-                activity_type=activity_type,
-                item_id=item_id,
-                details=details or {}
-            )
-            db.add(activity)
-            db.commit()
-            
-            # Update last activity date
-            DatabaseOperations._update_last_activity(user_id)
-            
+            with _session_scope() as db:
+                db.add(Activity(
+                    user_id=user_id,
+                    activity_type=activity_type,
+                    item_id=item_id,
+                    details=details or {}
+                ))
+
+                # Update last activity date in the same transaction
+                DatabaseOperations._update_last_activity(user_id)
+
             return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error tracking activity: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
+    @staticmethod
+    def bulk_track_activities(events: List[Dict]) -> int:
+        """
+        Insert many activity events at once - returns the number written.
+
+        Each event is a dict with user_id, activity_type, item_id, details
+        and created_at. Rows go in with a single executemany INSERT, and
+        each user's last_activity_date is bumped once per batch.
+        """
+        if not events:
+            return 0
+
+        rows = [{
+            'user_id': e['user_id'],
+            'activity_type': e['activity_type'],
+            'item_id': e.get('item_id'),
+            'details': e.get('details') or {},
+            'created_at': e['created_at'],
+        } for e in events]
+
+        last_seen = {}
+        for row in rows:
+            last_seen[row['user_id']] = max(row['created_at'], last_seen.get(row['user_id'], row['created_at']))
+
+        stats = UserStats.__table__
+        with _session_scope() as db:
+            db.execute(insert(Activity.__table__), rows)
+            db.execute(
+                update(stats)
+                .where(stats.c.user_id == bindparam('b_user_id'))
+                .values(last_activity_date=bindparam('b_last_activity')),
+                [{'b_user_id': uid, 'b_last_activity': ts} for uid, ts in last_seen.items()]
+            )
+        return len(rows)
+
     @staticmethod
     def get_recent_activities(user_id: int, limit: int = 10) -> List[Activity]:
         """Get recent activities"""
-        db = get_db_session()
         try:
-            return db.query(Activity).filter(
-                Activity.user_id == user_id
-            ).order_by(Activity.created_at.desc()).limit(limit).all()
+            with _session_scope() as db:
+                return db.query(Activity).filter(
+                    Activity.user_id == user_id
+                ).order_by(Activity.created_at.desc()).limit(limit).all()
         except Exception as e:
             logger.error(f"Error getting activities: {e}")
             return []
-        finally:
-            close_db_session(db)
-    
+
+    @staticmethod
+    def get_daily_activity_counts(user_id: int, days: int = 7) -> Dict[date, int]:
+        """
+        Activity counts per UTC day for the last `days` days (today included).
+
+        Reads activity_daily_rollups for everything the retention job has
+        already rolled up, plus the few raw rows newer than its watermark,
+        so the result is current without scanning the raw history.
+        """
+        since = (utc_now() - timedelta(days=days - 1)).date()
+        since_dt = datetime(since.year, since.month, since.day)
+        try:
+            with _session_scope() as db:
+                watermark = db.execute(
+                    select(RetentionState.value).where(RetentionState.name == ROLLUP_WATERMARK)
+                ).scalar() or 0
+                counts = dict(db.execute(
+                    select(ActivityDailyRollup.day, func.sum(ActivityDailyRollup.count))
+                    .where(ActivityDailyRollup.user_id == user_id, ActivityDailyRollup.day >= since)
+                    .group_by(ActivityDailyRollup.day)
+                ).all())
+                recent = db.execute(
+                    select(Activity.created_at)
+                    .where(Activity.user_id == user_id, Activity.created_at >= since_dt, Activity.id > watermark)
+                ).scalars().all()
+
+            for created_at in recent:
+                counts[created_at.date()] = counts.get(created_at.date(), 0) + 1
+            return counts
+        except Exception as e:
+            logger.error(f"Error getting daily activity counts: {e}")
+            return {}
+
     # ==================== SAVED PROMPTS OPERATIONS ====================
-    
+
     @staticmethod
     def save_prompt(user_id: int, prompt_id: str, prompt_data: dict, notes: str = None) -> bool:
         """Save prompt to library"""
-        db = get_db_session()
         try:
-            # Check if already saved
-            existing = db.query(SavedPrompt).filter(
-                SavedPrompt.user_id == user_id,
-                SavedPrompt.prompt_id == prompt_id
-            ).first()
-            
-            if existing:
-                return True
-            
-            saved_prompt = SavedPrompt(
-                user_id=user_id,
-                prompt_id=prompt_id,
-                prompt_data=prompt_data,
-                custom_notes=notes
-            )
-            db.add(saved_prompt)
-            db.commit()
-            
-            DatabaseOperations._update_stats(user_id, prompts_saved=1)
-            
+            with _session_scope() as db:
+                # Check if already saved
+                existing = db.query(SavedPrompt).filter(
+                    SavedPrompt.user_id == user_id,
+                    SavedPrompt.prompt_id == prompt_id
+                ).first()
+
+                if existing:
+                    return True
+
+                db.add(SavedPrompt(
+                    user_id=user_id,
+                    prompt_id=prompt_id,
+                    prompt_data=prompt_data,
+                    custom_notes=notes
+                ))
+
+                DatabaseOperations._update_stats(user_id, prompts_saved=1)
+
             logger.info(f"Saved prompt {prompt_id} for user {user_id}")
             return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error saving prompt: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
     def get_saved_prompts(user_id: int) -> List[SavedPrompt]:
         """Get user's saved prompts"""
-        db = get_db_session()
         try:
-            return db.query(SavedPrompt).filter(
-                SavedPrompt.user_id == user_id
-            ).order_by(SavedPrompt.created_at.desc()).all()
+            with _session_scope() as db:
+                return db.query(SavedPrompt).filter(
+                    SavedPrompt.user_id == user_id
+                ).order_by(SavedPrompt.created_at.desc()).all()
         except Exception as e:
             logger.error(f"Error getting saved prompts: {e}")
             return []
-        finally:
-            close_db_session(db)
-    
+
+    # ==================== SNAPSHOT OPERATIONS ====================
+
+    @staticmethod
+    def get_user_snapshot(user_id: int, activity_limit: int = 50) -> Optional[UserSnapshot]:
+        """
+        Load a user's stats, progress, saved prompts, favorites and recent activity at once.
+
+        Uses one session and three index-only queries: the stats row, a
+        UNION ALL of the completed tutorial / saved prompt / favorite IDs,
+        and the latest activity_limit activities.
+        """
+        try:
+            with _session_scope() as db:
+                stats_row = db.execute(
+                    select(*[UserStats.__table__.c[name] for name in DatabaseOperations.STATS_COUNTERS])
+                    .where(UserStats.user_id == user_id)
+                ).first()
+
+                completed, saved, favorites = DatabaseOperations._load_item_ids(db, user_id)
+
+                activities = []
+                if activity_limit > 0:
+                    activities = db.execute(
+                        select(Activity.activity_type, Activity.item_id, Activity.created_at, Activity.details)
+                        .where(Activity.user_id == user_id)
+                        .order_by(Activity.created_at.desc())
+                        .limit(activity_limit)
+                    ).all()
+
+            return UserSnapshot(
+                user_id=user_id,
+                stats=MappingProxyType({
+                    name: value or 0 for name, value in stats_row._mapping.items()
+                } if stats_row else {}),
+                completed_tutorials=frozenset(completed),
+                saved_prompts=frozenset(saved),
+                favorites=MappingProxyType({key: frozenset(value) for key, value in favorites.items()}),
+                activities=tuple(MappingProxyType({
+                    'type': a.activity_type,
+                    'item_id': a.item_id,
+                    'timestamp': a.created_at.isoformat(),
+                    'details': a.details or {},
+                }) for a in activities),
+            )
+        except Exception as e:
+            logger.error(f"Error getting user snapshot: {e}")
+            return None
+
+    @staticmethod
+    def get_user_item_ids(user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's completed tutorial, saved prompt and favorite IDs in one query.
+
+        Returns {'completed_tutorials': set, 'saved_prompts': set,
+        'favorites': {item_type: set}}, or None on error.
+        """
+        try:
+            with _session_scope() as db:
+                completed, saved, favorites = DatabaseOperations._load_item_ids(db, user_id)
+            return {'completed_tutorials': completed, 'saved_prompts': saved, 'favorites': favorites}
+        except Exception as e:
+            logger.error(f"Error getting user item IDs: {e}")
+            return None
+
+    @staticmethod
+    def _load_item_ids(db, user_id: int):
+        """UNION ALL of the three per-user ID lists - each branch is served by its own index"""
+        rows = db.execute(union_all(
+            select(literal('tutorial').label('kind'), null().label('item_type'),
+                   Progress.tutorial_id.label('item_id'))
+            .where(Progress.user_id == user_id, Progress.completed == True),
+            select(literal('prompt'), null(), SavedPrompt.prompt_id)
+            .where(SavedPrompt.user_id == user_id),
+            select(literal('favorite'), Favorite.item_type, Favorite.item_id)
+            .where(Favorite.user_id == user_id),
+        )).all()
+
+        completed, saved, favorites = set(), set(), {}
+        for kind, item_type, item_id in rows:
+            if kind == 'tutorial':
+                completed.add(item_id)
+            elif kind == 'prompt':
+                saved.add(item_id)
+            else:
+                favorites.setdefault(item_type, set()).add(item_id)
+        return completed, saved, favorites
+
     # ==================== STATS OPERATIONS ====================
-    
+
+    # Integer columns on UserStats that may be bumped through increment_stats
+    STATS_COUNTERS = (
+        'total_xp', 'level', 'tutorials_completed', 'prompts_saved',
+        'tools_favorited', 'current_streak', 'longest_streak',
+    )
+
     @staticmethod
     def get_user_stats(user_id: int) -> Optional[UserStats]:
         """Get user statistics"""
-        db = get_db_session()
         try:
-            stats = db.query(UserStats).filter(UserStats.user_id == user_id).first()
-            if not stats:
-                # Create stats if not exists
-                stats = UserStats(user_id=user_id)
-                db.add(stats)
-                db.commit()
-                db.refresh(stats)
-            return stats
+            with _session_scope() as db:
+                # populate_existing: counters are bumped SQL-side, so don't trust the identity map
+                stats = db.query(UserStats).populate_existing().filter(
+                    UserStats.user_id == user_id
+                ).first()
+                if not stats:
+                    # Create stats if not exists
+                    stats = UserStats(user_id=user_id)
+                    db.add(stats)
+                    db.flush()
+                    db.refresh(stats)
+                return stats
         except Exception as e:
             logger.error(f"Error getting user stats: {e}")
             return None
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
-    def _update_stats(user_id: int, **kwargs) -> bool:
-        """Internal method to update user stats"""
-        db = get_db_session()
+    def increment_stats(user_id: int, **deltas: int) -> bool:
+        """
+        Atomically add deltas to several UserStats counters at once.
+
+        Usage:
+            DatabaseOperations.increment_stats(user_id, total_xp=50, tutorials_completed=1)
+        """
         try:
-            stats = db.query(UserStats).filter(UserStats.user_id == user_id).first()
-            if not stats:
-                stats = UserStats(user_id=user_id)
-                db.add(stats)
-            
-            for key, value in kwargs.items():
-                if hasattr(stats, key):
-                    current_value = getattr(stats, key) or 0
-                    setattr(stats, key, current_value + value)
-            
-            stats.updated_at = datetime.utcnow()
-            db.commit()
+            DatabaseOperations._update_stats(user_id, **deltas)
             return True
         except Exception as e:
-            db.rollback()
             logger.error(f"Error updating stats: {e}")
             return False
-        finally:
-            close_db_session(db)
-    
+
     @staticmethod
-    def _update_last_activity(user_id: int) -> bool:
-        """Update last activity date"""
-        db = get_db_session()
-        try:
-            stats = db.query(UserStats).filter(UserStats.user_id == user_id).first()
-            if stats:
-                stats.last_activity_date = datetime.utcnow()
-                db.commit()
+    def _update_stats(user_id: int, **deltas: int) -> bool:
+        """
+        Internal method to update user stats.
+
+        Issues a single INSERT ... ON CONFLICT DO UPDATE that adds the
+        deltas inside SQLite, so concurrent sessions can't lose updates and
+        no read round trip is needed. Runs in the caller's transaction;
+        errors propagate so the triggering write is rolled back with it.
+        """
+        unknown = set(deltas) - set(DatabaseOperations.STATS_COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown stats counters: {', '.join(sorted(unknown))}")
+        if not deltas:
             return True
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error updating last activity: {e}")
-            return False
-        finally:
-            close_db_session(db)
+
+        now = datetime.utcnow()
+        table = UserStats.__table__
+        # A missing row starts from the column defaults (level starts at 1)
+        initial = {
+            key: (table.c[key].default.arg if table.c[key].default is not None else 0) + value
+            for key, value in deltas.items()
+        }
+        stmt = sqlite_insert(table).values(user_id=user_id, updated_at=now, **initial)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                **{key: func.coalesce(table.c[key], 0) + value for key, value in deltas.items()},
+                'updated_at': now,
+            },
+        )
+        with _session_scope() as db:
+            db.execute(stmt)
+        return True
+
+    @staticmethod
+    def _update_last_activity(user_id: int) -> bool:
+        """Update last activity date (runs in the caller's transaction)"""
+        with _session_scope() as db:
+            db.execute(
+                update(UserStats.__table__)
+                .where(UserStats.__table__.c.user_id == user_id)
+                .values(last_activity_date=datetime.utcnow())
+            )
+        return True
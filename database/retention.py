@@ -0,0 +1,144 @@
+"""
+AI Nexus - Activity Retention
+Rolls raw activities into daily counters and archives old rows to compressed JSONL
+"""
+from database.db import DATABASE_DIR, engine as default_engine
+from database.models import Activity, RetentionState, utc_now
+from config.settings import ACTIVITY_RETENTION_DAYS, ACTIVITY_RETENTION_BATCH_SIZE
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Optional
+import gzip
+import json
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = DATABASE_DIR / "archive"
+
+# Highest activities.id already counted in activity_daily_rollups
+ROLLUP_WATERMARK = "activity_rollup_last_id"
+
+_ROLLUP_SQL = text(
+    "INSERT INTO activity_daily_rollups (user_id, day, activity_type, count) "
+    "SELECT user_id, date(created_at), activity_type, COUNT(*) FROM activities "
+    "WHERE id > :low AND id <= :high AND created_at IS NOT NULL "
+    "GROUP BY user_id, date(created_at), activity_type "
+    "ON CONFLICT (user_id, day, activity_type) DO UPDATE SET count = count + excluded.count"
+)
+
+
+def get_watermark(conn: Connection, name: str) -> int:
+    """Read a retention_state watermark (0 if never set)"""
+    value = conn.execute(select(RetentionState.value).where(RetentionState.name == name)).scalar()
+    return value or 0
+
+
+def _set_watermark(conn: Connection, name: str, value: int):
+    stmt = sqlite_insert(RetentionState.__table__).values(name=name, value=value, updated_at=utc_now())
+    conn.execute(stmt.on_conflict_do_update(
+        index_elements=[RetentionState.__table__.c.name],
+        set_={'value': value, 'updated_at': utc_now()},
+    ))
+
+
+def rollup_activities(bind: Optional[Engine] = None, batch_size: int = ACTIVITY_RETENTION_BATCH_SIZE) -> int:
+    """
+    Fold activities newer than the watermark into activity_daily_rollups.
+
+    Works through id ranges of batch_size rows; each range's counter
+    upserts and the watermark move commit together, so an interrupted run
+    never counts a row twice. Returns the number of raw rows rolled up.
+    """
+    bind = bind or default_engine
+    with bind.connect() as conn:
+        low = get_watermark(conn, ROLLUP_WATERMARK)
+        max_id = conn.execute(select(func.max(Activity.id))).scalar() or 0
+
+    rolled = 0
+    while low < max_id:
+        high = min(low + batch_size, max_id)
+        with bind.begin() as conn:
+            conn.execute(_ROLLUP_SQL, {"low": low, "high": high})
+            rolled += conn.execute(
+                select(func.count()).where(Activity.id > low, Activity.id <= high)
+            ).scalar()
+            _set_watermark(conn, ROLLUP_WATERMARK, high)
+        low = high
+    return rolled
+
+
+def _append_archive(path: Path, lines):
+    """Append one gzip member to path and fsync it before the rows are deleted"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+            for line in lines:
+                gz.write(line.encode("utf-8"))
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def archive_activities(bind: Optional[Engine] = None, older_than_days: int = ACTIVITY_RETENTION_DAYS,
+                       archive_dir: Path = ARCHIVE_DIR,
+                       batch_size: int = ACTIVITY_RETENTION_BATCH_SIZE) -> int:
+    """
+    Move raw activities older than older_than_days into monthly gzip'd JSONL files.
+
+    Only rows already counted by rollup_activities are archived, and the
+    newest row is always kept so SQLite never reuses an id below the
+    rollup watermark. Files are named activities-YYYY-MM.jsonl.gz and
+    each batch is appended as its own gzip member (fsync'd before the
+    rows are deleted). Every line carries the row id, so a batch repeated
+    after a crash can be de-duplicated on read. Returns rows archived.
+    """
+    bind = bind or default_engine
+    table = Activity.__table__
+    cutoff = utc_now() - timedelta(days=older_than_days)
+    with bind.connect() as conn:
+        watermark = get_watermark(conn, ROLLUP_WATERMARK)
+        max_id = conn.execute(select(func.max(table.c.id))).scalar() or 0
+    limit_id = min(watermark, max_id - 1)
+
+    archived, last_id = 0, 0
+    while True:
+        with bind.connect() as conn:
+            rows = conn.execute(
+                select(table)
+                .where(table.c.id > last_id, table.c.id <= limit_id, table.c.created_at < cutoff)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).mappings().all()
+        if not rows:
+            break
+
+        by_month = {}
+        for row in rows:
+            record = dict(row)
+            record['created_at'] = row['created_at'].isoformat()
+            by_month.setdefault(row['created_at'].strftime("%Y-%m"), []).append(
+                json.dumps(record, default=str) + "\n"
+            )
+        for month, lines in by_month.items():
+            _append_archive(Path(archive_dir) / f"activities-{month}.jsonl.gz", lines)
+
+        ids = [row['id'] for row in rows]
+        with bind.begin() as conn:
+            conn.execute(delete(table).where(table.c.id.in_(ids)))
+        archived += len(ids)
+        last_id = ids[-1]
+    return archived
+
+
+def run_retention(bind: Optional[Engine] = None, older_than_days: int = ACTIVITY_RETENTION_DAYS,
+                  archive_dir: Path = ARCHIVE_DIR,
+                  batch_size: int = ACTIVITY_RETENTION_BATCH_SIZE) -> Dict[str, int]:
+    """Roll up new activities, then archive the old ones"""
+    rolled_up = rollup_activities(bind, batch_size)
+    archived = archive_activities(bind, older_than_days, archive_dir, batch_size)
+    logger.info(f"Activity retention: rolled up {rolled_up}, archived {archived}")
+    return {'rolled_up': rolled_up, 'archived': archived}
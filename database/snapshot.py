@@ -0,0 +1,52 @@
+"""
+AI Nexus - User Snapshot
+Immutable per-user view shared by the dashboard, profile and home pages
+"""
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    Read-only view of everything the dashboard-style pages show about a user.
+
+    Built by DatabaseOperations.get_user_snapshot (or from session state by
+    utils.helpers.get_user_snapshot) so a page can read stats, progress,
+    saved prompts, favorites and recent activity from one object instead of
+    issuing a query per widget.
+    """
+    user_id: Optional[int]
+    stats: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({}))
+    completed_tutorials: FrozenSet[str] = frozenset()
+    saved_prompts: FrozenSet[str] = frozenset()
+    favorites: Mapping[str, FrozenSet[str]] = field(default_factory=lambda: MappingProxyType({}))
+    activities: Tuple[Mapping[str, Any], ...] = ()
+
+    def favorite_ids(self, item_type: str) -> FrozenSet[str]:
+        """Favorited item IDs of one type"""
+        return self.favorites.get(item_type, frozenset())
+
+    @property
+    def favorites_count(self) -> int:
+        """Number of favorites across all types"""
+        return sum(len(ids) for ids in self.favorites.values())
+
+    @property
+    def ai_score(self) -> int:
+        """AI proficiency score - from the stats counters when present, else from the item counts"""
+        if self.stats:
+            score = (
+                self.stats.get('tutorials_completed', 0) * 5 +
+                self.stats.get('prompts_saved', 0) * 2 +
+                self.stats.get('tools_favorited', 0) * 1
+            )
+        else:
+            score = (
+                len(self.completed_tutorials) * 5 +
+                len(self.saved_prompts) * 2 +
+                self.favorites_count * 1 +
+                len(self.activities) * 0.5
+            )
+        return int(min(100, score))
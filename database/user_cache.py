@@ -0,0 +1,195 @@
+"""
+AI Nexus - Per-User Membership Cache
+Read-through cache of each user's favorited and completed-tutorial IDs
+"""
+from database.operations import DatabaseOperations
+from config.settings import USER_CACHE_MAX_USERS, USER_CACHE_TTL_SECONDS
+from utils.cache_namespaces import USERS, CacheNamespaces, get_cache_namespaces
+from collections import OrderedDict
+from typing import Dict, Optional
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _UserEntry:
+    """Cached ID sets for one user"""
+
+    __slots__ = ('favorites', 'completed', 'loaded_at', 'version')
+
+    def __init__(self, favorites: Dict[str, set], completed: set, version: int):
+        self.favorites = favorites
+        self.completed = completed
+        self.loaded_at = time.monotonic()
+        self.version = version
+
+
+class UserStateCache:
+    """
+    Read-through cache for is_favorite / is_tutorial_complete.
+
+    The first check for a user loads all of their favorite and completed
+    tutorial IDs with one query; every later check is a set lookup. The
+    write paths in utils.helpers update the cached sets after a successful
+    commit, so entries stay exact without being reloaded. Entries also
+    expire after ttl seconds to pick up writes from other processes, and
+    the least recently used users are evicted past max_users. Entries
+    loaded before the users cache namespace was last invalidated
+    (utils/cache_namespaces.py) count as expired.
+
+    Usage:
+        cache = get_user_cache()
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        cache.add_favorite(user_id, 'tools', 'cursor')  # after the DB write
+    """
+
+    def __init__(self, max_users: int = USER_CACHE_MAX_USERS, ttl: float = USER_CACHE_TTL_SECONDS,
+                 namespaces: Optional[CacheNamespaces] = None):
+        self.max_users = max_users
+        self.ttl = ttl
+        self.namespaces = namespaces or get_cache_namespaces()
+        self._entries = OrderedDict()
+        # Loads in flight per user, and a write counter for those users only, so a
+        # load that raced with a write isn't stored; both shrink as loads finish
+        self._loading = {}
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'misses': 0, 'loads': 0, 'load_errors': 0, 'invalidations': 0, 'evictions': 0}
+
+    # ==================== READS ====================
+
+    def is_favorite(self, user_id: int, item_type: str, item_id: str) -> bool:
+        """Check if an item is favorited"""
+        entry = self._get_entry(user_id)
+        if entry is None:
+            return DatabaseOperations.is_favorite(user_id, item_type, item_id)
+        return item_id in entry.favorites.get(item_type, ())
+
+    def is_tutorial_complete(self, user_id: int, tutorial_id: str) -> bool:
+        """Check if a tutorial is complete"""
+        entry = self._get_entry(user_id)
+        if entry is None:
+            return DatabaseOperations.is_tutorial_complete(user_id, tutorial_id)
+        return tutorial_id in entry.completed
+
+    # ==================== WRITES ====================
+
+    def add_favorite(self, user_id: int, item_type: str, item_id: str):
+        """Record a committed favorite"""
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                entry.favorites.setdefault(item_type, set()).add(item_id)
+
+    def remove_favorite(self, user_id: int, item_type: str, item_id: str):
+        """Record a committed favorite removal"""
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                entry.favorites.get(item_type, set()).discard(item_id)
+
+    def mark_tutorial_complete(self, user_id: int, tutorial_id: str):
+        """Record a committed tutorial completion"""
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                entry.completed.add(tutorial_id)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Drop one user's entry, or every entry when user_id is None"""
+        with self._lock:
+            if user_id is None:
+                for uid in self._loading:
+                    self._bump(uid)
+                self._entries.clear()
+            else:
+                self._bump(user_id)
+                self._entries.pop(user_id, None)
+            self._metrics['invalidations'] += 1
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['users'] = len(self._entries)
+        lookups = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        return metrics
+
+    # ==================== INTERNALS ====================
+
+    def _bump(self, user_id: int):
+        """Advance a user's write generation if a load is in flight (caller holds the lock)"""
+        if user_id in self._loading:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def _finish_load(self, user_id: int):
+        """Mark one load done, forgetting the user's generation once none are left (caller holds the lock)"""
+        remaining = self._loading[user_id] - 1
+        if remaining:
+            self._loading[user_id] = remaining
+        else:
+            del self._loading[user_id]
+            self._generations.pop(user_id, None)
+
+    def _get_entry(self, user_id: int) -> Optional[_UserEntry]:
+        """Return a fresh entry for the user, loading it on a miss"""
+        version = self.namespaces.version(USERS)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry.version == version and time.monotonic() - entry.loaded_at < self.ttl:
+                self._entries.move_to_end(user_id)
+                self._metrics['hits'] += 1
+            else:
+                entry = None
+                self._metrics['misses'] += 1
+                generation = self._generations.get(user_id, 0)
+                self._loading[user_id] = self._loading.get(user_id, 0) + 1
+        self.namespaces.record(USERS, hits=int(entry is not None), misses=int(entry is None))
+        if entry is not None:
+            return entry
+
+        # Load outside the lock so other users' lookups aren't blocked on the DB
+        try:
+            ids = DatabaseOperations.get_user_item_ids(user_id)
+        except Exception:
+            with self._lock:
+                self._finish_load(user_id)
+            raise
+        with self._lock:
+            current = self._generations.get(user_id, 0)
+            self._finish_load(user_id)
+            if ids is None:
+                self._metrics['load_errors'] += 1
+                return None
+            self._metrics['loads'] += 1
+            entry = _UserEntry(ids['favorites'], ids['completed_tutorials'], version)
+            evictions = 0
+            if current == generation:
+                self._entries[user_id] = entry
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_users:
+                    self._entries.popitem(last=False)
+                    evictions += 1
+                self._metrics['evictions'] += evictions
+        if evictions:
+            self.namespaces.record(USERS, evictions=evictions)
+        return entry
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_user_cache() -> UserStateCache:
+    """Get the process-wide user membership cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = UserStateCache()
+        return _cache
@@ -5,8 +5,12 @@ Curated productivity hacks and tips for AI tools
 import streamlit as st
 from data.ai_hacks import (
     get_all_hacks, get_hacks_by_category, get_hacks_by_tool,
-    get_hacks_by_difficulty, search_hacks
+    get_hacks_by_difficulty
 )
+from data.search_service import get_search_service
+from data.content_registry import get_catalog
+from components.fragment_cache import get_fragment_cache
+from components.ui_components import render_paginated_grid
 
 
 def render():
@@ -36,7 +40,7 @@ def render():
     
     # Get filtered hacks
     if search_query:
-        hacks = search_hacks(search_query)
+        hacks = get_search_service().search('hack', search_query)
     elif category_filter != "All":
         hacks = get_hacks_by_category(category_filter)
     elif difficulty_filter != "All":
@@ -52,17 +56,16 @@ def render():
         st.info("No hacks found matching your criteria.")
         return
     
-    # Grid layout - 3 columns
-    for i in range(0, len(hacks), 3):
-        cols = st.columns(3)
-        for j in range(3):
-            if i + j < len(hacks):
-                with cols[j]:
-                    render_hack_card(hacks[i + j], f"grid_{i}_{j}")
+    # Grid layout - 3 columns, one page at a time
+    render_paginated_grid(
+        hacks, lambda hack, index: render_hack_card(hack, f"grid_{index}"),
+        key="hack_grid", columns=3, page_size=24,
+        reset_on=(search_query, category_filter, difficulty_filter)
+    )
 
 
-def render_hack_card(hack, context="default"):
-    """Render a single hack card in grid format"""
+def hack_card_html(hack):
+    """Card markup for a hack (cached per process, see render_hack_card)"""
     difficulty_colors = {
         "Beginner": "#10B981",
         "Intermediate": "#F59E0B",
@@ -72,7 +75,7 @@ def render_hack_card(hack, context="default"):
     diff_color = difficulty_colors.get(hack['difficulty'], '#64748B')
     
     # Compact card
-    st.html(f'''
+    return f'''
         <div class="tool-card" style="border-top: 4px solid {diff_color} !important; background: rgba(255, 255, 255, 0.6) !important; min-height: 180px; display: flex; flex-direction: column;">
             <div style="font-family: Outfit; font-weight: 800; font-size: 1.05rem; margin-bottom: 8px; display: flex; align-items: flex-start;">
                 <span style="margin-right: 8px; font-size: 1.2rem;">{hack['icon']}</span>
@@ -90,7 +93,15 @@ def render_hack_card(hack, context="default"):
                 <span style="color: #64748B; font-size: 0.75rem; font-weight: 600;">{hack['category']}</span>
             </div>
         </div>
-    ''')
+    '''
+
+
+def render_hack_card(hack, context="default"):
+    """Render a single hack card in grid format"""
+    st.html(get_fragment_cache().get_or_render(
+        'hack', hack['id'], get_catalog('hacks').version, 'default',
+        lambda: hack_card_html(hack)
+    ))
     
     # Expandable details
     with st.expander("📖 View Full Hack", expanded=False):
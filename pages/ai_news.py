@@ -5,10 +5,19 @@ Real-time AI news aggregation from top sources
 import streamlit as st
 from data.ai_news import (
     get_all_news, get_news_by_category, get_news_by_timeframe,
-    search_news, get_trending_topics
+    get_trending_topics, search_news
 )
+from data.search_service import get_search_service
+from data.news_ingest import get_news_ingestor
+from data.feed_health import OPEN
+from data.feed_parser import utc_now
+from components.fragment_cache import get_fragment_cache
+from components.ui_components import render_paginated_grid
 from datetime import datetime
 
+# Stands in for the relative time in cached card markup; filled in on every render
+TIME_AGO_SLOT = "\x00time_ago\x00"
+
 
 def render():
     """Render the AI Latest News page"""
@@ -49,7 +58,8 @@ def render():
     # Get filtered news
     with st.spinner("Fetching latest news..."):
         if search_query:
-            articles = search_news(search_query)
+            # Full-text search over all stored articles; the in-memory window covers an unreadable store
+            articles = search_news(search_query) or get_search_service().search('news', search_query)
         elif timeframe == "Last 24 Hours":
             articles = get_news_by_timeframe(24)
         elif timeframe == "Last 7 Days":
@@ -62,10 +72,17 @@ def render():
             articles = get_all_news()
     
     st.markdown(f"**Found {len(articles)} articles**")
+    snapshot = get_news_ingestor().snapshot()
+    if snapshot.fetched_at:
+        paused = sum(1 for health in snapshot.health.values() if health['state'] == OPEN)
+        st.caption(f"Feeds last checked {format_time_ago(snapshot.fetched_at)}"
+                   + (f" · {paused} source{'s' if paused != 1 else ''} paused after repeated failures" if paused else ""))
+        render_feed_health(snapshot.health)
     
-    # Refresh button
+    # Refresh button - refetches the feeds; new articles invalidate only the news cache namespace
     if st.button("🔄 Refresh News", use_container_width=False):
-        st.cache_data.clear()
+        with st.spinner("Fetching latest news..."):
+            get_news_ingestor().refresh()
         st.rerun()
     
     st.markdown("<br>", unsafe_allow_html=True)
@@ -75,28 +92,43 @@ def render():
         st.info("No news articles found matching your criteria. Try adjusting your filters.")
         return
     
-    # Grid layout - 3 columns
-    for i in range(0, min(len(articles), 30), 3):  # Show latest 30
-        cols = st.columns(3)
-        for j in range(3):
-            if i + j < len(articles):
-                with cols[j]:
-                    render_news_card(articles[i + j], f"grid_{i}_{j}")
+    # Grid layout - 3 columns, 30 articles per page
+    render_paginated_grid(
+        articles, lambda article, index: render_news_card(article, f"grid_{index}"),
+        key="news_grid", columns=3, page_size=30,
+        reset_on=(search_query, category_filter, timeframe)
+    )
 
 
-def render_news_card(article, context="default"):
-    """Render a news card in grid format"""
-    # Time ago calculation
-    time_ago = ""
-    if article['published']:
-        delta = datetime.now() - article['published']
-        if delta.days > 0:
-            time_ago = f"{delta.days}d ago"
-        elif delta.seconds // 3600 > 0:
-            time_ago = f"{delta.seconds // 3600}h ago"
-        else:
-            time_ago = f"{delta.seconds // 60}m ago"
-    
+def render_feed_health(health):
+    """Per-source breaker state, latency and polling rate"""
+    if not health:
+        return
+    state_labels = {'closed': "✅ Healthy", 'half_open': "🟡 Probing", 'open': "⛔ Paused"}
+    rows = ["| Source | Status | Latency | Success | Checked every | Last error |",
+            "|---|---|---|---|---|---|"]
+    for name, source in sorted(health.items()):
+        latency = f"{source['latency_ms']:.0f} ms" if source.get('latency_ms') is not None else "–"
+        success = f"{source['success_rate']:.0%}" if source.get('success_rate') is not None else "–"
+        error = (source.get('last_error') or "–") if source['consecutive_failures'] else "–"
+        rows.append(f"| {name} | {state_labels.get(source['state'], source['state'])} | {latency} | {success} "
+                    f"| {source['poll_interval'] / 60:.0f} min | {error[:60].replace('|', '/')} |")
+    with st.expander("📡 Feed health", expanded=False):
+        st.markdown("\n".join(rows))
+
+
+def format_time_ago(when: datetime) -> str:
+    """Relative time such as '3h ago' (when is naive UTC, like stored publish times)"""
+    delta = utc_now() - when
+    if delta.days > 0:
+        return f"{delta.days}d ago"
+    elif delta.seconds // 3600 > 0:
+        return f"{delta.seconds // 3600}h ago"
+    return f"{delta.seconds // 60}m ago"
+
+
+def news_card_html(article):
+    """Card markup for an article, with TIME_AGO_SLOT in place of the relative time"""
     category_colors = {
         "Company News": "#6366F1",
         "Research": "#EC4899",
@@ -110,7 +142,7 @@ def render_news_card(article, context="default"):
     cat_color = category_colors.get(article['category'], '#64748B')
     
     # Compact card
-    st.html(f'''
+    return f'''
         <div class="tool-card" style="border-top: 4px solid {cat_color} !important; background: rgba(255, 255, 255, 0.6) !important; min-height: 200px; display: flex; flex-direction: column;">
             <div style="font-family: Outfit; font-weight: 800; font-size: 1.05rem; margin-bottom: 8px; line-height: 1.3;">
                 <a href="{article['link']}" target="_blank" style="color: #1E293B; text-decoration: none;">
@@ -125,10 +157,23 @@ def render_news_card(article, context="default"):
                 <span style="color: #64748B; font-size: 0.7rem; font-weight: 600;">{article['source']}</span>
             </div>
             <div style="display: flex; justify-content: space-between; align-items: center; border-top: 1px solid rgba(0,0,0,0.05); padding-top: 8px;">
-                <span style="color: #94A3B8; font-size: 0.75rem;">{time_ago}</span>
+                <span style="color: #94A3B8; font-size: 0.75rem;">{TIME_AGO_SLOT}</span>
                 <a href="{article['link']}" target="_blank" style="color: #6366F1; text-decoration: none; font-weight: 700; font-size: 0.75rem;">
                     Read →
                 </a>
             </div>
         </div>
-    ''')
+    '''
+
+
+def render_news_card(article, context="default"):
+    """Render a news card in grid format"""
+    # Time ago calculation
+    time_ago = format_time_ago(article['published']) if article['published'] else ""
+    
+    # Articles change with every feed refresh, so their own fields are the version
+    card_html = get_fragment_cache().get_or_render(
+        'news', article['link'], (article['title'], article['summary'], article['published']), 'default',
+        lambda: news_card_html(article)
+    )
+    st.html(card_html.replace(TIME_AGO_SLOT, time_ago))
@@ -4,40 +4,54 @@ AI Nexus - AI Tool Universe (FINAL HARDENED)
 import streamlit as st
 from data.final_assets import (
     get_all_tools, get_tools_by_category, get_featured_tools,
-    search_tools, get_tool_by_id
+    get_tool_by_id
 )
+from data.search_service import get_search_service
+from data.content_registry import get_catalog
+from components.fragment_cache import get_fragment_cache
+from components.ui_components import render_paginated_grid
 from config.settings import AI_TOOL_CATEGORIES
 from utils.helpers import add_to_favorites, track_activity
 
+def tool_card_html(tool_data):
+    """Card markup for a tool (cached per process, see render_tool_card)"""
+    t_name = str(tool_data.get("name", "AI Module"))
+    t_icon = str(tool_data.get("icon", "🔧"))
+    t_desc = str(tool_data.get("description", ""))[:120]
+    t_rate = int(float(tool_data.get("rating", 5)))
+    t_price = str(tool_data.get("pricing", "Paid"))
+    
+    p_map = {"Free": "#10B981", "Freemium": "#F59E0B", "Paid": "#6366F1", "Enterprise": "#EF4444"}
+    c_hex = p_map.get(t_price, "#64748B")
+    stars = "★" * t_rate
+    
+    return f'''
+        <div class="tool-card" style="border-top: 4px solid #6366F1 !important; background: rgba(255, 255, 255, 0.7) !important; min-height: 165px; display: flex; flex-direction: column; padding: 1.25rem !important; border-radius: 16px !important;">
+            <div style="font-family: Outfit; font-weight: 800; font-size: 1.15rem; color: #1E293B; margin-bottom: 8px; display: flex; align-items: flex-start;">
+                <span style="margin-right: 12px; font-size: 1.4rem;">{t_icon}</span>
+                <span style="background: var(--prism-gradient); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{t_name}</span>
+            </div>
+            <div style="font-size: 0.9rem; color: #475569; margin-bottom: 12px; flex-grow: 1; overflow: hidden; line-height: 1.5;">
+                {t_desc}...
+            </div>
+            <div style="display: flex; justify-content: space-between; align-items: center; border-top: 1px solid rgba(0,0,0,0.05); padding-top: 12px;">
+                <span style="background: {c_hex}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 800; text-transform: uppercase;">{t_price}</span>
+                <span style="color: #FBBF24; font-size: 1.1rem;">{stars}</span>
+            </div>
+        </div>
+    '''
+
+
 def render_tool_card(tool_data, tool_context="final"):
     """Final hardened card renderer"""
     try:
         t_id = str(tool_data.get("id", "none"))
         t_name = str(tool_data.get("name", "AI Module"))
-        t_icon = str(tool_data.get("icon", "🔧"))
-        t_desc = str(tool_data.get("description", ""))[:120]
-        t_rate = int(float(tool_data.get("rating", 5)))
-        t_price = str(tool_data.get("pricing", "Paid"))
-        
-        p_map = {"Free": "#10B981", "Freemium": "#F59E0B", "Paid": "#6366F1", "Enterprise": "#EF4444"}
-        c_hex = p_map.get(t_price, "#64748B")
-        stars = "★" * t_rate
-        
-        st.markdown(f'''
-            <div class="tool-card" style="border-top: 4px solid #6366F1 !important; background: rgba(255, 255, 255, 0.7) !important; min-height: 165px; display: flex; flex-direction: column; padding: 1.25rem !important; border-radius: 16px !important;">
-                <div style="font-family: Outfit; font-weight: 800; font-size: 1.15rem; color: #1E293B; margin-bottom: 8px; display: flex; align-items: flex-start;">
-                    <span style="margin-right: 12px; font-size: 1.4rem;">{t_icon}</span>
-                    <span style="background: var(--prism-gradient); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{t_name}</span>
-                </div>
-                <div style="font-size: 0.9rem; color: #475569; margin-bottom: 12px; flex-grow: 1; overflow: hidden; line-height: 1.5;">
-                    {t_desc}...
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; border-top: 1px solid rgba(0,0,0,0.05); padding-top: 12px;">
-                    <span style="background: {c_hex}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 800; text-transform: uppercase;">{t_price}</span>
-                    <span style="color: #FBBF24; font-size: 1.1rem;">{stars}</span>
-                </div>
-            </div>
-        ''', unsafe_allow_html=True)
+        card_html = get_fragment_cache().get_or_render(
+            'tool', t_id, get_catalog('tools').version, 'default',
+            lambda: tool_card_html(tool_data)
+        )
+        st.markdown(card_html, unsafe_allow_html=True)
         
         c1, c2 = st.columns(2)
         with c1:
@@ -70,7 +84,7 @@ def render():
                 st.rerun()
 
     # Fetch
-    if q: tools = search_tools(q)
+    if q: tools = get_search_service().search('tool', q)
     elif sel != 'all': tools = get_tools_by_category(sel)
     else: tools = get_all_tools()
     
@@ -85,9 +99,5 @@ def render():
         return
     
     # Grid
-    for i in range(0, len(tools), 4):
-        cols = st.columns(4)
-        for j in range(4):
-            if i + j < len(tools):
-                with cols[j]:
-                    render_tool_card(tools[i+j])
+    render_paginated_grid(tools, lambda tool, _: render_tool_card(tool), key="tool_grid",
+                          columns=4, page_size=24, reset_on=(q, sel))
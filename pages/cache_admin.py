@@ -0,0 +1,48 @@
+"""
+AI Nexus - Cache Admin Page
+Per-namespace cache versions and hit/miss/eviction counters, with targeted invalidation
+"""
+import streamlit as st
+from utils.cache_namespaces import NAMESPACES, get_cache_namespaces
+from components.fragment_cache import get_fragment_cache
+from data.search_service import get_search_service
+from database.user_cache import get_user_cache
+
+NAMESPACE_LABELS = {
+    'news': "📰 News",
+    'catalogs': "📚 Catalogs",
+    'users': "👤 User snapshots",
+}
+
+
+def render():
+    """Render the cache admin page (opened with ?page=admin when AINEXUS_ADMIN_ENABLED=1)"""
+    st.markdown("<h2>🗄️ Cache Admin</h2>", unsafe_allow_html=True)
+    st.markdown("<p style='color: #64748B; margin-bottom: 1.5rem;'>Invalidating a namespace bumps its version token: only that domain's cached entries are rebuilt, for everyone, and every other cache stays warm.</p>", unsafe_allow_html=True)
+
+    namespaces = get_cache_namespaces()
+    stats = namespaces.stats()
+
+    cols = st.columns(len(NAMESPACES))
+    for col, name in zip(cols, NAMESPACES):
+        metrics = stats[name]
+        with col:
+            st.metric(NAMESPACE_LABELS.get(name, name), f"{metrics['hit_rate']:.0%} hit rate",
+                      help="Lookups across the fragment, search and user caches")
+            st.caption(f"Version {metrics['version']} · {metrics['hits']:,} hits · {metrics['misses']:,} misses · "
+                       f"{metrics['evictions']:,} evictions · {metrics['invalidations']:,} invalidations")
+            st.button(f"♻️ Invalidate {name}", key=f"cache_invalidate_{name}",
+                      on_click=namespaces.invalidate, args=(name,))
+
+    st.markdown("### Caches")
+    fragments = get_fragment_cache().stats()
+    search = get_search_service().stats()
+    users = get_user_cache().stats()
+    rows = [
+        "| Cache | Entries | Hit rate | Evictions |",
+        "|---|---|---|---|",
+        f"| Card fragments | {fragments['entries']:,} | {fragments['hit_rate']:.0%} | {fragments['evictions']:,} |",
+        f"| Search results | {search['entries']:,} | {search['hit_rate'] + search['narrow_rate']:.0%} | {search['evictions']:,} |",
+        f"| User favorites / progress | {users['users']:,} | {users['hit_rate']:.0%} | {users['evictions']:,} |",
+    ]
+    st.markdown("\n".join(rows))
@@ -8,8 +8,7 @@ import time
 from datetime import datetime, timedelta
 from data.final_tutorials import get_all_tutorials
 from utils.helpers import (
-    calculate_ai_score, get_completed_tutorials, 
-    get_saved_prompts, get_all_favorites
+    get_user_snapshot, get_weekly_activity, get_saved_prompts, get_all_favorites
 )
 
 
@@ -30,13 +29,15 @@ def render():
     # Get real user data with loading state
     with st.spinner("Loading your dashboard..."):
         try:
-            ai_score = calculate_ai_score()
-            completed_count = len(get_completed_tutorials())
-            saved_prompts_count = len(get_saved_prompts())
-            favorites = get_all_favorites()
-            tools_mastered = len(favorites.get('tools', {}))
+            # One snapshot feeds every widget on the page
+            snapshot = get_user_snapshot(activity_limit=5)
+            ai_score = snapshot.ai_score
+            completed_count = len(snapshot.completed_tutorials)
+            saved_prompts_count = len(snapshot.saved_prompts)
+            tools_mastered = len(snapshot.favorite_ids('tools'))
         except Exception as e:
             st.error(f"❌ Error loading dashboard data: {str(e)}")
+            snapshot = None
             ai_score = 0
             completed_count = 0
             saved_prompts_count = 0
@@ -73,7 +74,7 @@ def render():
         
         # Dynamic Progress Calculation
         all_tutorials = get_all_tutorials()
-        completed_ids = get_completed_tutorials()
+        completed_ids = snapshot.completed_tutorials if snapshot else frozenset()
         
         # Calculate totals
         total_qw = len([t for t in all_tutorials if t['id'].startswith('qw-')])
@@ -110,27 +111,10 @@ def render():
         # Activity Chart - Real Data
         st.markdown("### 📈 Weekly Activity")
         
-        # Fetch real activity data
-        from utils.helpers import get_recent_activities
-        from collections import defaultdict
-        
-        recent_activities = get_recent_activities(50)  # Get last 50 activities
-        
-        # Group by day of week
-        day_counts = defaultdict(int)
+        # Last 7 days by weekday, served from the daily rollups
+        activity = get_weekly_activity()
         day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         
-        for act in recent_activities:
-            try:
-                ts = datetime.fromisoformat(act.get('timestamp', ''))
-                day_idx = ts.weekday()  # 0=Mon, 6=Sun
-                day_counts[day_idx] += 1
-            except:
-                pass
-        
-        # Build activity list for chart
-        activity = [day_counts.get(i, 0) for i in range(7)]
-        
         if sum(activity) == 0:
             st.info("📊 Start completing tutorials, saving prompts, or favoriting tools to see your activity chart!")
         else:
@@ -158,10 +142,9 @@ def render():
         
         with st.spinner("Loading recent activities..."):
             try:
-                from utils.helpers import get_recent_activities
                 from datetime import datetime
                 
-                activities = get_recent_activities(5)
+                activities = snapshot.activities[:5] if snapshot else ()
                 
                 if activities:
                     for activity in activities:
@@ -212,7 +195,7 @@ def render():
         render_right_column()
     
     # Render quick actions section (below the two-column layout)
-    render_quick_actions(profile, ai_score, completed_count, saved_prompts_count)
+    render_quick_actions(profile, ai_score, completed_count, saved_prompts_count, completed_ids)
 
 
 def get_time_ago(timestamp):
@@ -303,7 +286,7 @@ def render_right_column():
     """, unsafe_allow_html=True)
 
 
-def render_quick_actions(profile, ai_score, completed_count, saved_prompts_count):
+def render_quick_actions(profile, ai_score, completed_count, saved_prompts_count, completed_ids=frozenset()):
     """Render Quick Actions section"""
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -355,7 +338,7 @@ def render_quick_actions(profile, ai_score, completed_count, saved_prompts_count
             "assets": {
                 "saved_prompts": get_saved_prompts(),
                 "favorite_tools": get_all_favorites('tools'),
-                "completed_curriculum": get_completed_tutorials()
+                "completed_curriculum": sorted(completed_ids)
             }
         }
         
@@ -5,8 +5,12 @@ Hyper-Personalized Learning Engine
 import streamlit as st
 from data.final_tutorials import (
     get_all_tutorials, get_tutorials_by_category, 
-    get_tutorials_by_role, get_popular_tutorials, search_tutorials
+    get_tutorials_by_role, get_popular_tutorials
 )
+from data.search_service import get_search_service
+from data.content_registry import get_catalog
+from components.fragment_cache import get_fragment_cache
+from components.ui_components import render_paginated_grid
 from config.settings import ROLE_ARCHETYPES, LEARNING_PATHS, SKILL_LEVELS
 
 
@@ -35,7 +39,7 @@ def render():
     with st.spinner("Loading tutorials..."):
         try:
             if search_query:
-                tutorials = search_tutorials(search_query)
+                tutorials = get_search_service().search('tutorial', search_query)
             elif category_filter != "All":
                 tutorials = get_tutorials_by_category(category_filter)
             else:
@@ -61,7 +65,7 @@ def render():
                 try:
                     role_tutorials = get_tutorials_by_role(st.session_state.selected_role)
                     if role_tutorials:
-                        render_tutorial_grid(role_tutorials[:12], "role")
+                        render_tutorial_grid(role_tutorials, "role")
                     else:
                         st.info("No tutorials found for your role yet. Check back soon!")
                 except Exception as e:
@@ -82,7 +86,7 @@ def render():
                 st.error(f"❌ Error: {str(e)}")
     
     with tab4:
-        render_tutorial_grid(tutorials[:40], "all")
+        render_tutorial_grid(tutorials, "all", reset_on=(search_query, category_filter, difficulty_filter))
     
     # Skill Assessment Section
     st.markdown("<br>", unsafe_allow_html=True)
@@ -190,25 +194,21 @@ def render_assessment():
         st.rerun()
 
 
-def render_tutorial_grid(tutorials: list, context: str = "default"):
-    """Render a grid of tutorial cards"""
+def render_tutorial_grid(tutorials: list, context: str = "default", reset_on=None):
+    """Render a paginated grid of tutorial cards"""
     if not tutorials:
         st.info("No tutorials found matching your criteria.")
         return
     
-    # Create rows of 3 tutorials
-    for i in range(0, len(tutorials), 3):
-        cols = st.columns(3)
-        for j, col in enumerate(cols):
-            if i + j < len(tutorials):
-                tutorial = tutorials[i + j]
-                with col:
-                    render_tutorial_card(tutorial, context)
+    # Rows of 3 tutorials, 24 per page
+    render_paginated_grid(
+        tutorials, lambda tutorial, _: render_tutorial_card(tutorial, context),
+        key=f"lh_grid_{context}", columns=3, page_size=24, reset_on=reset_on
+    )
 
 
-def render_tutorial_card(tutorial: dict, context: str = "default"):
-    """Render a single tutorial card with completion status"""
-    from utils.helpers import is_tutorial_complete
+def tutorial_card_html(tutorial: dict, is_complete: bool) -> str:
+    """Card markup for a tutorial (cached per process and completion state, see render_tutorial_card)"""
     import html
     
     difficulty_colors = {
@@ -219,9 +219,6 @@ def render_tutorial_card(tutorial: dict, context: str = "default"):
     }
     diff_color = difficulty_colors.get(tutorial.get('difficulty', 'Beginner'), '#64748B')
     
-    # Check completion status
-    is_complete = is_tutorial_complete(tutorial['id'])
-    
     # Pre-calculate styles
     border_left = "border-left: 3px solid #10B981 !important;" if is_complete else ""
     completion_badge = '<span style="background: #10B981; color: white; padding: 0.15rem 0.5rem; border-radius: 10px; font-size: 0.65rem; font-weight: 700; margin-left: 8px;">✓ DONE</span>' if is_complete else ''
@@ -234,7 +231,7 @@ def render_tutorial_card(tutorial: dict, context: str = "default"):
     duration = tutorial['duration']
     
     # Build card HTML safely
-    card_html = f'''
+    return f'''
         <div class="tool-card" style="border-top: 4px solid {diff_color} !important; background: rgba(255, 255, 255, 0.6) !important; min-height: 160px; display: flex; flex-direction: column; {border_left}">
             <div style="font-family: Outfit; font-weight: 800; font-size: 1.1rem; margin-bottom: 8px; display: flex; align-items: flex-start;">
                 <span style="margin-right: 10px; font-size: 1.3rem;">{icon}</span>
@@ -250,6 +247,18 @@ def render_tutorial_card(tutorial: dict, context: str = "default"):
             </div>
         </div>
     '''
+
+
+def render_tutorial_card(tutorial: dict, context: str = "default"):
+    """Render a single tutorial card with completion status"""
+    from utils.helpers import is_tutorial_complete
+    
+    # Check completion status
+    is_complete = is_tutorial_complete(tutorial['id'])
+    card_html = get_fragment_cache().get_or_render(
+        'tutorial', tutorial['id'], get_catalog('tutorials').version, 'done' if is_complete else 'open',
+        lambda: tutorial_card_html(tutorial, is_complete)
+    )
     
     # Use st.html instead of st.markdown for better HTML rendering
     st.html(card_html)
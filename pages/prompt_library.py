@@ -5,8 +5,12 @@ Prompt Engineering Mastery
 import streamlit as st
 from data.final_prompts import (
     get_all_prompts, get_prompts_by_category, get_popular_prompts,
-    search_prompts, get_prompt_by_id
+    get_prompt_by_id
 )
+from data.search_service import get_search_service
+from data.content_registry import get_catalog
+from components.fragment_cache import get_fragment_cache
+from components.ui_components import render_paginated_grid
 from config.settings import PROMPT_CATEGORIES
 
 
@@ -175,7 +179,7 @@ def render_browse_prompts():
     with st.spinner("Loading prompts..."):
         try:
             if search_query:
-                prompts = search_prompts(search_query)
+                prompts = get_search_service().search('prompt', search_query)
             elif selected_category and selected_category != 'all':
                 prompts = get_prompts_by_category(selected_category)
             else:
@@ -184,11 +188,12 @@ def render_browse_prompts():
             if difficulty_filter != "All":
                 prompts = [p for p in prompts if p.get("difficulty") == difficulty_filter]
             
-            # Sort
-            if sort_by == "Popular":
-                prompts = sorted(prompts, key=lambda x: x.get("uses", 0), reverse=True)
-            elif sort_by == "Rating":
-                prompts = sorted(prompts, key=lambda x: x.get("rating", 0), reverse=True)
+            # Sort (the full catalog's rankings are sorted once and cached)
+            sort_field = {"Popular": "uses", "Rating": "rating"}.get(sort_by)
+            if sort_field and prompts is get_all_prompts():
+                prompts = get_catalog('prompts').ranked(sort_field)
+            elif sort_field:
+                prompts = sorted(prompts, key=lambda x: x.get(sort_field, 0), reverse=True)
         except Exception as e:
             st.error(f"❌ Error loading prompts: {str(e)}")
             prompts = []
@@ -204,37 +209,32 @@ def render_browse_prompts():
         return
     
     if prompts:
-        st.markdown(f"**Showing {len(prompts[:24])} verified prompts**")
+        st.markdown(f"**Showing {len(prompts)} verified prompts**")
     else:
         st.warning("The prompt repository is currently empty or filtered out. Troubleshooting V6...")
     
     # Render prompts grid
-    render_prompt_grid(prompts[:24], "browse")
+    render_prompt_grid(prompts, "browse", reset_on=(search_query, selected_category, difficulty_filter, sort_by))
 
 
-def render_prompt_grid(prompts_list: list, context: str):
-    """Render prompts in a dense grid"""
+def render_prompt_grid(prompts_list: list, context: str, reset_on=None):
+    """Render prompts in a dense, paginated grid"""
     if not prompts_list:
         st.info("No prompts found.")
         return
-        
-    for i in range(0, len(prompts_list), 5):
-        cols = st.columns(5)
-        for j in range(5):
-            if i + j < len(prompts_list):
-                with cols[j]:
-                    render_prompt_card(prompts_list[i + j], context)
+    
+    render_paginated_grid(
+        prompts_list, lambda prompt, _: render_prompt_card(prompt, context),
+        key=f"prompt_grid_{context}", columns=5, page_size=25, reset_on=reset_on
+    )
 
 
-def render_prompt_card(prompt: dict, context: str = "default"):
-    """Render a single prompt card"""
-    difficulty_colors = {"Beginner": "#10B981", "Intermediate": "#F59E0B", "Advanced": "#EF4444"}
-    diff_color = difficulty_colors.get(prompt.get("difficulty", "Beginner"), "#A1A1AA")
-    
+def prompt_card_html(prompt: dict) -> str:
+    """Card markup for a prompt (cached per process, see render_prompt_card)"""
     # Truncate prompt text for preview
     preview = prompt.get('prompt', '')[:120].replace('\n', ' ')
     
-    st.markdown(f"""
+    return f"""
         <div class="tool-card" style="border-top: 4px solid #EC4899 !important; background: rgba(255, 255, 255, 0.6) !important; min-height: 180px; display: flex; flex-direction: column;">
             <div style="font-family: Outfit; font-weight: 800; font-size: 1.15rem; color: #1E293B; margin-bottom: 12px;">{prompt['title']}</div>
             <div style="font-family: 'JetBrains Mono', 'Fira Code', monospace; font-size: 0.85rem; color: #334155; background: #F1F5F9; padding: 12px; border-radius: 12px; border: 1px solid rgba(99, 102, 241, 0.2); flex-grow: 1; overflow: hidden; margin-bottom: 15px; line-height: 1.6;">
@@ -245,7 +245,16 @@ def render_prompt_card(prompt: dict, context: str = "default"):
                 <span style="background: #F472B6; color: white; padding: 0.15rem 0.5rem; border-radius: 10px; font-size: 0.75rem; font-weight: 700;">{prompt.get('difficulty', 'Beginner')}</span>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def render_prompt_card(prompt: dict, context: str = "default"):
+    """Render a single prompt card"""
+    card_html = get_fragment_cache().get_or_render(
+        'prompt', prompt['id'], get_catalog('prompts').version, 'default',
+        lambda: prompt_card_html(prompt)
+    )
+    st.markdown(card_html, unsafe_allow_html=True)
     
     # Generate unique key suffix
     import hashlib
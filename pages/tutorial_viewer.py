@@ -3,7 +3,7 @@ AI Nexus - Tutorial Viewer
 Display full tutorial content with interactive elements
 """
 import streamlit as st
-from data.final_tutorials import get_all_tutorials
+from data.final_tutorials import get_tutorial_by_id
 from data.tutorial_content import TUTORIAL_CONTENT
 from utils.helpers import mark_tutorial_complete, is_tutorial_complete, track_activity
 
@@ -11,8 +11,7 @@ from utils.helpers import mark_tutorial_complete, is_tutorial_complete, track_ac
 def render_tutorial(tutorial_id: str):
     """Render a full tutorial with content"""
     # Get tutorial metadata
-    all_tutorials = get_all_tutorials()
-    tutorial = next((t for t in all_tutorials if t['id'] == tutorial_id), None)
+    tutorial = get_tutorial_by_id(tutorial_id)
     
     if not tutorial:
         st.error("Tutorial not found!")
@@ -322,12 +322,12 @@ def render_profile_view():
         st.markdown("---")
         st.markdown("## 🏆 Your Achievements")
         
-        from utils.helpers import get_completed_tutorials, get_saved_prompts, get_all_favorites
+        from utils.helpers import get_user_snapshot
         
-        completed = len(get_completed_tutorials())
-        saved = len(get_saved_prompts())
-        favorites = get_all_favorites()
-        tools_saved = len(favorites.get('tools', {}))
+        snapshot = get_user_snapshot(activity_limit=0)
+        completed = len(snapshot.completed_tutorials)
+        saved = len(snapshot.saved_prompts)
+        tools_saved = len(snapshot.favorite_ids('tools'))
         ai_score = profile.get('ai_score', 0)
         
         # Define badges
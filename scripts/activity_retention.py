@@ -0,0 +1,63 @@
+"""
+AI Nexus - Activity Retention Job
+Rolls new activities into daily counters and archives raw rows past the retention age
+
+Usage:
+    python scripts/activity_retention.py
+    python scripts/activity_retention.py --days 30 --archive-dir /backups/activities
+    python scripts/activity_retention.py --rollup-only
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.settings import ACTIVITY_RETENTION_BATCH_SIZE, ACTIVITY_RETENTION_DAYS
+from database.db import DATABASE_PATH, create_sqlite_engine, upgrade_db
+from database.retention import ARCHIVE_DIR, archive_activities, rollup_activities
+
+
+def main():
+    """Parse arguments and run the retention job"""
+    parser = argparse.ArgumentParser(description="AI Nexus activity retention")
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="SQLite database file")
+    parser.add_argument("--days", type=int, default=ACTIVITY_RETENTION_DAYS, help="Keep raw rows this many days")
+    parser.add_argument("--archive-dir", default=str(ARCHIVE_DIR), help="Where the .jsonl.gz archives go")
+    parser.add_argument("--batch-size", type=int, default=ACTIVITY_RETENTION_BATCH_SIZE)
+    parser.add_argument("--rollup-only", action="store_true", help="Update rollups without archiving")
+    args = parser.parse_args()
+
+    engine = create_sqlite_engine(f"sqlite:///{Path(args.db).resolve()}")
+    print("🚀 AI Nexus Activity Retention")
+    print("=" * 50)
+    print(f"Database: {args.db}")
+
+    try:
+        if not upgrade_db(engine):
+            print("❌ Could not bring the schema up to date")
+            return 1
+
+        start = time.perf_counter()
+        rolled = rollup_activities(engine, args.batch_size)
+        print(f"✅ Rolled up {rolled:,} new activities ({time.perf_counter() - start:.2f}s)")
+
+        if not args.rollup_only:
+            start = time.perf_counter()
+            archived = archive_activities(engine, args.days, Path(args.archive_dir), args.batch_size)
+            print(f"✅ Archived {archived:,} activities older than {args.days} days "
+                  f"to {args.archive_dir} ({time.perf_counter() - start:.2f}s)")
+    except Exception as e:
+        print(f"❌ Retention failed: {e}")
+        return 1
+    finally:
+        engine.dispose()
+    print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+AI Nexus - Card Render Benchmark
+Per-rerun cost of building the HTML for full card grids, rebuilt from the
+records every time versus served from the shared fragment cache
+"""
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from components.fragment_cache import FragmentCache
+from data.content_registry import get_catalog
+from pages.ai_hacks import hack_card_html
+from pages.ai_news import news_card_html
+from pages.ai_tools_final import tool_card_html
+from pages.learning_hub import tutorial_card_html
+from pages.prompt_library import prompt_card_html
+
+
+def grid(records, size):
+    """size records, cycling through the catalog if it is smaller"""
+    return [records[i % len(records)] for i in range(size)]
+
+
+def synthetic_news(size):
+    """Articles shaped like data.ai_news output"""
+    now = datetime.now()
+    return [{
+        'title': f"Model release {i}: what changed in the latest frontier LLM update",
+        'link': f"https://example.com/news/{i}",
+        'summary': "A closer look at benchmarks, pricing and context windows. " * 4,
+        'published': now - timedelta(hours=i),
+        'source': "Example Blog", 'category': "Research", 'icon': "📰",
+    } for i in range(size)]
+
+
+def grids():
+    """(name, kind, cards, version, builder) for every card grid"""
+    return [
+        ("Prompts (24)", 'prompt', grid(get_catalog('prompts').visible, 24),
+         lambda r: get_catalog('prompts').version, prompt_card_html),
+        ("Tools (40)", 'tool', grid(get_catalog('tools').visible, 40),
+         lambda r: get_catalog('tools').version, tool_card_html),
+        ("Tutorials (24)", 'tutorial', grid(get_catalog('tutorials').visible, 24),
+         lambda r: get_catalog('tutorials').version, lambda r: tutorial_card_html(r, False)),
+        ("Hacks (24)", 'hack', grid(get_catalog('hacks').visible, 24),
+         lambda r: get_catalog('hacks').version, hack_card_html),
+        ("News (30)", 'news', synthetic_news(30),
+         lambda r: (r['title'], r['summary'], r['published']), news_card_html),
+    ]
+
+
+def median_us(fn, repeat):
+    """Median microseconds per call"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main(repeat=200):
+    """Time one rerun's worth of card HTML per grid"""
+    print("🚀 AI Nexus Card Render Benchmark")
+    print("=" * 60)
+    print(f"{'Grid':<18}{'rebuild µs':>14}{'cached µs':>14}{'speedup':>12}")
+
+    cache = FragmentCache()
+    for name, kind, cards, version, builder in grids():
+        def rebuild():
+            for record in cards:
+                builder(record)
+
+        def cached():
+            for i, record in enumerate(cards):
+                # Cycled records reuse an id, so key on the grid position as the variant
+                cache.get_or_render(kind, record.get('id', record.get('link')), version(record), i,
+                                    lambda: builder(record))
+
+        cached()
+        rebuild_us = median_us(rebuild, repeat)
+        cached_us = median_us(cached, repeat)
+        print(f"{name:<18}{rebuild_us:>14.1f}{cached_us:>14.1f}{rebuild_us / cached_us:>11.1f}x")
+
+    stats = cache.stats()
+    print(f"\nFragment cache: {stats['entries']} entries, hit rate {stats['hit_rate']:.1%}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
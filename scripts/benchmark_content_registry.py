@@ -0,0 +1,79 @@
+"""
+AI Nexus - Content Registry Benchmark
+Scales each content catalog to 100k synthetic records and compares
+linear-scan lookups with the ContentCatalog dict indexes
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from data.content_registry import get_all_catalogs, ContentCatalog
+
+
+def synthesize(catalog, size):
+    """Clone a catalog's records with fresh ids until it has size items"""
+    seed = catalog.visible
+    return [dict(seed[i % len(seed)], id=f"{seed[i % len(seed)]['id']}-{i}") for i in range(size)]
+
+
+def time_per_call(fn, args, repeat):
+    """Average seconds per call over repeat calls cycling through args"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(args[i % len(args)])
+    return (time.perf_counter() - start) / repeat
+
+
+def benchmark(name, catalog, size, repeat):
+    """Time id and facet lookups, scanned and indexed, at one catalog size"""
+    items = synthesize(catalog, size)
+    start = time.perf_counter()
+    indexed = ContentCatalog(items, facets=catalog.facets)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    ids = [random.choice(items)['id'] for _ in range(100)]
+    facet = 'category' if 'category' in catalog.facets else next(iter(catalog.facets))
+    field, case_insensitive = catalog.facets[facet]
+    keys = indexed.facet_values(facet)
+
+    def scan_id(item_id):
+        return next((i for i in items if i['id'] == item_id), None)
+
+    def scan_facet(key):
+        return [i for i in items if (i.get(field).lower() if case_insensitive else i.get(field)) == key]
+
+    # Scans get fewer repeats at large sizes so the benchmark finishes quickly
+    scan_repeat = max(3, repeat * 1000 // size)
+    return {
+        'catalog': name,
+        'size': size,
+        'build_ms': build_ms,
+        'scan_id_us': time_per_call(scan_id, ids, scan_repeat) * 1e6,
+        'index_id_us': time_per_call(indexed.get, ids, repeat) * 1e6,
+        'scan_facet_us': time_per_call(scan_facet, keys, scan_repeat) * 1e6,
+        'index_facet_us': time_per_call(lambda key: indexed.lookup(facet, key), keys, repeat) * 1e6,
+    }
+
+
+def main(sizes=(100, 1_000, 10_000, 100_000), repeat=20_000):
+    """Run every catalog at every size"""
+    print("🚀 AI Nexus Content Registry Benchmark")
+    print("=" * 86)
+    print(f"{'Catalog':<11}{'items':>9}{'build ms':>10}{'scan id µs':>13}{'index id µs':>13}"
+          f"{'scan facet µs':>15}{'index facet µs':>15}")
+    for name, catalog in get_all_catalogs().items():
+        for size in sizes:
+            r = benchmark(name, catalog, size, repeat)
+            print(f"{r['catalog']:<11}{r['size']:>9,}{r['build_ms']:>10.1f}{r['scan_id_us']:>13.1f}"
+                  f"{r['index_id_us']:>13.3f}{r['scan_facet_us']:>15.1f}{r['index_facet_us']:>15.3f}")
+    print("=" * 86)
+    print("Indexed lookups should stay flat as the catalogs grow; scans grow linearly.")
+
+
+if __name__ == "__main__":
+    main()
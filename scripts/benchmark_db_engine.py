@@ -0,0 +1,112 @@
+"""
+AI Nexus - Database Engine Profile Benchmark
+Runs concurrent readers and writers against a copy of data/ainexus.db
+under each engine profile in config.settings.DB_ENGINE_PROFILES
+"""
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.settings import DB_ENGINE_PROFILES
+from database.db import (
+    DATABASE_PATH, SessionLocal, create_sqlite_engine, engine as default_engine, get_engine_profile,
+)
+from database.models import Base
+from database.operations import DatabaseOperations
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_workload(user_id, readers, writers, duration):
+    """Run reader and writer threads for duration seconds and collect latencies"""
+    stop = threading.Event()
+    results = {'read': [], 'write': [], 'errors': 0}
+    lock = threading.Lock()
+
+    def reader():
+        latencies = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            DatabaseOperations.get_recent_activities(user_id, 50)
+            DatabaseOperations.get_completed_tutorials(user_id)
+            latencies.append(time.perf_counter() - start)
+        with lock:
+            results['read'].extend(latencies)
+
+    def writer():
+        latencies, errors = [], 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            if not DatabaseOperations.track_activity(user_id, 'tool_viewed', 'bench', {'bench': True}):
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+        with lock:
+            results['write'].extend(latencies)
+            results['errors'] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def benchmark_profile(name, source_db, tmp_dir, readers, writers, duration):
+    """Benchmark one profile against a fresh copy of the database"""
+    db_path = Path(tmp_dir) / f"{name}.db"
+    if source_db.exists():
+        shutil.copy(source_db, db_path)
+
+    engine = create_sqlite_engine(f"sqlite:///{db_path}", get_engine_profile(name))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+    try:
+        user = DatabaseOperations.get_user_by_username('default_user')
+        user_id = user['id'] if user else DatabaseOperations.create_user(username='default_user')['id']
+        return run_workload(user_id, readers, writers, duration)
+    finally:
+        SessionLocal.configure(bind=default_engine)
+        engine.dispose()
+
+
+def main(readers=8, writers=2, duration=3.0):
+    """Compare every configured profile"""
+    print("🚀 AI Nexus Database Engine Benchmark")
+    print("=" * 70)
+    print(f"Source: {DATABASE_PATH} (copied, never modified)")
+    print(f"{readers} readers + {writers} writers for {duration:.0f}s per profile\n")
+    print(f"{'Profile':<12}{'reads/s':>9}{'read p95 ms':>13}{'writes/s':>10}{'write p95 ms':>14}{'errors':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in DB_ENGINE_PROFILES:
+            results = benchmark_profile(name, DATABASE_PATH, tmp_dir, readers, writers, duration)
+            print(
+                f"{name:<12}"
+                f"{len(results['read']) / duration:>9.0f}"
+                f"{percentile(results['read'], 95) * 1000:>13.2f}"
+                f"{len(results['write']) / duration:>10.0f}"
+                f"{percentile(results['write'], 95) * 1000:>14.2f}"
+                f"{results['errors']:>8}"
+            )
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+AI Nexus - Database Session Benchmark
+Compares connection checkouts and durable commits for one simulated
+dashboard render with a session per call versus a shared unit of work
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event
+
+from database.db import SessionLocal, create_sqlite_engine, engine as default_engine
+from database.models import Base
+from database.operations import DatabaseOperations
+
+
+def simulate_render(user_id):
+    """Issue the calls one dashboard rerun makes after a tool view and a favorite"""
+    DatabaseOperations.track_activity(user_id, 'tool_viewed', 'cursor', {'name': 'Cursor'})
+    DatabaseOperations.add_favorite(user_id, 'tool', 'cursor', {'name': 'Cursor'})
+    DatabaseOperations.track_activity(user_id, 'favorite_added', 'cursor', {'type': 'tool'})
+
+    DatabaseOperations.get_user_stats(user_id)
+    DatabaseOperations.get_completed_tutorials(user_id)
+    DatabaseOperations.get_saved_prompts(user_id)
+    DatabaseOperations.get_favorites(user_id)
+    DatabaseOperations.get_completed_tutorials(user_id)
+    DatabaseOperations.get_recent_activities(user_id, 50)
+    DatabaseOperations.get_recent_activities(user_id, 5)
+    DatabaseOperations.get_saved_prompts(user_id)
+    DatabaseOperations.get_favorites(user_id, 'tools')
+    DatabaseOperations.get_completed_tutorials(user_id)
+    for tool_id in ('cursor', 'copilot', 'claude', 'chatgpt'):
+        DatabaseOperations.is_favorite(user_id, 'tool', tool_id)
+
+
+def measure(engine, user_id, use_unit_of_work, renders):
+    """Run the simulated render and count pool checkouts and writing commits"""
+    counts = {'checkouts': 0, 'commits': 0}
+
+    def on_checkout(*args):
+        counts['checkouts'] += 1
+
+    def on_commit(conn):
+        # pysqlite only opens a transaction for writes, so this is one fsync'd commit
+        if conn.connection.dbapi_connection.in_transaction:
+            counts['commits'] += 1
+
+    event.listen(engine.pool, 'checkout', on_checkout)
+    event.listen(engine, 'commit', on_commit)
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        if use_unit_of_work:
+            with DatabaseOperations():
+                simulate_render(user_id)
+        else:
+            simulate_render(user_id)
+    elapsed = time.perf_counter() - start
+
+    event.remove(engine.pool, 'checkout', on_checkout)
+    event.remove(engine, 'commit', on_commit)
+
+    return {key: value / renders for key, value in counts.items()}, elapsed / renders
+
+
+def main(renders=50):
+    """Run the benchmark against a scratch copy of the schema"""
+    print("🚀 AI Nexus Database Session Benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp_dir) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+        try:
+            user_id = DatabaseOperations.create_user(username='bench_user')['id']
+
+            results = [
+                ("Session per call", *measure(engine, user_id, False, renders)),
+                ("Unit of work", *measure(engine, user_id, True, renders)),
+            ]
+        finally:
+            SessionLocal.configure(bind=default_engine)
+            engine.dispose()
+
+    print(f"{'Mode':<18}{'checkouts':>10}{'commits':>10}{'ms/render':>12}")
+    for name, counts, seconds in results:
+        print(f"{name:<18}{counts['checkouts']:>10.1f}{counts['commits']:>10.1f}{seconds * 1000:>12.2f}")
+    print("=" * 50)
+    print("commits = writing transactions, i.e. journal fsyncs per render")
+
+
+if __name__ == "__main__":
+    main()
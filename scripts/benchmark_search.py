@@ -0,0 +1,103 @@
+"""
+AI Nexus - Global Search Benchmark
+Compares the per-catalog substring scans with the BM25 inverted index,
+on the real content and on a synthetic corpus scaled up 100x, then
+replays as-you-type keystrokes against the cached search service
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from data.ai_hacks import search_hacks
+from data.final_assets import search_tools
+from data.final_prompts import search_prompts
+from data.final_tutorials import search_tutorials
+from data.search_index import SearchIndex, iter_documents
+from data.search_service import SearchService
+
+QUERIES = ["rag", "sql query", "chatgpt", "langchain agents", "prompt engineering", "vector database",
+           "code review", "test automation", "pinec", "llm"]
+
+
+def scan_all(query):
+    """What render_search_results (plus the hacks page) used to do"""
+    return search_prompts(query) + search_tools(query) + search_tutorials(query) + search_hacks(query)
+
+
+def median_us(fn, repeat):
+    """Median microseconds per call over all QUERIES"""
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            fn(query)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples), max(samples)
+
+
+def main(scale=100, repeat=50):
+    """Run both comparisons"""
+    print("🚀 AI Nexus Global Search Benchmark")
+    print("=" * 64)
+
+    documents = list(iter_documents())
+    index = SearchIndex.build(documents)
+    scan_med, scan_max = median_us(scan_all, repeat)
+    index_med, index_max = median_us(lambda q: index.search(q, limit=50), repeat)
+
+    print(f"Real content: {len(index)} documents, {len(index.postings):,} terms, "
+          f"built in {index.build_ms:.1f} ms\n")
+    print(f"{'Method':<28}{'median µs':>12}{'max µs':>12}")
+    print(f"{'Substring scans (4 catalogs)':<28}{scan_med:>12.1f}{scan_max:>12.1f}")
+    print(f"{'BM25 index (ranked)':<28}{index_med:>12.1f}{index_max:>12.1f}")
+
+    synthetic = [
+        (kind, dict(record, id=f"{record.get('id')}-{i}"), fields)
+        for i in range(scale) for kind, record, fields in documents
+    ]
+    big = SearchIndex.build(synthetic)
+
+    def scan_big(query):
+        q = query.lower()
+        return [r for _, r, f in synthetic if any(q in text.lower() for text in f.values())]
+
+    scan_med, _ = median_us(scan_big, 1)
+    index_med, _ = median_us(lambda q: big.search(q, limit=50), 5)
+    print(f"\n{scale}x corpus: {len(big):,} documents, built in {big.build_ms:.0f} ms")
+    print(f"{'Substring scan':<28}{scan_med:>12.1f}")
+    print(f"{'BM25 index (top 50)':<28}{index_med:>12.1f}")
+
+    # Every prefix of every query, as a page search box sees it while typing
+    keystrokes = [query[:end] for query in QUERIES for end in range(1, len(query) + 1)]
+    service = SearchService()
+    loaded = [(r, f) for _, r, f in synthetic]
+    service.register('all', lambda: loaded)
+    service.search('all', "warm-up")
+
+    def replay(search):
+        samples = []
+        for keystroke in keystrokes:
+            start = time.perf_counter()
+            search(keystroke)
+            samples.append((time.perf_counter() - start) * 1e6)
+        return statistics.median(samples), statistics.mean(samples)
+
+    scan_med, scan_mean = replay(scan_big)
+    service_med, service_mean = replay(lambda q: service.search('all', q))
+    stats = service.stats()
+    print(f"\nAs-you-type on the {scale}x corpus: {len(keystrokes)} keystrokes")
+    print(f"{'Method':<28}{'median µs':>12}{'mean µs':>12}")
+    print(f"{'Substring scan':<28}{scan_med:>12.1f}{scan_mean:>12.1f}")
+    print(f"{'Search service':<28}{service_med:>12.1f}{service_mean:>12.1f}")
+    print(f"   hit rate {stats['hit_rate']:.0%}, narrowed {stats['narrow_rate']:.0%}, "
+          f"{stats['misses']} full scans")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
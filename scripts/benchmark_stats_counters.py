@@ -0,0 +1,81 @@
+"""
+AI Nexus - Stats Counter Benchmark
+Hammers UserStats counters from a thread pool and compares the old
+read-modify-write update with the SQL-side upsert in increment_stats
+"""
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from database.db import (
+    SessionLocal, close_db_session, create_sqlite_engine, engine as default_engine, get_db_session,
+)
+from database.models import Base, UserStats
+from database.operations import DatabaseOperations
+
+
+def read_modify_write(user_id, **deltas):
+    """The previous _update_stats: read the row, add in Python, write it back"""
+    db = get_db_session()
+    try:
+        stats = db.query(UserStats).filter(UserStats.user_id == user_id).first()
+        for key, value in deltas.items():
+            setattr(stats, key, (getattr(stats, key) or 0) + value)
+        db.commit()
+        return True
+    except Exception:
+        db.rollback()
+        return False
+    finally:
+        close_db_session(db)
+
+
+def hammer(increment, user_id, workers, per_worker):
+    """Run increments from a thread pool and return (applied, lost, seconds)"""
+    def run(_):
+        return sum(bool(increment(user_id, tools_favorited=1)) for _ in range(per_worker))
+
+    before = DatabaseOperations.get_user_stats(user_id).tools_favorited
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        succeeded = sum(pool.map(run, range(workers)))
+    elapsed = time.perf_counter() - start
+    applied = DatabaseOperations.get_user_stats(user_id).tools_favorited - before
+    return applied, succeeded - applied, elapsed
+
+
+def main(workers=8, per_worker=100):
+    """Run the benchmark against a scratch database"""
+    print("🚀 AI Nexus Stats Counter Benchmark")
+    print("=" * 50)
+    total = workers * per_worker
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp_dir) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+        try:
+            user_id = DatabaseOperations.create_user(username='bench_user')['id']
+            results = [
+                ("Read-modify-write", *hammer(read_modify_write, user_id, workers, per_worker)),
+                ("increment_stats", *hammer(DatabaseOperations.increment_stats, user_id, workers, per_worker)),
+            ]
+        finally:
+            SessionLocal.configure(bind=default_engine)
+            engine.dispose()
+
+    print(f"{workers} threads x {per_worker} increments = {total}")
+    print(f"{'Mode':<20}{'applied':>9}{'lost':>7}{'us/increment':>14}")
+    for name, applied, lost, seconds in results:
+        print(f"{name:<20}{applied:>9}{lost:>7}{seconds / total * 1e6:>14.0f}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+AI Nexus - Trending Topics Benchmark
+Feeds 100k synthetic headlines through the incremental trending engine and
+compares its top-K reads with recounting the headlines on every read
+"""
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.settings import NEWS_TRENDING_HALF_LIFE_HOURS
+from data.trending import TrendingEngine, headline_terms
+
+TOPICS = ["GPT-5", "Claude", "Gemini", "Llama 4", "open source", "AI agents", "robotics", "chip export",
+          "EU AI Act", "diffusion model", "reasoning model", "data center", "humanoid robot", "copyright lawsuit",
+          "quantum computing", "inference costs", "model weights", "safety research", "coding assistant", "RAG"]
+VERBS = ["launches", "tops", "faces", "expands", "beats", "delays", "reshapes", "doubles", "questions", "unveils"]
+OBJECTS = ["benchmark", "funding round", "developer tools", "enterprise deal", "pricing", "regulators",
+           "startup", "leaderboard", "partnership", "hardware roadmap", "research paper", "API"]
+
+
+def synthetic_headlines(count, days=30, seed=42):
+    """Headlines spread over days; the popular topics drift so the trending list changes over time"""
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+    step = timedelta(days=days) / count
+    for i in range(count):
+        # Zipf-like popularity whose ranking rotates every few days
+        shift = int(i / count * days / 3)
+        ranks = [1 / ((r - shift) % len(TOPICS) + 1) for r in range(len(TOPICS))]
+        topic = rng.choices(TOPICS, weights=ranks)[0]
+        title = f"{topic} {rng.choice(VERBS)} {rng.choice(OBJECTS)} #{rng.randrange(5000)}"
+        yield title, start + step * i
+
+
+def recount_top(headlines, k, now):
+    """Full recount with the same decay: what every read costs without incremental counters"""
+    rate = math.log(2) / (NEWS_TRENDING_HALF_LIFE_HOURS * 3600)
+    counts = Counter()
+    for title, when in headlines:
+        weight = math.exp(-rate * (now - when.timestamp()))
+        for term in set(headline_terms(title)):
+            counts[term] += weight
+    return counts.most_common(k)
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main(count=100_000):
+    """Ingest count headlines, then time reads, recounts and persistence"""
+    print("🚀 AI Nexus Trending Topics Benchmark")
+    print("=" * 60)
+    headlines = list(synthetic_headlines(count))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = TrendingEngine(path=Path(tmp) / "trending.json")
+        start = time.perf_counter()
+        for title, when in headlines:
+            engine.add(title, when)
+        ingest_s = time.perf_counter() - start
+        print(f"📥 Ingested {count:,} headlines in {ingest_s:.2f}s "
+              f"({ingest_s / count * 1e6:.1f} µs/headline), {len(engine):,} counters kept")
+
+        now = time.time()
+        top_us = median_us(lambda: engine.top(10, now=now), 200)
+        recount_ms = median_us(lambda: recount_top(headlines, 10, now), 3) / 1000
+        print(f"📊 top(10) read:       {top_us:>10.1f} µs")
+        print(f"🔁 Full recount:       {recount_ms:>10.1f} ms  ({recount_ms * 1000 / top_us:,.0f}x slower)")
+
+        start = time.perf_counter()
+        engine.save()
+        save_ms = (time.perf_counter() - start) * 1000
+        restored = TrendingEngine(path=engine.path)
+        start = time.perf_counter()
+        restored.load()
+        load_ms = (time.perf_counter() - start) * 1000
+        size_kb = engine.path.stat().st_size / 1024
+        print(f"💾 Save {save_ms:.1f} ms, load {load_ms:.1f} ms, {size_kb:,.0f} KB on disk")
+
+        # The heap holds only the leaders; check they are the true leaders after compaction too
+        exact = [term for term, _ in recount_top(headlines, 20, now)]
+        ranked = [term for _, term in sorted(((w, t) for t, w in engine._in_heap.items()), reverse=True)]
+        overlap = len(set(exact[:10]) & set(ranked[:10]))
+        print(f"✅ Top-10 agreement with the full recount: {overlap}/10")
+        print("\nTrending now:")
+        for term, weight in engine.top(10, now=now):
+            print(f"   {term:<24}{weight:>10.1f}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+AI Nexus - Tutorial Content Store Benchmark
+Measures import time and memory of the lazy tutorial store in fresh
+interpreters: import only, viewing one tutorial, and loading everything
+(what the old all-in-one TUTORIAL_CONTENT dict kept resident)
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# Modules every page has loaded anyway, so they don't count against the store
+PRELUDE = (
+    "import time, tracemalloc, typing, json, functools, collections.abc, pathlib, logging\n"
+    "import config.settings, data\n"
+    "tracemalloc.start()\n"
+    "start = time.perf_counter()\n"
+)
+REPORT = "\nprint((time.perf_counter() - start) * 1000, tracemalloc.get_traced_memory()[0] / 1024)\n"
+
+CASES = {
+    "Import only": "from data.tutorial_content import TUTORIAL_CONTENT",
+    "View one tutorial": (
+        "from data.tutorial_content import TUTORIAL_CONTENT\n"
+        "[s['content'] for s in TUTORIAL_CONTENT.get('qw-1')['sections']]"
+    ),
+    "Load every section": (
+        "from data.tutorial_content import TUTORIAL_CONTENT\n"
+        "everything = {tid: [s['content'] for s in c['sections']] for tid, c in TUTORIAL_CONTENT.items()}"
+    ),
+}
+
+
+def measure(code, runs):
+    """Median (ms, KB) over runs fresh interpreters"""
+    ms, kb = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PRELUDE + code + REPORT],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        ms.append(float(out[0]))
+        kb.append(float(out[1]))
+    return statistics.median(ms), statistics.median(kb)
+
+
+def main(runs=15):
+    """Run every case and print a table"""
+    print("🚀 AI Nexus Tutorial Content Store Benchmark")
+    print("=" * 56)
+    print(f"{'Case':<24}{'median ms':>14}{'traced KB':>14}")
+    for name, code in CASES.items():
+        ms, kb = measure(code, runs)
+        print(f"{name:<24}{ms:>14.2f}{kb:>14.1f}")
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ def generate_content_report():
         from data.final_assets import get_all_tools
         from data.ai_hacks import get_all_hacks
         from data.ai_news import get_all_news, get_trending_topics
+        from data.news_ingest import get_news_ingestor
+        from data.feed_health import OPEN, describe
         
         tutorials = get_all_tutorials()
         prompts = get_all_prompts()
@@ -27,6 +29,7 @@ def generate_content_report():
         hacks = get_all_hacks()
         news = get_all_news()
         trending = get_trending_topics()
+        feed_health = get_news_ingestor().snapshot().health
         
         report = f"""
 # AI Nexus Content Report
@@ -143,6 +146,17 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             for topic in trending[:5]:
                 report += f"- {topic['topic']}: {topic['count']} mentions\n"
         
+        if feed_health:
+            report += "\n### Feed Health\n"
+            report += "| Source | State | Avg latency | Success rate | Poll interval | Last error |\n"
+            report += "|--------|-------|-------------|--------------|---------------|------------|\n"
+            for name, health in sorted(feed_health.items()):
+                latency = f"{health['latency_ms']:.0f} ms" if health.get('latency_ms') is not None else "-"
+                success = f"{health['success_rate']:.0%}" if health.get('success_rate') is not None else "-"
+                error = (health.get('last_error') or "-") if health['consecutive_failures'] else "-"
+                report += (f"| {name} | {health['state']} | {latency} | {success} "
+                           f"| {health['poll_interval'] / 60:.0f} min | {error[:60].replace('|', '/')} |\n")
+        
         # Recommendations
         report += "\n---\n\n## 💡 Recommendations\n\n"
         
@@ -166,6 +180,10 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             if min_tut_cat < 3:
                 recommendations.append("- Balance tutorial categories (some have < 3 items)")
         
+        for name, health in sorted(feed_health.items()):
+            if health['state'] == OPEN:
+                recommendations.append(f"- Check the feed URL of {name} ({describe(health)})")
+        
         if hack_tools:
             if len(hack_tools) < 8:
                 recommendations.append("- Add hacks for more AI tools (currently covering " + str(len(hack_tools)) + " tools)")
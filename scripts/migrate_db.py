@@ -0,0 +1,69 @@
+"""
+AI Nexus - Database Migration Script
+Shows schema version status and applies pending migrations
+
+Usage:
+    python scripts/migrate_db.py status
+    python scripts/migrate_db.py upgrade [--target N]
+    python scripts/migrate_db.py upgrade --db path/to/other.db
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from database.db import DATABASE_PATH, create_sqlite_engine
+from database.migrate import applied_migrations, current_version, discover_migrations, migrate
+
+
+def print_status(engine):
+    """Print applied and pending migrations"""
+    version = current_version(engine)
+    applied = {row['version']: row for row in applied_migrations(engine)}
+
+    print(f"📊 Schema version: {version}")
+    print("=" * 50)
+    for migration in discover_migrations():
+        row = applied.get(migration.version)
+        if row:
+            print(f"  ✅ {migration.name:<32} applied {row['applied_at']} ({row['duration_ms'] or 0:.0f} ms)")
+        else:
+            print(f"  ⏳ {migration.name:<32} pending - {migration.description}")
+    print("=" * 50)
+
+
+def main():
+    """Parse arguments and run the requested command"""
+    parser = argparse.ArgumentParser(description="AI Nexus schema migrations")
+    parser.add_argument("command", choices=["status", "upgrade"])
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="SQLite database file")
+    parser.add_argument("--target", type=int, default=None, help="Stop after this version")
+    args = parser.parse_args()
+
+    engine = create_sqlite_engine(f"sqlite:///{Path(args.db).resolve()}")
+    print("🚀 AI Nexus Database Migrations")
+    print(f"Database: {args.db}\n")
+
+    try:
+        if args.command == "upgrade":
+            applied = migrate(engine, target=args.target)
+            if applied:
+                for migration in applied:
+                    print(f"✅ Applied {migration.name}")
+            else:
+                print("✅ Schema already up to date")
+            print()
+        print_status(engine)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
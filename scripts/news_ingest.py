@@ -0,0 +1,82 @@
+"""
+AI Nexus - News Ingestion Process
+Refreshes the RSS feeds into data/news_snapshot.json outside the Streamlit app
+
+Usage:
+    python scripts/news_ingest.py --once
+    python scripts/news_ingest.py                  # each source when due, checking at least every NEWS_REFRESH_INTERVAL_SECONDS
+    python scripts/news_ingest.py --interval 300
+
+Run the app with AINEXUS_NEWS_INGEST_IN_APP=0 so it only reads the snapshot this writes.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add root to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.settings import NEWS_REFRESH_INTERVAL_SECONDS
+from data.feed_health import describe
+from data.news_ingest import SNAPSHOT_PATH, NewsIngestor
+from database.db import upgrade_db
+
+
+def report(ingestor):
+    """Print one line per source for the last refresh"""
+    snapshot = ingestor.snapshot()
+    stats = ingestor.stats()
+    print(f"✅ {stats['articles']} articles at {snapshot.fetched_at:%Y-%m-%d %H:%M:%S} UTC "
+          f"({stats['last_refresh_ms']:.0f} ms, {stats['last_bytes'] / 1024:.1f} KB downloaded, "
+          f"{stats['last_parse_ms']:.1f} ms parsing, {stats['last_not_modified']} unchanged)")
+    print(f"   Fetched {stats['last_fetched_sources']} sources; stored {stats['last_inserted']} new articles, "
+          f"skipped {stats['last_duplicates']} syndicated duplicates")
+    for name, source in snapshot.sources.items():
+        if not source['ok']:
+            status = f"failed: {source['error']}"
+        elif source.get('not_modified'):
+            status = f"304 not modified, {source['articles']} articles kept"
+        else:
+            status = f"{source['articles']} articles, {source['bytes'] / 1024:.1f} KB, {source['parse_ms']:.1f} ms parse"
+        print(f"  {'✅' if source['ok'] else '❌'} {name}: {status} ({source['elapsed_ms']:.0f} ms)")
+        if name in snapshot.health:
+            print(f"      {describe(snapshot.health[name])}")
+
+
+def main():
+    """Parse arguments and refresh once or on a schedule"""
+    parser = argparse.ArgumentParser(description="AI Nexus news ingestion")
+    parser.add_argument("--once", action="store_true", help="Refresh a single time and exit")
+    parser.add_argument("--interval", type=float, default=NEWS_REFRESH_INTERVAL_SECONDS,
+                        help="Longest wait between checks for due sources")
+    parser.add_argument("--snapshot", default=str(SNAPSHOT_PATH), help="Where the snapshot is written")
+    args = parser.parse_args()
+
+    print("🚀 AI Nexus News Ingestion")
+    print("=" * 50)
+    if not upgrade_db():
+        print("❌ Could not bring the schema up to date")
+        return 1
+    ingestor = NewsIngestor(interval=args.interval, snapshot_path=Path(args.snapshot))
+    try:
+        # Only sources that are due (polling rate, failure backoff) are fetched; the state
+        # is kept in the snapshot, so repeated --once runs from cron schedule the same way
+        while True:
+            refreshes = ingestor.stats()['refreshes']
+            ingestor.refresh_once(scheduled=True)
+            if ingestor.stats()['refreshes'] > refreshes:
+                report(ingestor)
+            else:
+                print(f"⏳ No source due; next in {ingestor.health.next_due_in(ingestor.sources):.0f}s")
+            if args.once:
+                return 0
+            time.sleep(min(args.interval, max(1.0, ingestor.health.next_due_in(ingestor.sources))))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,9 +19,9 @@ def update_news_cache():
     print("🔄 Updating AI News cache...")
     
     try:
-        # Clear cache and fetch fresh news
-        import streamlit as st
-        st.cache_data.clear()
+        # Fetch fresh news into the snapshot the app reads (no other cache is touched)
+        from data.news_ingest import get_news_ingestor
+        get_news_ingestor().refresh()
         
         news = get_all_news()
         trending = get_trending_topics()
@@ -71,3 +71,37 @@ def sample_tool():
         "rating": 4.5,
         "icon": "🔧"
     }
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Point the session factory at a throwaway SQLite file for the test"""
+    from database.db import SessionLocal, create_sqlite_engine, engine as default_engine
+    from database.models import Base
+
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+    try:
+        yield engine
+    finally:
+        SessionLocal.configure(bind=default_engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def trending_engine(monkeypatch):
+    """In-memory trending engine standing in for the process-wide one (nothing written to data/)"""
+    from data import trending
+    engine = trending.TrendingEngine(path=None)
+    monkeypatch.setattr(trending, "_engine", engine)
+    return engine
+
+
+@pytest.fixture
+def feed_server():
+    """Local HTTP server serving fixture feeds (see tests/feed_server.py)"""
+    from tests.feed_server import FeedServer
+    server = FeedServer().start()
+    yield server
+    server.stop()
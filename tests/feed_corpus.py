@@ -0,0 +1,78 @@
+"""
+AI Nexus - Huge Feed Corpus
+Generators for oversized and hostile feeds, produced chunk by chunk so tests never hold them whole
+"""
+from typing import Iterator
+
+CHUNK = 64 * 1024
+
+RSS_HEAD = b'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel><title>Huge</title>'
+RSS_TAIL = b'</channel></rss>'
+
+
+def _item(n: int, description: bytes = b"Plain summary.") -> bytes:
+    return (b"<item><title>Story %d</title><link>https://example.com/story/%d</link>"
+            b"<description>%s</description><pubDate>Tue, 14 Oct 2025 09:30:00 GMT</pubDate></item>"
+            % (n, n, description))
+
+
+def _chunked(parts: Iterator[bytes]) -> Iterator[bytes]:
+    """Regroup parts into CHUNK-sized pieces, like a network read"""
+    buffer = b""
+    for part in parts:
+        buffer += part
+        while len(buffer) >= CHUNK:
+            yield buffer[:CHUNK]
+            buffer = buffer[CHUNK:]
+    if buffer:
+        yield buffer
+
+
+def many_items(count: int) -> Iterator[bytes]:
+    """A well-formed RSS feed with count items"""
+    def parts():
+        yield RSS_HEAD
+        for n in range(count):
+            yield _item(n)
+        yield RSS_TAIL
+    return _chunked(parts())
+
+
+def giant_summary(size: int) -> Iterator[bytes]:
+    """One item whose HTML description is size bytes long, then a normal item"""
+    def parts():
+        yield RSS_HEAD + b"<item><title>Giant</title><link>https://example.com/giant</link><description><![CDATA["
+        paragraph = b"<p>Scaling <b>laws</b> &amp; routing.</p>" * 1000
+        for _ in range(size // len(paragraph)):
+            yield paragraph
+        yield b"]]></description></item>" + _item(1) + RSS_TAIL
+    return _chunked(parts())
+
+
+def no_entries(size: int) -> Iterator[bytes]:
+    """A channel with a size-byte description and no items at all"""
+    def parts():
+        yield RSS_HEAD + b"<description>"
+        filler = b"x" * CHUNK
+        for _ in range(size // CHUNK):
+            yield filler
+        yield b"</description>" + RSS_TAIL
+    return _chunked(parts())
+
+
+def billion_laughs() -> Iterator[bytes]:
+    """Nested entity expansion that would grow to gigabytes if expanded"""
+    entities = [b'<!ENTITY lol0 "lol">']
+    entities += [b'<!ENTITY lol%d "%s">' % (i, b"&lol%d;" % (i - 1) * 10) for i in range(1, 10)]
+    yield (b'<?xml version="1.0"?>\n<!DOCTYPE rss [' + b"".join(entities) + b"]>"
+           b"<rss><channel><item><title>&lol9;</title></item></channel></rss>")
+
+
+def truncated(count: int) -> Iterator[bytes]:
+    """count good items followed by a broken tail"""
+    yield RSS_HEAD + b"".join(_item(n) for n in range(count)) + b"<item><title>Bro"
+
+
+def body(chunks: Iterator[bytes]) -> bytes:
+    """A generated feed as one body, for serving it from tests/feed_server.py"""
+    return b"".join(chunks)
@@ -0,0 +1,107 @@
+"""
+AI Nexus - Local Feed Server
+Serves fixture feeds over HTTP with injected delays and failures, for the news fetcher tests
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+import threading
+import time
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "feeds"
+
+
+class FeedServer:
+    """
+    Threaded HTTP server on 127.0.0.1 with one configurable response per path.
+
+    Usage:
+        server = FeedServer().start()
+        server.route('/slow.xml', fixture='rss.xml', delay=2.0)
+        url = server.url('/slow.xml')
+        ...
+        server.stop()
+    """
+
+    def __init__(self):
+        self.routes: Dict[str, Dict] = {}
+        self.requests: List[Dict] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> 'FeedServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def route(self, path: str, fixture: Optional[str] = None, body: bytes = b"", status: int = 200,
+              delay: float = 0.0, trickle: float = 0.0, headers: Optional[Dict[str, str]] = None):
+        """
+        Serve path with the given status and body (or a file from tests/fixtures/feeds).
+        delay sleeps before the response starts; trickle sleeps between 64-byte chunks of the body.
+        An ETag / Last-Modified in headers makes matching conditional requests get a 304.
+        """
+        if fixture is not None:
+            body = (FIXTURES_DIR / fixture).read_bytes()
+        with self._lock:
+            self.routes[path] = {'body': body, 'status': status, 'delay': delay,
+                                 'trickle': trickle, 'headers': dict(headers or {})}
+
+    def hits(self, path: str) -> List[Dict]:
+        """Request headers received for path, oldest first"""
+        with self._lock:
+            return [r['headers'] for r in self.requests if r['path'] == path]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append({'path': self.path, 'headers': dict(self.headers)})
+                    route = server.routes.get(self.path)
+                if route is None:
+                    self.send_error(404)
+                    return
+                time.sleep(route['delay'])
+                if self._not_modified(route['headers']):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                try:
+                    self.send_response(route['status'])
+                    self.send_header('Content-Type', 'application/xml')
+                    self.send_header('Content-Length', str(len(route['body'])))
+                    for name, value in route['headers'].items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    if not route['trickle']:
+                        self.wfile.write(route['body'])
+                        return
+                    for i in range(0, len(route['body']), 64):
+                        self.wfile.write(route['body'][i:i + 64])
+                        self.wfile.flush()
+                        time.sleep(route['trickle'])
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client gave up on a slow route
+
+            def _not_modified(self, headers):
+                """Honour conditional requests against the route's ETag / Last-Modified headers"""
+                etag, last_modified = headers.get('ETag'), headers.get('Last-Modified')
+                if etag and self.headers.get('If-None-Match') == etag:
+                    return True
+                return bool(last_modified) and self.headers.get('If-Modified-Since') == last_modified
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
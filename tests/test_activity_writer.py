@@ -0,0 +1,74 @@
+"""
+AI Nexus - Activity Writer Tests
+Unit tests for the batched background activity writer
+"""
+import pytest
+
+from database.activity_writer import ActivityWriter
+from database.operations import DatabaseOperations
+
+
+@pytest.fixture
+def user_id(temp_db):
+    """Create a user in the temporary database"""
+    return DatabaseOperations.create_user(username="writer_user")['id']
+
+
+class TestActivityWriter:
+    """Tests for ActivityWriter"""
+
+    def test_flush_writes_queued_events_in_batches(self, user_id):
+        """Queued events should land in the activities table in batch_size chunks"""
+        writer = ActivityWriter(batch_size=10, flush_interval=60)
+        writer.start()
+        try:
+            for i in range(25):
+                assert writer.enqueue(user_id, 'tool_viewed', f'tool-{i}', {'n': i})
+            assert writer.flush()
+
+            stats = writer.stats()
+            assert stats['written'] == 25
+            assert stats['queue_depth'] == 0
+            assert stats['flushes'] == 3
+            assert len(DatabaseOperations.get_recent_activities(user_id, 100)) == 25
+            assert DatabaseOperations.get_user_stats(user_id).last_activity_date is not None
+        finally:
+            writer.close()
+
+    def test_full_queue_drops_instead_of_blocking(self, user_id):
+        """A full buffer should reject new events and count them as dropped"""
+        writer = ActivityWriter(max_queue_size=3)  # not started, so nothing drains
+
+        results = [writer.enqueue(user_id, 'tool_viewed', str(i)) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert writer.stats()['dropped'] == 2
+        assert writer.stats()['queue_depth'] == 3
+
+    def test_close_flushes_pending_events(self, user_id):
+        """Closing the writer should write everything still queued"""
+        writer = ActivityWriter(batch_size=1000, flush_interval=60)
+        writer.start()
+        for i in range(7):
+            writer.enqueue(user_id, 'prompt_viewed', f'p-{i}')
+
+        writer.close()
+
+        assert not writer.is_running()
+        assert len(DatabaseOperations.get_recent_activities(user_id, 100)) == 7
+
+    def test_failed_batch_is_counted(self, user_id, monkeypatch):
+        """A failing bulk insert should be recorded, not crash the worker"""
+        def broken_insert(events):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(DatabaseOperations, 'bulk_track_activities', staticmethod(broken_insert))
+        writer = ActivityWriter(flush_interval=60)
+        writer.start()
+        try:
+            writer.enqueue(user_id, 'tool_viewed', 'x')
+            assert writer.flush()
+            assert writer.stats()['failed'] == 1
+            assert writer.is_running()
+        finally:
+            writer.close()
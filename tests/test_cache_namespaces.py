@@ -0,0 +1,104 @@
+"""
+AI Nexus - Cache Namespace Tests
+Invalidating one domain's version token leaves the other domains' cached entries warm
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from components.fragment_cache import FragmentCache
+from data.search_service import SearchService
+from database.operations import DatabaseOperations
+from database.user_cache import UserStateCache
+from utils.cache_namespaces import CATALOGS, NEWS, USERS, CacheNamespaces
+
+ARTICLES = [({'link': 'a-1'}, {'title': "Open model release"})]
+PROMPTS = [({'id': 'p-1'}, {'title': "SQL Query Optimizer"})]
+
+
+@pytest.fixture
+def namespaces():
+    return CacheNamespaces()
+
+
+class TestFragmentNamespaces:
+    """Tests for card fragments keyed by namespace version"""
+
+    def test_invalidating_news_keeps_catalog_cards(self, namespaces):
+        cache = FragmentCache(namespaces=namespaces)
+        render = MagicMock(return_value="<div/>")
+        for kind in ('news', 'prompt'):
+            cache.get_or_render(kind, 'x', 1, 'default', render)
+
+        namespaces.invalidate(NEWS)
+        for kind in ('news', 'prompt'):
+            cache.get_or_render(kind, 'x', 1, 'default', render)
+
+        assert render.call_count == 3
+        stats = namespaces.stats()
+        assert stats[NEWS]['version'] == 1 and stats[NEWS]['misses'] == 2
+        assert stats[CATALOGS]['hits'] == 1 and stats[CATALOGS]['misses'] == 1
+
+    def test_evictions_are_counted_per_namespace(self, namespaces):
+        cache = FragmentCache(max_entries=1, namespaces=namespaces)
+        cache.get_or_render('news', 'a', 1, 'default', lambda: "a")
+        cache.get_or_render('tool', 'b', 1, 'default', lambda: "b")
+        assert namespaces.stats()[NEWS]['evictions'] == 1
+        assert namespaces.stats()[CATALOGS]['evictions'] == 0
+
+
+class TestSearchNamespaces:
+    """Tests for search scopes reloading on their namespace only"""
+
+    def test_news_invalidation_reloads_only_news(self, namespaces):
+        news_loader, prompt_loader = MagicMock(return_value=ARTICLES), MagicMock(return_value=PROMPTS)
+        service = SearchService(namespaces=namespaces)
+        service.register('news', news_loader)
+        service.register('prompt', prompt_loader)
+        for scope in ('news', 'prompt'):
+            service.search(scope, "open")
+
+        namespaces.invalidate(NEWS)
+        assert service.search('news', "open") == [{'link': 'a-1'}]
+        service.search('prompt', "open")
+
+        assert news_loader.call_count == 2
+        assert prompt_loader.call_count == 1
+        assert namespaces.stats()[CATALOGS]['hits'] == 1
+        assert namespaces.stats()[NEWS]['hits'] == 0
+
+
+class TestUserNamespace:
+    """Tests for user snapshots expiring with the users namespace"""
+
+    def test_invalidating_users_reloads_entries(self, temp_db, namespaces):
+        user_id = DatabaseOperations.create_user(username="namespace_user")['id']
+        cache = UserStateCache(namespaces=namespaces)
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        namespaces.invalidate(USERS)
+        cache.is_favorite(user_id, 'tools', 'cursor')
+
+        assert cache.stats()['loads'] == 2
+        assert namespaces.stats()[USERS]['hits'] == 1
+        assert namespaces.stats()[USERS]['misses'] == 2
+
+
+class TestAdminPage:
+    """Tests for the cache admin page"""
+
+    def test_invalidate_button_bumps_one_namespace(self):
+        from streamlit.testing.v1 import AppTest
+        from utils.cache_namespaces import get_cache_namespaces
+
+        before = get_cache_namespaces().stats()
+        at = AppTest.from_string("""
+from pages import cache_admin
+cache_admin.render()
+""").run()
+        assert not at.exception
+        at.button(key="cache_invalidate_news").click().run()
+
+        after = get_cache_namespaces().stats()
+        assert after[NEWS]['version'] == before[NEWS]['version'] + 1
+        assert after[CATALOGS]['version'] == before[CATALOGS]['version']
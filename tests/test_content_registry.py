@@ -0,0 +1,75 @@
+"""
+AI Nexus - Content Registry Tests
+The indexed get_* functions should return exactly what the old linear scans did
+"""
+from data.ai_hacks import AI_HACKS, get_hack_by_id, get_hacks_by_category, get_hacks_by_difficulty, get_hacks_by_tool
+from data.content_registry import ContentCatalog, get_all_catalogs
+from data.final_assets import AI_TOOLS_DATABASE, get_featured_tools, get_tool_by_id, get_tools_by_category
+from data.final_prompts import PROMPTS_DATABASE, get_prompts_by_category, get_prompts_by_difficulty
+from data.final_tutorials import (
+    REAL_TUTORIALS_DB, get_tutorial_by_id, get_tutorials_by_category, get_tutorials_by_difficulty,
+    get_tutorials_by_role,
+)
+
+
+class TestIndexedLookupsMatchScans:
+    """Every facet value should give the same records, in the same order, as a scan"""
+
+    def test_prompts(self):
+        for category in {p['category'] for p in PROMPTS_DATABASE}:
+            assert get_prompts_by_category(category.upper()) == \
+                [p for p in PROMPTS_DATABASE if p['category'].lower() == category.lower()]
+        for difficulty in {p['difficulty'] for p in PROMPTS_DATABASE}:
+            assert get_prompts_by_difficulty(difficulty) == \
+                [p for p in PROMPTS_DATABASE if p['difficulty'] == difficulty]
+
+    def test_tools(self):
+        for category in {t['category'] for t in AI_TOOLS_DATABASE}:
+            assert get_tools_by_category(category) == [t for t in AI_TOOLS_DATABASE if t['category'] == category]
+        assert get_featured_tools() == [t for t in AI_TOOLS_DATABASE if t.get('is_featured')]
+        assert all(get_tool_by_id(t['id']) is t for t in AI_TOOLS_DATABASE)
+
+    def test_tutorials(self):
+        for tutorial in REAL_TUTORIALS_DB:
+            assert get_tutorial_by_id(tutorial['id']) is tutorial
+            for role in tutorial['role']:
+                assert get_tutorials_by_role(role) == [t for t in REAL_TUTORIALS_DB if role in t['role']]
+            assert get_tutorials_by_category(tutorial['category']) == \
+                [t for t in REAL_TUTORIALS_DB if t['category'].lower() == tutorial['category'].lower()]
+            assert get_tutorials_by_difficulty(tutorial['difficulty']) == \
+                [t for t in REAL_TUTORIALS_DB if t['difficulty'] == tutorial['difficulty']]
+        assert get_tutorial_by_id('missing') is None
+
+    def test_hacks(self):
+        for hack in AI_HACKS:
+            assert get_hack_by_id(hack['id']) is hack
+            assert get_hacks_by_category(hack['category']) == \
+                [h for h in AI_HACKS if h['category'].lower() == hack['category'].lower()]
+            assert get_hacks_by_tool(hack['tool']) == [h for h in AI_HACKS if h['tool'].lower() == hack['tool'].lower()]
+            assert get_hacks_by_difficulty(hack['difficulty'].lower()) == \
+                [h for h in AI_HACKS if h['difficulty'].lower() == hack['difficulty'].lower()]
+
+
+class TestContentCatalog:
+    """Tests for the ContentCatalog building blocks"""
+
+    def test_all_catalogs_registered(self):
+        """Each content module should register its catalog on import"""
+        assert set(get_all_catalogs()) == {'prompts', 'tools', 'tutorials', 'hacks'}
+
+    def test_include_filter_and_rebuild(self):
+        """Filtered-out records shouldn't appear in facets; rebuild picks up new records"""
+        items = [{'id': 'a', 'tags': ['X']}, {'id': 'ghost', 'tags': ['x']}]
+        catalog = ContentCatalog(items, facets={'tag': ('tags', True)}, include=lambda i: i['id'] != 'ghost')
+        assert catalog.lookup('tag', 'x') == [items[0]]
+
+        items.append({'id': 'b', 'tags': ['x', 'y']})
+        catalog.rebuild()
+        assert [i['id'] for i in catalog.lookup('tag', 'X')] == ['a', 'b']
+        assert catalog.lookup('tag', 'missing') == []
+
+    def test_ranked_is_sorted_and_cached(self):
+        """ranked() should sort once and reuse the result"""
+        catalog = ContentCatalog([{'id': 'a', 'uses': 1}, {'id': 'b', 'uses': 5}])
+        assert [i['id'] for i in catalog.ranked('uses')] == ['b', 'a']
+        assert catalog.ranked('uses') is catalog.ranked('uses')
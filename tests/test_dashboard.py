@@ -0,0 +1,35 @@
+"""
+AI Nexus - Dashboard Page Tests
+Full renders of the dashboard page with Streamlit's AppTest
+"""
+from streamlit.testing.v1 import AppTest
+
+from database.operations import DatabaseOperations
+
+
+def _dashboard_app():
+    from pages import dashboard
+    dashboard.render()
+
+
+class TestDashboardRender:
+    """Tests for rendering the whole dashboard"""
+
+    def test_renders_for_user_with_progress(self, temp_db):
+        user_id = DatabaseOperations.create_user(username="dashboard_user")['id']
+        DatabaseOperations.mark_tutorial_complete(user_id, 'qw-001')
+
+        at = AppTest.from_function(_dashboard_app)
+        at.session_state['user_id'] = user_id
+        at.session_state['user_profile'] = {'role': "Developer"}
+        at.run()
+
+        assert not at.exception
+        assert any("Export Your Data" in e.label for e in at.expander)
+
+    def test_renders_without_a_user(self, temp_db):
+        at = AppTest.from_function(_dashboard_app)
+        at.session_state['user_profile'] = {'role': "Developer"}
+        at.run()
+
+        assert not at.exception
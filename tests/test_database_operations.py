@@ -0,0 +1,208 @@
+"""
+AI Nexus - Database Operations Tests
+Unit tests for DatabaseOperations against a temporary SQLite file
+"""
+import dataclasses
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import event
+
+from database.db import get_db_context
+from database.models import UserStats
+from database.operations import DatabaseOperations
+
+
+@pytest.fixture
+def user_id(temp_db):
+    """Create a user in the temporary database"""
+    return DatabaseOperations.create_user(username="uow_user", email="uow@example.com")['id']
+
+
+@pytest.fixture
+def db_events(temp_db):
+    """Count pool checkouts and durable (writing) commits on the temporary engine"""
+    counts = {'checkouts': 0, 'commits': 0}
+
+    def on_checkout(*args):
+        counts['checkouts'] += 1
+
+    def on_commit(conn):
+        # pysqlite only opens a transaction for writes; read-only commits are no-ops
+        if conn.connection.dbapi_connection.in_transaction:
+            counts['commits'] += 1
+
+    event.listen(temp_db, 'commit', on_commit)
+    event.listen(temp_db.pool, 'checkout', on_checkout)
+    yield counts
+    event.remove(temp_db, 'commit', on_commit)
+    event.remove(temp_db.pool, 'checkout', on_checkout)
+
+
+class TestWriteTransactions:
+    """Writes and their stats updates should land as one transaction"""
+
+    def test_add_favorite_updates_stats_in_one_commit(self, user_id, db_events):
+        """Favorite insert and tools_favorited bump should share one commit"""
+        assert DatabaseOperations.add_favorite(user_id, 'tool', 'cursor', {'name': 'Cursor'})
+
+        assert db_events['commits'] == 1
+        assert db_events['checkouts'] == 1
+        assert DatabaseOperations.get_user_stats(user_id).tools_favorited == 1
+
+    def test_mark_tutorial_complete_is_idempotent(self, user_id):
+        """Completing a tutorial twice should count once"""
+        assert DatabaseOperations.mark_tutorial_complete(user_id, 'qw-1')
+        assert DatabaseOperations.mark_tutorial_complete(user_id, 'qw-1')
+
+        assert DatabaseOperations.get_completed_tutorials(user_id) == ['qw-1']
+        assert DatabaseOperations.get_user_stats(user_id).tutorials_completed == 1
+
+    def test_failed_stats_update_rolls_back_insert(self, user_id, monkeypatch):
+        """A failing stats update should not leave a half-written favorite"""
+        def broken_update(*args, **kwargs):
+            raise RuntimeError("stats unavailable")
+
+        monkeypatch.setattr(DatabaseOperations, '_update_stats', staticmethod(broken_update))
+
+        assert not DatabaseOperations.add_favorite(user_id, 'tool', 'cursor', {})
+        assert not DatabaseOperations.is_favorite(user_id, 'tool', 'cursor')
+
+
+class TestUnitOfWork:
+    """Calls inside a unit of work should share one session"""
+
+    def test_calls_share_one_checkout(self, user_id, db_events):
+        """Many reads and writes should check out a single connection"""
+        with DatabaseOperations() as ops:
+            ops.add_favorite(user_id, 'tool', 'cursor', {})
+            ops.save_prompt(user_id, 'p-1', {})
+            ops.track_activity(user_id, 'tool_viewed', 'cursor')
+            ops.get_completed_tutorials(user_id)
+            ops.get_recent_activities(user_id)
+            DatabaseOperations.is_favorite(user_id, 'tool', 'cursor')
+
+        assert db_events['checkouts'] == 1
+        assert db_events['commits'] == 3
+
+    def test_writes_visible_to_later_reads(self, user_id):
+        """Reads later in the unit should see earlier writes"""
+        with DatabaseOperations() as ops:
+            ops.mark_tutorial_complete(user_id, 'qw-2')
+            assert ops.is_tutorial_complete(user_id, 'qw-2')
+
+    def test_nested_units_join_outer_session(self, user_id):
+        """A nested unit of work should reuse the outer session"""
+        with DatabaseOperations() as outer:
+            with DatabaseOperations() as inner:
+                assert inner.session is outer.session
+            assert outer.session is not None
+
+    def test_failed_write_keeps_earlier_writes(self, user_id, monkeypatch):
+        """A failing write should only roll back itself"""
+        with DatabaseOperations() as ops:
+            assert ops.add_favorite(user_id, 'prompt', 'p-1', {})
+
+            def broken_update(*args, **kwargs):
+                raise RuntimeError("stats unavailable")
+
+            monkeypatch.setattr(DatabaseOperations, '_update_stats', staticmethod(broken_update))
+            assert not ops.save_prompt(user_id, 'p-2', {})
+
+        assert DatabaseOperations.is_favorite(user_id, 'prompt', 'p-1')
+        assert DatabaseOperations.get_saved_prompts(user_id) == []
+
+
+class TestIncrementStats:
+    """SQL-side counter increments"""
+
+    def test_applies_several_deltas_at_once(self, user_id):
+        """All deltas should be applied in one call"""
+        assert DatabaseOperations.increment_stats(user_id, total_xp=50, tutorials_completed=2, level=1)
+
+        stats = DatabaseOperations.get_user_stats(user_id)
+        assert (stats.total_xp, stats.tutorials_completed, stats.level) == (50, 2, 2)
+
+    def test_creates_missing_stats_row(self, temp_db):
+        """Incrementing a user without a stats row should start from the defaults"""
+        user_id = DatabaseOperations.create_user(username="no_stats")['id']
+        with get_db_context() as db:
+            db.query(UserStats).filter(UserStats.user_id == user_id).delete()
+
+        assert DatabaseOperations.increment_stats(user_id, prompts_saved=3, level=1)
+
+        stats = DatabaseOperations.get_user_stats(user_id)
+        assert (stats.prompts_saved, stats.level, stats.total_xp) == (3, 2, 0)
+
+    def test_rejects_unknown_counters(self, user_id):
+        """Unknown counter names should fail instead of being ignored"""
+        assert not DatabaseOperations.increment_stats(user_id, bogus=1)
+
+    def test_reads_see_increments_inside_unit_of_work(self, user_id):
+        """A stats object read earlier in the unit shouldn't go stale"""
+        with DatabaseOperations() as ops:
+            assert ops.get_user_stats(user_id).total_xp == 0
+            ops.increment_stats(user_id, total_xp=10)
+            assert ops.get_user_stats(user_id).total_xp == 10
+
+    def test_concurrent_increments_are_not_lost(self, user_id):
+        """Hammering the counter from a thread pool should keep every increment"""
+        workers, per_worker = 8, 25
+
+        def hammer(_):
+            return sum(
+                DatabaseOperations.increment_stats(user_id, total_xp=1, tools_favorited=2)
+                for _ in range(per_worker)
+            )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            succeeded = sum(pool.map(hammer, range(workers)))
+
+        stats = DatabaseOperations.get_user_stats(user_id)
+        assert succeeded == workers * per_worker
+        assert stats.total_xp == workers * per_worker
+        assert stats.tools_favorited == 2 * workers * per_worker
+
+
+class TestUserSnapshot:
+    """get_user_snapshot should load the whole dashboard view at once"""
+
+    def test_collects_everything_in_one_session(self, user_id, db_events, temp_db):
+        """Stats, progress, prompts, favorites and activities should come from three queries"""
+        DatabaseOperations.mark_tutorial_complete(user_id, 'qw-1')
+        DatabaseOperations.save_prompt(user_id, 'p-1', {})
+        DatabaseOperations.add_favorite(user_id, 'tools', 'cursor', {})
+        DatabaseOperations.add_favorite(user_id, 'prompt', 'p-1', {})
+        for item in ('a', 'b', 'c'):
+            DatabaseOperations.track_activity(user_id, 'tool_viewed', item)
+
+        queries = []
+        event.listen(temp_db, 'before_cursor_execute', lambda *args: queries.append(args[2]))
+        db_events['checkouts'] = 0
+
+        snapshot = DatabaseOperations.get_user_snapshot(user_id, activity_limit=2)
+
+        assert len(queries) == 3
+        assert db_events['checkouts'] == 1
+        assert snapshot.completed_tutorials == {'qw-1'}
+        assert snapshot.saved_prompts == {'p-1'}
+        assert snapshot.favorite_ids('tools') == {'cursor'}
+        assert snapshot.favorite_ids('prompt') == {'p-1'}
+        assert snapshot.stats['tutorials_completed'] == 1
+        assert [a['item_id'] for a in snapshot.activities] == ['c', 'b']
+
+    def test_is_immutable(self, user_id):
+        """Pages share the snapshot, so none of them should be able to change it"""
+        snapshot = DatabaseOperations.get_user_snapshot(user_id)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.user_id = 0
+        with pytest.raises(TypeError):
+            snapshot.stats['total_xp'] = 100
+        with pytest.raises(AttributeError):
+            snapshot.completed_tutorials.add('qw-9')
+
+    def test_ai_score_matches_stats(self, user_id):
+        """The score should use the same weights as the stats counters"""
+        DatabaseOperations.increment_stats(user_id, tutorials_completed=4, prompts_saved=3, tools_favorited=2)
+
+        assert DatabaseOperations.get_user_snapshot(user_id).ai_score == 4 * 5 + 3 * 2 + 2
@@ -0,0 +1,61 @@
+"""
+AI Nexus - Database Engine Tests
+Unit tests for engine profiles and SQLite PRAGMAs
+"""
+import pytest
+from sqlalchemy import text
+
+from database.db import create_sqlite_engine, get_engine_profile
+
+
+def read_pragma(engine, name):
+    """Read a PRAGMA value through a pooled connection"""
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestEngineProfiles:
+    """Tests for get_engine_profile and create_sqlite_engine"""
+
+    def test_production_profile_applies_pragmas(self, tmp_path):
+        """Production profile should enable WAL, NORMAL sync and the cache/mmap sizes"""
+        profile = get_engine_profile("production")
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'prod.db'}", profile)
+        try:
+            assert read_pragma(engine, "journal_mode") == "wal"
+            assert read_pragma(engine, "synchronous") == 1  # NORMAL
+            assert read_pragma(engine, "cache_size") == -profile["cache_size_kib"]
+            assert read_pragma(engine, "busy_timeout") == profile["busy_timeout_ms"]
+            assert engine.pool._pre_ping is False
+        finally:
+            engine.dispose()
+
+    def test_legacy_profile_keeps_sqlite_defaults(self, tmp_path):
+        """Legacy profile should keep the rollback journal and FULL sync"""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'legacy.db'}", get_engine_profile("legacy"))
+        try:
+            assert read_pragma(engine, "journal_mode") == "delete"
+            assert read_pragma(engine, "synchronous") == 2  # FULL
+        finally:
+            engine.dispose()
+
+    def test_env_overrides_profile_values(self, monkeypatch):
+        """AINEXUS_DB_<KEY> variables should override profile values with the right type"""
+        monkeypatch.setenv("AINEXUS_DB_SYNCHRONOUS", "full")
+        monkeypatch.setenv("AINEXUS_DB_POOL_SIZE", "16")
+        monkeypatch.setenv("AINEXUS_DB_POOL_PRE_PING", "true")
+
+        profile = get_engine_profile("production")
+
+        assert profile["synchronous"] == "FULL"
+        assert profile["pool_size"] == 16
+        assert profile["pool_pre_ping"] is True
+
+    def test_rejects_unknown_profile_and_modes(self, monkeypatch):
+        """Unknown profiles and PRAGMA values should raise"""
+        with pytest.raises(ValueError):
+            get_engine_profile("does-not-exist")
+
+        monkeypatch.setenv("AINEXUS_DB_JOURNAL_MODE", "wal; DROP TABLE users")
+        with pytest.raises(ValueError):
+            get_engine_profile("production")
@@ -0,0 +1,138 @@
+"""
+AI Nexus - Feed Health Tests
+Circuit breaker, backoff and adaptive polling per news source
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from data.ai_news import FeedResult
+from data.feed_health import CLOSED, HALF_OPEN, OPEN, FeedHealth, publish_gap
+from data.news_ingest import NewsIngestor
+
+SOURCES = [{'name': "Alpha"}, {'name': "Beta"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _health(clock, **kwargs):
+    options = dict(failure_threshold=3, base_backoff=60, max_backoff=600, min_interval=300, max_interval=7200)
+    options.update(kwargs)
+    return FeedHealth(clock=clock, **options)
+
+
+def _published(*minutes_ago):
+    now = datetime(2025, 10, 15, 12)
+    return [{'published': now - timedelta(minutes=m)} for m in minutes_ago]
+
+
+def _names(sources):
+    return [s['name'] for s in sources]
+
+
+class TestCircuitBreaker:
+    """Tests for opening, probing and closing a source's circuit"""
+
+    def test_opens_after_consecutive_failures_and_backs_off(self):
+        clock = FakeClock()
+        health = _health(clock)
+        for expected_wait in (60, 120, 240):
+            assert "Alpha" in _names(health.due(SOURCES, force=True))
+            health.record(FeedResult("Alpha", error="boom"))
+            assert health.next_due_in(SOURCES[:1]) == expected_wait
+        assert health.stats()["Alpha"]['state'] == OPEN
+
+        # An open circuit is skipped even by a manual refresh
+        assert _names(health.due(SOURCES, force=True)) == ["Beta"]
+
+    def test_half_open_probe_closes_or_reopens(self):
+        clock = FakeClock()
+        health = _health(clock)
+        for _ in range(3):
+            health.record(FeedResult("Alpha", error="boom"))
+
+        clock.now += 240
+        assert _names(health.due(SOURCES[:1])) == ["Alpha"]
+        assert health.stats()["Alpha"]['state'] == HALF_OPEN
+        health.record(FeedResult("Alpha", error="still down"))
+        assert health.stats()["Alpha"]['state'] == OPEN
+        assert health.next_due_in(SOURCES[:1]) == 480
+
+        clock.now += 480
+        health.due(SOURCES[:1])
+        health.record(FeedResult("Alpha", _published(0, 60)))
+        stats = health.stats()["Alpha"]
+        assert stats['state'] == CLOSED and stats['consecutive_failures'] == 0
+        assert stats['success_rate'] == pytest.approx(1 / 5)
+
+    def test_backoff_is_capped(self):
+        health = _health(FakeClock())
+        for _ in range(12):
+            health.record(FeedResult("Alpha", error="boom"))
+        assert health.next_due_in(SOURCES[:1]) == 600
+
+
+class TestAdaptivePolling:
+    """Tests for polling intervals following publish frequency"""
+
+    @pytest.mark.parametrize("gap_minutes, interval", [(2, 300), (60, 1800), (2 * 24 * 60, 7200)])
+    def test_interval_follows_publish_gap(self, gap_minutes, interval):
+        health = _health(FakeClock())
+        health.record(FeedResult("Alpha", _published(*(gap_minutes * i for i in range(10)))))
+        assert health.stats()["Alpha"]['poll_interval'] == interval
+        assert health.next_due_in(SOURCES[:1]) == interval
+
+    def test_only_due_sources_are_selected(self):
+        clock = FakeClock()
+        health = _health(clock)
+        health.record(FeedResult("Alpha", _published(0, 10, 20)))
+        health.record(FeedResult("Beta", _published(0, 120, 240)))
+
+        clock.now += 300
+        assert _names(health.due(SOURCES)) == ["Alpha"]
+        clock.now += 3600
+        assert _names(health.due(SOURCES)) == ["Alpha", "Beta"]
+
+    def test_publish_gap_ignores_undated_entries(self):
+        assert publish_gap(_published(0, 30, 90) + [{'published': None}]) == 45 * 60
+        assert publish_gap([{'published': None}]) is None
+
+    def test_state_round_trips(self):
+        clock = FakeClock()
+        health = _health(clock)
+        health.record(FeedResult("Alpha", _published(0, 60), elapsed=0.25))
+        restored = _health(clock)
+        restored.restore(health.stats())
+        assert restored.stats() == health.stats()
+        assert restored.stats()["Alpha"]['latency_ms'] == 250.0
+
+
+class TestIngestorHealth:
+    """Tests for the ingestor skipping dead sources"""
+
+    def test_dead_source_stops_being_fetched(self, temp_db, trending_engine, tmp_path):
+        fetched = []
+
+        def fetch(sources, validators=None):
+            fetched.append(_names(sources))
+            return [FeedResult(s['name'], error="dns failure") if s['name'] == "Beta"
+                    else FeedResult(s['name'], []) for s in sources]
+
+        sources = [dict(s, category="Research", icon="🔬") for s in SOURCES]
+        path = tmp_path / "news.json"
+        ingestor = NewsIngestor(snapshot_path=path, sources=sources, fetch=fetch, health=_health(FakeClock()))
+        for _ in range(4):
+            ingestor.refresh_once()
+        assert fetched == [["Alpha", "Beta"]] * 3 + [["Alpha"]]
+
+        # Breaker state survives a restart through the snapshot
+        restarted = NewsIngestor(snapshot_path=path, sources=sources, fetch=fetch, health=_health(FakeClock()))
+        assert restarted.snapshot().health["Beta"]['state'] == OPEN
+        restarted.refresh_once()
+        assert fetched[-1] == ["Alpha"]
@@ -0,0 +1,114 @@
+"""
+AI Nexus - Streaming Feed Parser Tests
+Bounded memory and early stops on huge and hostile feeds, and parity with feedparser
+"""
+import time
+import tracemalloc
+
+import pytest
+
+from data.ai_news import ARTICLES_PER_FEED, fetch_feed, parse_feed
+from data.feed_parser import SUMMARY_CHARS, FeedParseError, StreamingFeedParser, parse_date, utc_now
+from tests import feed_corpus
+from tests.feed_server import FIXTURES_DIR
+
+SOURCE = {'name': "Fixture", 'category': "Research", 'icon': "🔬"}
+
+
+def _stream(chunks, max_entries=ARTICLES_PER_FEED):
+    parser = StreamingFeedParser(SOURCE, max_entries)
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.done:
+            break
+    return parser, parser.close()
+
+
+class TestStreamingFeedParser:
+    """Tests for the incremental parser on its own"""
+
+    @pytest.mark.parametrize("fixture", ["rss.xml", "atom.xml"])
+    def test_matches_feedparser(self, fixture):
+        content = (FIXTURES_DIR / fixture).read_bytes()
+        assert parse_feed(content, SOURCE, parser="streaming") == parse_feed(content, SOURCE, parser="feedparser")
+
+    def test_stops_after_max_entries(self):
+        # ~6.5 MB of items: only the first chunk is ever parsed
+        parser, articles = _stream(feed_corpus.many_items(40_000))
+        assert [a['title'] for a in articles] == [f"Story {n}" for n in range(ARTICLES_PER_FEED)]
+        assert parser.bytes == feed_corpus.CHUNK
+
+    def test_giant_summary_costs_bounded_memory(self):
+        tracemalloc.start()
+        try:
+            _, articles = _stream(feed_corpus.giant_summary(20 * 1024 * 1024))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 2 * 1024 * 1024
+        assert len(articles) == 2
+        assert len(articles[0]['summary']) == SUMMARY_CHARS
+        assert articles[0]['summary'].startswith("Scaling laws & routing. Scaling")
+
+    def test_html_is_stripped_from_summaries(self):
+        chunks = [feed_corpus.RSS_HEAD,
+                  b"<item><title>Tags &amp; entities</title><description>&lt;p&gt;Hello &lt;b&gt;world&lt;/b&gt;"
+                  b"&lt;script&gt;alert(1)&lt;/script&gt;&lt;/p&gt;</description></item>",
+                  feed_corpus.RSS_TAIL]
+        _, articles = _stream(chunks)
+        assert articles[0]['title'] == "Tags & entities"
+        assert articles[0]['summary'] == "Hello world"
+
+    def test_entity_expansion_is_rejected(self):
+        with pytest.raises(FeedParseError):
+            _stream(feed_corpus.billion_laughs())
+
+    def test_malformed_tail_keeps_complete_entries(self):
+        _, articles = _stream(feed_corpus.truncated(3))
+        assert len(articles) == 3
+
+    def test_dates(self):
+        assert parse_date("Tue, 14 Oct 2025 09:30:00 +0200").hour == 7
+        assert parse_date("2025-10-15T12:00:00Z").tzinfo is None
+        assert parse_date("not a date") is None
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_utc_now_matches_parsed_dates_on_any_host(self, monkeypatch):
+        from email.utils import formatdate
+        monkeypatch.setenv("TZ", "Asia/Kolkata")
+        time.tzset()
+        try:
+            gap = utc_now() - parse_date(formatdate(time.time()))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert abs(gap.total_seconds()) < 5
+
+
+class TestHugeFeedDownloads:
+    """Tests for the size cap when fetching over HTTP"""
+
+    def test_streaming_reads_only_what_it_needs(self, feed_server):
+        feed_server.route("/huge.xml", body=feed_corpus.body(feed_corpus.many_items(40_000)))
+        source = dict(SOURCE, url=feed_server.url("/huge.xml"))
+
+        result = fetch_feed(source, time.monotonic() + 5)
+        assert result.ok and len(result.articles) == ARTICLES_PER_FEED
+        assert result.bytes < 256 * 1024
+
+    def test_feed_without_entries_is_cut_off_at_the_cap(self, feed_server):
+        # 8 MB, past the 5 MB NEWS_FEED_MAX_BYTES
+        feed_server.route("/empty.xml", body=feed_corpus.body(feed_corpus.no_entries(8 * 1024 * 1024)))
+        source = dict(SOURCE, url=feed_server.url("/empty.xml"))
+
+        result = fetch_feed(source, time.monotonic() + 5)
+        assert not result.ok and "exceeds" in result.error
+
+    def test_whole_document_mode_refuses_oversized_bodies(self, feed_server, monkeypatch):
+        monkeypatch.setattr("data.ai_news.NEWS_FEED_PARSER", "feedparser")
+        feed_server.route("/huge.xml", body=feed_corpus.body(feed_corpus.many_items(40_000)))
+        source = dict(SOURCE, url=feed_server.url("/huge.xml"))
+
+        result = fetch_feed(source, time.monotonic() + 5)
+        assert not result.ok and "exceeds" in result.error
+        assert result.bytes == 0
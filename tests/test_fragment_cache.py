@@ -0,0 +1,78 @@
+"""
+AI Nexus - Fragment Cache Tests
+Unit tests for the shared card HTML cache
+"""
+from unittest.mock import MagicMock
+
+from components.fragment_cache import FragmentCache
+from data.content_registry import ContentCatalog
+
+
+class TestFragmentCache:
+    """Tests for keyed, bounded caching of rendered HTML"""
+
+    def test_renders_once_per_key(self):
+        cache = FragmentCache()
+        render = MagicMock(return_value="<div>card</div>")
+        for _ in range(3):
+            assert cache.get_or_render('prompt', 'p-1', 1, 'default', render) == "<div>card</div>"
+        assert render.call_count == 1
+        assert cache.stats()['hits'] == 2
+
+    def test_version_and_variant_are_part_of_the_key(self):
+        cache = FragmentCache()
+        cache.get_or_render('tutorial', 'qw-1', 1, 'open', lambda: "open")
+        assert cache.get_or_render('tutorial', 'qw-1', 1, 'done', lambda: "done") == "done"
+        assert cache.get_or_render('tutorial', 'qw-1', 2, 'open', lambda: "new") == "new"
+        assert cache.get_or_render('tutorial', 'qw-1', 1, 'open', lambda: "unused") == "open"
+
+    def test_lru_eviction(self):
+        cache = FragmentCache(max_entries=2)
+        for item_id in ('a', 'b', 'c'):
+            cache.get_or_render('hack', item_id, 1, 'default', lambda: item_id)
+        assert cache.stats()['entries'] == 2
+        assert cache.stats()['evictions'] == 1
+
+    def test_invalidate_one_kind(self):
+        cache = FragmentCache()
+        cache.get_or_render('hack', 'h-1', 1, 'default', lambda: "hack")
+        cache.get_or_render('tool', 't-1', 1, 'default', lambda: "tool")
+        cache.invalidate('hack')
+        assert cache.stats()['entries'] == 1
+        assert cache.get_or_render('hack', 'h-1', 1, 'default', lambda: "rebuilt") == "rebuilt"
+
+
+class TestCatalogVersion:
+    """Catalog versions follow the content cards are keyed on"""
+
+    def test_rebuild_with_new_content_changes_version(self):
+        items = [{'id': 'x-1'}]
+        catalog = ContentCatalog(items)
+        version = catalog.version
+        items.append({'id': 'x-2'})
+        catalog.rebuild()
+        assert catalog.version != version
+
+    def test_same_content_keeps_version(self):
+        items = [{'id': 'x-1', 'title': "One"}]
+        catalog = ContentCatalog(items)
+        version = catalog.version
+        catalog.rebuild()
+        assert catalog.version == version
+        assert ContentCatalog([dict(items[0])]).version == version
+
+    def test_module_reload_keeps_tutorial_cards_cached(self):
+        import importlib
+        import data.final_tutorials
+        from data.content_registry import get_catalog
+
+        cache = FragmentCache()
+        render = MagicMock(return_value="<div>card</div>")
+        for _ in range(3):
+            importlib.reload(data.final_tutorials)
+            for tutorial in data.final_tutorials.get_all_tutorials():
+                cache.get_or_render('tutorial', tutorial['id'], get_catalog('tutorials').version, 'open', render)
+
+        tutorials = len(data.final_tutorials.get_all_tutorials())
+        assert render.call_count == tutorials
+        assert cache.stats()['hits'] == 2 * tutorials
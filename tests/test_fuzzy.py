@@ -0,0 +1,79 @@
+"""
+AI Nexus - Fuzzy Matching Tests
+Unit tests for typo-tolerant term lookup
+"""
+from unittest.mock import patch
+
+import pytest
+
+import data.fuzzy as fuzzy_module
+from data.fuzzy import FuzzyIndex, edit_distance
+from data.search_index import SearchIndex
+
+
+VOCABULARY = {'pytest': 12, 'python': 40, 'langchain': 7, 'prompt': 90, 'prompts': 30, 'rag': 15, 'pinecone': 3}
+
+
+@pytest.fixture
+def fuzzy():
+    return FuzzyIndex(VOCABULARY)
+
+
+class TestEditDistance:
+    """Library and pure-Python edit distance agree"""
+
+    @pytest.mark.parametrize("a,b,expected", [("pytset", "pytest", 2), ("promt", "prompt", 1), ("rag", "rag", 0)])
+    def test_distance(self, a, b, expected):
+        assert edit_distance(a, b, 2) == expected
+        with patch.object(fuzzy_module, '_levenshtein', None):
+            assert edit_distance(a, b, 2) == expected
+
+    def test_stops_past_limit(self):
+        with patch.object(fuzzy_module, '_levenshtein', None):
+            assert edit_distance("kubernetes", "pytest", 2) == 3
+
+
+class TestFuzzyIndex:
+    """Tests for candidate shortlisting and corrections"""
+
+    def test_corrects_transpositions(self, fuzzy):
+        assert fuzzy.corrections("pytset")[0] == ('pytest', 2)
+        assert fuzzy.corrections("langchian")[0] == ('langchain', 2)
+
+    def test_nearest_terms_first(self, fuzzy):
+        assert [term for term, _ in fuzzy.corrections("promt")] == ['prompt', 'prompts']
+
+    def test_only_shortlisted_candidates_are_scored(self, fuzzy):
+        """Edit distance runs on trigram candidates, not the whole vocabulary"""
+        with patch.object(fuzzy_module, 'edit_distance', wraps=edit_distance) as spy:
+            fuzzy.corrections("pytset")
+        scored = {call.args[1] for call in spy.call_args_list}
+        assert 'pytest' in scored
+        assert not scored & {'langchain', 'pinecone', 'rag'}
+
+    def test_short_tokens_are_not_corrected(self, fuzzy):
+        assert fuzzy.corrections("rg") == []
+
+    def test_suggest_rewrites_only_unknown_tokens(self, fuzzy):
+        assert fuzzy.suggest(['rag', 'langchian'], known={'rag'}) == "rag langchain"
+        assert fuzzy.suggest(['rag', 'python'], known={'rag', 'python'}) is None
+
+
+class TestFuzzySearch:
+    """Fuzzy mode of the in-memory search index"""
+
+    @pytest.fixture
+    def index(self):
+        return SearchIndex.build([
+            ('tutorial', {'id': 'qw-8'}, {'title': "Pytest fixtures", 'tags': "", 'description': "", 'body': ""}),
+            ('tool', {'id': 'langchain'}, {'title': "LangChain", 'tags': "", 'description': "", 'body': ""}),
+        ])
+
+    def test_misspelled_query_finds_results_only_in_fuzzy_mode(self, index):
+        assert index.search("pytset") == []
+        assert [h.id for h in index.search("pytset", fuzzy=True)] == ['qw-8']
+
+    def test_suggest(self, index):
+        assert index.suggest("langchian") == "langchain"
+        assert index.suggest("langchain") is None
+        assert index.suggest("pyte") is None  # still typing 'pytest'
@@ -0,0 +1,109 @@
+"""
+AI Nexus - Schema Migration Tests
+Unit tests for the versioned migration engine and its helpers
+"""
+import threading
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from database.db import create_sqlite_engine
+from database.migrate import (
+    add_column, backfill_in_batches, current_version, discover_migrations, latest_version, migrate,
+)
+from database.models import Base
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A fresh, unmigrated SQLite engine"""
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestMigrate:
+    """Tests for migrate and the schema_version table"""
+
+    def test_migrations_are_ordered_and_unique(self):
+        """Discovered migrations should be strictly increasing"""
+        versions = [m.version for m in discover_migrations()]
+        assert versions == sorted(set(versions))
+        assert versions[0] == 1
+
+    def test_upgrades_empty_database_to_latest(self, engine):
+        """A new database should end at the latest version with all tables"""
+        applied = migrate(engine)
+
+        assert [m.version for m in applied] == [m.version for m in discover_migrations()]
+        assert current_version(engine) == latest_version()
+        assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+
+    def test_upgrades_pre_migration_database(self, engine):
+        """A database built by the old create_all, without new indexes, should gain them"""
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_activities_user_created"))
+
+        migrate(engine)
+
+        names = {i['name'] for i in inspect(engine).get_indexes('activities')}
+        assert 'ix_activities_user_created' in names
+
+    def test_target_stops_early(self, engine):
+        """migrate(target=N) should not apply anything past N"""
+        migrate(engine, target=1)
+        assert current_version(engine) == 1
+
+    def test_current_schema_is_a_cheap_no_op(self, engine):
+        """Once current, later calls should not touch the database at all"""
+        migrate(engine)
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        assert migrate(engine) == []
+        assert statements == []
+
+
+class TestMigrationHelpers:
+    """Tests for add_column and backfill_in_batches"""
+
+    def test_add_column_is_idempotent(self, engine):
+        """Adding the same column twice should not fail"""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+        add_column(engine, 'items', 'score', 'INTEGER')
+        add_column(engine, 'items', 'score', 'INTEGER')
+
+        assert 'score' in {c['name'] for c in inspect(engine).get_columns('items')}
+
+    def test_backfill_commits_per_batch_and_stays_readable(self, engine):
+        """Backfill should update every row in several transactions while readers keep working"""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, score INTEGER)"))
+            conn.execute(text("INSERT INTO items (score) VALUES (NULL)"), [{}] * 1000)
+
+        commits = []
+        event.listen(engine, 'commit', lambda conn: commits.append(1))
+        reads = []
+        stop = threading.Event()
+
+        def reader():
+            with engine.connect() as conn:
+                while not stop.is_set():
+                    reads.append(conn.execute(text("SELECT COUNT(*) FROM items")).scalar())
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        try:
+            updated = backfill_in_batches(engine, 'items', 'score = id * 2', 'score IS NULL', batch_size=100)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert updated == 1000
+        assert len(commits) >= 10
+        assert reads and all(count == 1000 for count in reads)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items WHERE score = id * 2")).scalar() == 1000
@@ -0,0 +1,97 @@
+"""
+AI Nexus - News Fetcher Tests
+Concurrent RSS fetching against a local feed server with injected delays
+"""
+import time
+
+from data.ai_news import fetch_all_feeds, fetch_feed, merge_articles, parse_feed
+from tests.feed_server import FIXTURES_DIR
+
+
+def _source(server, path, name=None):
+    return {'name': name or path.strip('/'), 'url': server.url(path), 'category': "Research", 'icon': "🔬"}
+
+
+class TestParseFeed:
+    """Tests for turning a downloaded feed into article dicts"""
+
+    def test_rss_and_atom(self):
+        source = {'name': "Fixture", 'category': "Research", 'icon': "🔬"}
+        rss = parse_feed((FIXTURES_DIR / "rss.xml").read_bytes(), source)
+        atom = parse_feed((FIXTURES_DIR / "atom.xml").read_bytes(), source)
+
+        assert [a['title'] for a in rss][0] == "Open-weight model tops coding benchmark"
+        assert rss[0]['published'].year == 2025 and rss[0]['source'] == "Fixture"
+        assert atom[1]['link'] == "https://example.org/research/long-context"
+        assert atom[0]['summary'].startswith("How expert count")
+
+
+class TestFetchAllFeeds:
+    """Tests for concurrency, timeouts and partial results"""
+
+    def test_feeds_are_fetched_concurrently(self, feed_server):
+        sources = []
+        for i in range(4):
+            feed_server.route(f"/feed{i}.xml", fixture="rss.xml", delay=0.5)
+            sources.append(_source(feed_server, f"/feed{i}.xml"))
+
+        start = time.monotonic()
+        results = fetch_all_feeds(sources, deadline_seconds=5)
+        elapsed = time.monotonic() - start
+
+        assert all(r.ok and len(r.articles) == 3 for r in results)
+        assert elapsed < 1.5  # serial fetching would take 2s
+
+    def test_hung_feed_costs_at_most_the_deadline(self, feed_server):
+        feed_server.route("/ok.xml", fixture="atom.xml")
+        feed_server.route("/hung.xml", fixture="rss.xml", delay=10)
+        sources = [_source(feed_server, "/hung.xml"), _source(feed_server, "/ok.xml")]
+
+        start = time.monotonic()
+        hung, ok = fetch_all_feeds(sources, deadline_seconds=1.0)
+
+        assert time.monotonic() - start < 2.0
+        assert not hung.ok and ok.ok
+        assert [a['source'] for a in merge_articles([hung, ok])] == ["ok.xml", "ok.xml"]
+
+    def test_trickling_body_is_cut_off_at_the_deadline(self, feed_server):
+        # Each chunk arrives well within the read timeout, but the whole body would take ~5s
+        feed_server.route("/trickle.xml", fixture="rss.xml", trickle=0.2)
+        source = _source(feed_server, "/trickle.xml")
+
+        start = time.monotonic()
+        result = fetch_feed(source, time.monotonic() + 1.0)
+
+        assert not result.ok and "deadline" in result.error
+        assert time.monotonic() - start < 1.5
+
+    def test_failures_yield_partial_results(self, feed_server):
+        feed_server.route("/rss.xml", fixture="rss.xml")
+        feed_server.route("/broken.xml", status=500)
+        sources = [
+            _source(feed_server, "/rss.xml"),
+            _source(feed_server, "/broken.xml"),
+            _source(feed_server, "/missing.xml"),
+            {'name': "refused", 'url': "http://127.0.0.1:9/feed", 'category': "Research", 'icon': "🔬"},
+        ]
+
+        results = fetch_all_feeds(sources, deadline_seconds=3)
+
+        assert [r.ok for r in results] == [True, False, False, False]
+        articles = merge_articles(results)
+        assert len(articles) == 3
+        assert articles == sorted(articles, key=lambda a: a['published'], reverse=True)
+
+    def test_no_sources(self):
+        assert fetch_all_feeds([]) == []
+
+    def test_conditional_fetch(self, feed_server):
+        feed_server.route("/rss.xml", fixture="rss.xml", headers={'ETag': '"abc"'})
+        source = _source(feed_server, "/rss.xml")
+
+        first = fetch_feed(source, time.monotonic() + 3)
+        again = fetch_feed(source, time.monotonic() + 3, first.validators)
+
+        assert first.etag == '"abc"' and first.bytes > 0 and len(first.articles) == 3
+        assert again.ok and again.not_modified
+        assert again.articles == [] and again.bytes == 0 and again.etag == '"abc"'
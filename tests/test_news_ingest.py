@@ -0,0 +1,154 @@
+"""
+AI Nexus - News Ingestion Tests
+Background refreshes, snapshot persistence and partial failures
+"""
+import os
+from datetime import datetime
+
+import pytest
+
+from data.ai_news import FeedResult
+from data.news_ingest import NewsIngestor
+
+SOURCES = [
+    {'name': "Alpha", 'url': "http://alpha.invalid/feed", 'category': "Research", 'icon': "🔬"},
+    {'name': "Beta", 'url': "http://beta.invalid/feed", 'category': "Tech News", 'icon': "📱"},
+]
+
+
+def _article(source, n, day):
+    return {'title': f"{source} story {n}", 'link': f"https://example.com/{source}/{n}", 'summary': "",
+            'published': datetime(2025, 10, day), 'source': source, 'category': "Research", 'icon': "🔬"}
+
+
+@pytest.fixture(autouse=True)
+def article_store(temp_db, trending_engine):
+    """Keep ingested articles out of data/ainexus.db and trending counts out of data/news_trending.json"""
+    return temp_db
+
+
+class FakeFetch:
+    """fetch_all_feeds stand-in returning scripted results and counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = set()
+
+    def __call__(self, sources, validators=None):
+        self.calls += 1
+        return [
+            FeedResult(s['name'], error="boom") if s['name'] in self.failing
+            else FeedResult(s['name'], [_article(s['name'], self.calls, 10 + i)])
+            for i, s in enumerate(sources)
+        ]
+
+
+class TestNewsIngestor:
+    """Tests for the snapshot the pages read"""
+
+    def test_snapshot_survives_a_restart(self, tmp_path):
+        path = tmp_path / "news.json"
+        NewsIngestor(snapshot_path=path, sources=SOURCES, fetch=FakeFetch()).refresh_once()
+
+        restarted = NewsIngestor(snapshot_path=path, sources=SOURCES, fetch=FakeFetch())
+        snapshot = restarted.snapshot()
+        assert not snapshot.is_empty
+        assert [a['title'] for a in snapshot.articles] == ["Beta story 1", "Alpha story 1"]
+        assert snapshot.articles[0]['published'] == datetime(2025, 10, 11)
+
+    def test_failed_source_keeps_its_previous_articles(self):
+        fetch = FakeFetch()
+        ingestor = NewsIngestor(snapshot_path=None, sources=SOURCES, fetch=fetch)
+        ingestor.refresh_once()
+        fetch.failing.add("Beta")
+        ingestor.refresh_once()
+
+        snapshot = ingestor.snapshot()
+        assert {a['title'] for a in snapshot.articles} == {"Alpha story 2", "Beta story 1"}
+        assert snapshot.sources["Beta"]['error'] == "boom"
+        assert snapshot.sources["Beta"]['articles'] == 1
+
+    def test_background_worker_and_manual_refresh(self):
+        fetch = FakeFetch()
+        ingestor = NewsIngestor(interval=60, snapshot_path=None, sources=SOURCES, fetch=fetch)
+        ingestor.start()
+        try:
+            assert ingestor.wait_until_ready(timeout=5)
+            assert ingestor.refresh(timeout=5)
+            assert fetch.calls >= 2
+            assert ingestor.stats()['running']
+        finally:
+            ingestor.close()
+        assert not ingestor.is_running()
+
+    def test_reader_picks_up_snapshots_from_another_process(self, tmp_path):
+        path = tmp_path / "news.json"
+        writer = NewsIngestor(snapshot_path=path, sources=SOURCES, fetch=FakeFetch())
+        reader = NewsIngestor(snapshot_path=path, sources=SOURCES, fetch=FakeFetch())
+        assert reader.snapshot().is_empty
+
+        writer.refresh_once()
+        assert reader.snapshot().articles[0]['title'] == "Beta story 1"
+
+        writer.refresh_once()
+        os.utime(path, (0, os.stat(path).st_mtime + 1))  # coarse filesystem clocks
+        assert reader.snapshot().articles[0]['title'] == "Beta story 2"
+
+    def test_ingests_from_a_live_feed(self, feed_server, tmp_path):
+        feed_server.route("/rss.xml", fixture="rss.xml")
+        sources = [{'name': "Fixture", 'url': feed_server.url("/rss.xml"), 'category': "Research", 'icon': "🔬"}]
+        ingestor = NewsIngestor(snapshot_path=tmp_path / "news.json", sources=sources)
+        ingestor.refresh_once()
+
+        assert len(ingestor.snapshot().articles) == 3
+        assert ingestor.snapshot().sources["Fixture"]['ok']
+
+    def test_unchanged_feed_is_not_downloaded_again(self, feed_server, tmp_path):
+        feed_server.route("/rss.xml", fixture="rss.xml", headers={'ETag': '"v1"'})
+        feed_server.route("/atom.xml", fixture="atom.xml", headers={'Last-Modified': "Wed, 15 Oct 2025 12:00:00 GMT"})
+        sources = [
+            {'name': "RSS", 'url': feed_server.url("/rss.xml"), 'category': "Research", 'icon': "🔬"},
+            {'name': "Atom", 'url': feed_server.url("/atom.xml"), 'category': "Research", 'icon': "🔬"},
+        ]
+        ingestor = NewsIngestor(snapshot_path=tmp_path / "news.json", sources=sources)
+        ingestor.refresh_once()
+        assert ingestor.stats()['last_bytes'] > 0
+
+        # Validators survive a restart and make the next cycle conditional
+        restarted = NewsIngestor(snapshot_path=tmp_path / "news.json", sources=sources)
+        restarted.refresh_once()
+
+        stats = restarted.stats()
+        assert stats['last_not_modified'] == 2
+        assert stats['last_bytes'] == 0 and stats['last_parse_ms'] == 0
+        assert len(restarted.snapshot().articles) == 5
+        assert feed_server.hits("/rss.xml")[-1]['If-None-Match'] == '"v1"'
+        assert feed_server.hits("/atom.xml")[-1]['If-Modified-Since'] == "Wed, 15 Oct 2025 12:00:00 GMT"
+
+        # A changed feed is downloaded in full again
+        feed_server.route("/rss.xml", fixture="rss.xml", headers={'ETag': '"v2"'})
+        restarted.refresh_once()
+        assert restarted.snapshot().sources["RSS"]['etag'] == '"v2"'
+        assert restarted.stats()['last_not_modified'] == 1
+
+    def test_fetched_articles_are_stored(self, article_store):
+        from database.news_store import recent_articles
+        fetch = FakeFetch()
+        ingestor = NewsIngestor(snapshot_path=None, sources=SOURCES, fetch=fetch)
+        ingestor.refresh_once()
+        ingestor.refresh_once()
+
+        # History accumulates across refreshes instead of being replaced
+        assert len(recent_articles(bind=article_store)) == 4
+        assert ingestor.stats()['inserted'] == 4
+
+    def test_only_new_articles_are_counted_as_trending(self, trending_engine):
+        fetch = FakeFetch()
+        ingestor = NewsIngestor(snapshot_path=None, sources=SOURCES, fetch=fetch)
+        ingestor.refresh_once()
+        assert trending_engine.articles == 2
+
+        # Same links again: stored as unchanged, not counted twice
+        fetch.calls = 0
+        ingestor.refresh_once()
+        assert trending_engine.articles == 2
@@ -0,0 +1,131 @@
+"""
+AI Nexus - News Store Tests
+Article upserts, deduplication and the indexed news queries
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from database.db import create_sqlite_engine
+from database.migrate import migrate
+from database.news_store import (
+    articles_by_category, articles_since, content_hash, create_article_search, normalize_url,
+    recent_articles, search_articles, upsert_articles
+)
+
+
+def _article(link, title, category="Research", day=10, summary="Details inside."):
+    return {'title': title, 'link': link, 'summary': summary, 'published': datetime(2025, 10, day),
+            'source': "Fixture", 'category': category, 'icon': "🔬"}
+
+
+@pytest.fixture
+def store(temp_db):
+    create_article_search(temp_db)
+    return temp_db
+
+
+class TestNormalization:
+    """Tests for URL and content fingerprints"""
+
+    def test_url_variants_normalize_the_same(self):
+        canonical = normalize_url("https://example.com/posts/gpt?id=7&page=2")
+        assert normalize_url("http://www.Example.com/posts/gpt/?page=2&id=7&utm_source=rss#top") == canonical
+        assert normalize_url("https://example.com/posts/gpt?id=7&page=2&fbclid=abc") == canonical
+        assert normalize_url("https://example.com/posts/other?id=7&page=2") != canonical
+
+    def test_content_hash_ignores_markup_and_case(self):
+        assert content_hash("GPT-5 is out!", "<p>The new model &amp; its API.</p>") == \
+            content_hash("gpt 5 is out", "The new model & its API")
+        assert content_hash("GPT-5 is out", "A") != content_hash("GPT-6 is out", "A")
+
+
+class TestUpsertArticles:
+    """Tests for upsert-on-ingest and deduplication"""
+
+    def test_insert_then_unchanged(self, store):
+        batch = [_article("https://a.com/1", "One"), _article("https://a.com/2", "Two")]
+        assert upsert_articles(batch, bind=store)['inserted'] == 2
+        assert upsert_articles(batch, bind=store) == {'inserted': 0, 'updated': 0, 'unchanged': 2, 'duplicates': 0}
+
+    def test_same_url_is_updated_in_place(self, store):
+        upsert_articles([_article("https://a.com/1", "Tpyo in title")], bind=store)
+        counts = upsert_articles([_article("http://www.a.com/1/?utm_medium=feed", "Typo in title")], bind=store)
+
+        assert counts['updated'] == 1
+        assert [a['title'] for a in recent_articles(bind=store)] == ["Typo in title"]
+
+    def test_syndicated_copy_is_skipped(self, store):
+        upsert_articles([_article("https://origin.com/story", "Open model tops benchmark")], bind=store)
+        counts = upsert_articles([
+            _article("https://mirror.net/ai/open-model", "Open Model Tops Benchmark!"),
+            _article("https://mirror.net/ai/other", "A different story"),
+        ], bind=store)
+
+        assert counts['duplicates'] == 1 and counts['inserted'] == 1
+        assert len(recent_articles(bind=store)) == 2
+
+
+class TestNewsQueries:
+    """Tests for the listing and search queries"""
+
+    @pytest.fixture
+    def filled(self, store):
+        undated = dict(_article("https://a.com/undated", "Undated note"), published=None)
+        upsert_articles([
+            _article("https://a.com/old", "Retrieval tips", day=1),
+            _article("https://a.com/new", "Agents that plan", category="Tech News", day=20),
+            _article("https://a.com/mid", "Planning benchmarks", day=10),
+            undated,
+        ], bind=store)
+        return store
+
+    def test_recent_is_newest_first_with_undated_last(self, filled):
+        assert [a['title'] for a in recent_articles(bind=filled)] == [
+            "Agents that plan", "Planning benchmarks", "Retrieval tips", "Undated note"]
+        assert len(recent_articles(limit=2, bind=filled)) == 2
+
+    def test_category_and_timeframe(self, filled):
+        assert [a['title'] for a in articles_by_category("Research", bind=filled)] == [
+            "Planning benchmarks", "Retrieval tips", "Undated note"]
+        assert [a['title'] for a in articles_since(datetime(2025, 10, 5), bind=filled)] == [
+            "Agents that plan", "Planning benchmarks"]
+
+    def test_search_uses_prefixes_and_all_words(self, filled):
+        assert {a['title'] for a in search_articles("plan", bind=filled)} == {"Agents that plan", "Planning benchmarks"}
+        assert [a['title'] for a in search_articles("planning bench", bind=filled)] == ["Planning benchmarks"]
+        assert search_articles("   ", bind=filled) == []
+
+    def test_search_falls_back_without_fts(self, temp_db):
+        upsert_articles([_article("https://a.com/1", "Planning benchmarks")], bind=temp_db)
+        assert [a['title'] for a in search_articles("bench", bind=temp_db)] == ["Planning benchmarks"]
+
+    def test_updates_reach_the_search_index(self, store):
+        upsert_articles([_article("https://a.com/1", "Draft headline")], bind=store)
+        upsert_articles([_article("https://a.com/1", "Final headline")], bind=store)
+        assert search_articles("draft", bind=store) == []
+        assert len(search_articles("final", bind=store)) == 1
+
+    @pytest.mark.parametrize("sql, index", [
+        ("SELECT * FROM articles WHERE category = 'Research' ORDER BY published DESC LIMIT 500",
+         "ix_articles_category_published"),
+        ("SELECT * FROM articles WHERE published > '2025-10-01' ORDER BY published DESC LIMIT 500",
+         "ix_articles_published"),
+        ("SELECT * FROM articles ORDER BY published DESC LIMIT 500", "ix_articles_published"),
+    ])
+    def test_queries_use_indexes(self, filled, sql, index):
+        with filled.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        assert index in plan and "TEMP B-TREE" not in plan
+
+
+def test_migration_creates_the_search_index(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    try:
+        migrate(engine)
+        with engine.connect() as conn:
+            names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master"))}
+        assert {"articles", "articles_fts", "ix_articles_category_published"} <= names
+    finally:
+        engine.dispose()
@@ -0,0 +1,59 @@
+"""
+AI Nexus - Pagination Tests
+Unit tests for the paginated grid component
+"""
+from streamlit.testing.v1 import AppTest
+
+from components.ui_components import paginate
+
+
+class TestPaginate:
+    """Tests for slicing one page out of a result list"""
+
+    def test_pages_cover_every_item(self):
+        items = list(range(50))
+        pages = [paginate(items, page, 24) for page in range(3)]
+        assert [p[0] for p in pages] == [items[:24], items[24:48], items[48:]]
+        assert all(p[2] == 3 for p in pages)
+
+    def test_page_is_clamped(self):
+        items = list(range(10))
+        assert paginate(items, 7, 4) == ([8, 9], 2, 3)
+        assert paginate(items, -1, 4) == ([0, 1, 2, 3], 0, 3)
+
+    def test_empty_list_has_one_page(self):
+        assert paginate([], 0, 24) == ([], 0, 1)
+
+
+def _grid_app():
+    import streamlit as st
+    from components.ui_components import render_paginated_grid
+
+    query = st.text_input("query")
+    render_paginated_grid(list(range(60)), lambda item, index: st.write(f"item {index}"),
+                          key="test_grid", columns=3, page_size=24, reset_on=query)
+
+
+class TestPaginatedGrid:
+    """Tests for the rendered grid and its page controls"""
+
+    @staticmethod
+    def _items(at):
+        return [m.value for m in at.markdown if m.value.startswith("item ")]
+
+    def test_renders_only_the_visible_page(self):
+        at = AppTest.from_function(_grid_app).run()
+        assert self._items(at) == [f"item {i}" for i in range(24)]
+
+        at.button(key="test_grid_next").click().run()
+        at.button(key="test_grid_next").click().run()
+        assert self._items(at) == [f"item {i}" for i in range(48, 60)]
+        assert at.button(key="test_grid_next").disabled
+
+    def test_changing_filters_returns_to_first_page(self):
+        at = AppTest.from_function(_grid_app).run()
+        at.button(key="test_grid_next").click().run()
+        assert self._items(at)[0] == "item 24"
+
+        at.text_input[0].input("prompt").run()
+        assert self._items(at)[0] == "item 0"
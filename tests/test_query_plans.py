@@ -0,0 +1,114 @@
+"""
+AI Nexus - Query Plan Tests
+EXPLAIN QUERY PLAN checks that every DatabaseOperations query is served by an index
+"""
+import pytest
+from sqlalchemy import event, inspect, text
+
+from database.db import upgrade_db
+from database.models import Base
+from database.operations import DatabaseOperations
+
+OPERATIONS = {
+    'get_user_by_id': lambda uid: DatabaseOperations.get_user_by_id(uid),
+    'get_user_by_username': lambda uid: DatabaseOperations.get_user_by_username('plan_user'),
+    'update_user': lambda uid: DatabaseOperations.update_user(uid, role='devops'),
+    'add_favorite': lambda uid: DatabaseOperations.add_favorite(uid, 'tool', 'cursor', {}),
+    'remove_favorite': lambda uid: DatabaseOperations.remove_favorite(uid, 'tool', 'cursor'),
+    'get_favorites': lambda uid: DatabaseOperations.get_favorites(uid),
+    'get_favorites_by_type': lambda uid: DatabaseOperations.get_favorites(uid, 'tool'),
+    'is_favorite': lambda uid: DatabaseOperations.is_favorite(uid, 'tool', 'cursor'),
+    'mark_tutorial_complete': lambda uid: DatabaseOperations.mark_tutorial_complete(uid, 'qw-1'),
+    'get_completed_tutorials': lambda uid: DatabaseOperations.get_completed_tutorials(uid),
+    'is_tutorial_complete': lambda uid: DatabaseOperations.is_tutorial_complete(uid, 'qw-1'),
+    'track_activity': lambda uid: DatabaseOperations.track_activity(uid, 'tool_viewed', 'cursor'),
+    'get_recent_activities': lambda uid: DatabaseOperations.get_recent_activities(uid, 10),
+    'save_prompt': lambda uid: DatabaseOperations.save_prompt(uid, 'p-1', {}),
+    'get_saved_prompts': lambda uid: DatabaseOperations.get_saved_prompts(uid),
+    'get_user_stats': lambda uid: DatabaseOperations.get_user_stats(uid),
+    'increment_stats': lambda uid: DatabaseOperations.increment_stats(uid, total_xp=5),
+    'get_user_snapshot': lambda uid: DatabaseOperations.get_user_snapshot(uid),
+    'get_daily_activity_counts': lambda uid: DatabaseOperations.get_daily_activity_counts(uid),
+}
+
+
+@pytest.fixture
+def captured_statements(temp_db):
+    """Record every single-row statement sent to the temporary engine"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(temp_db, 'before_cursor_execute', capture)
+    yield statements
+    event.remove(temp_db, 'before_cursor_execute', capture)
+
+
+def query_plan(engine, statement, parameters):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement"""
+    raw = engine.raw_connection()
+    try:
+        rows = raw.cursor().execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        return [row[3] for row in rows]
+    finally:
+        raw.close()
+
+
+class TestQueryPlans:
+    """Every query issued by DatabaseOperations should search an index"""
+
+    @pytest.mark.parametrize('name', sorted(OPERATIONS))
+    def test_operation_uses_indexes(self, name, temp_db, captured_statements):
+        """No full table scans and no temp B-tree sorts"""
+        user_id = DatabaseOperations.create_user(username='plan_user')['id']
+        captured_statements.clear()
+
+        OPERATIONS[name](user_id)
+
+        checked = 0
+        for statement, parameters in captured_statements:
+            if not statement.lstrip().upper().startswith(('SELECT', 'INSERT', 'UPDATE', 'DELETE')):
+                continue
+            plan = query_plan(temp_db, statement, parameters)
+            checked += 1
+            for detail in plan:
+                assert not (detail.startswith('SCAN') and 'INDEX' not in detail), \
+                    f"{name} scans a table: {detail}\n{statement}"
+                assert 'TEMP B-TREE' not in detail, f"{name} sorts without an index: {detail}\n{statement}"
+        assert checked, f"{name} issued no queries to check"
+
+    def test_completed_tutorials_is_covered(self, temp_db, captured_statements):
+        """get_completed_tutorials should never touch the progress table itself"""
+        user_id = DatabaseOperations.create_user(username='plan_user')['id']
+        captured_statements.clear()
+
+        DatabaseOperations.get_completed_tutorials(user_id)
+
+        statement, parameters = captured_statements[-1]
+        assert any('COVERING INDEX ix_progress_user_completed' in d for d in query_plan(temp_db, statement, parameters))
+
+
+class TestUpgradeDb:
+    """upgrade_db should add new indexes to databases created before them"""
+
+    def test_creates_missing_indexes(self, temp_db):
+        """Indexes dropped from an existing database should be recreated"""
+        with temp_db.begin() as conn:
+            conn.execute(text("DROP INDEX ix_activities_user_created"))
+            conn.execute(text("DROP INDEX ix_progress_user_completed"))
+
+        assert upgrade_db(temp_db)
+
+        inspector = inspect(temp_db)
+        assert 'ix_activities_user_created' in {i['name'] for i in inspector.get_indexes('activities')}
+        assert 'ix_progress_user_completed' in {i['name'] for i in inspector.get_indexes('progress')}
+
+    def test_is_idempotent(self, temp_db):
+        """Running upgrade_db on a current schema should change nothing"""
+        before = {t.name: len(inspect(temp_db).get_indexes(t.name)) for t in Base.metadata.sorted_tables}
+        assert upgrade_db(temp_db)
+        assert upgrade_db(temp_db)
+        after = {t.name: len(inspect(temp_db).get_indexes(t.name)) for t in Base.metadata.sorted_tables}
+        assert before == after
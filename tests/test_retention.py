@@ -0,0 +1,90 @@
+"""
+AI Nexus - Activity Retention Tests
+Unit tests for activity rollups and archival
+"""
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from database.models import Activity, ActivityDailyRollup, utc_now
+from database.operations import DatabaseOperations
+from database.retention import archive_activities, rollup_activities
+
+
+@pytest.fixture
+def user_id(temp_db):
+    """Create a user in the temporary database"""
+    return DatabaseOperations.create_user(username="retention_user")['id']
+
+
+def add_activities(user_id, count, age_days=0, activity_type='tool_viewed'):
+    """Insert raw activities created age_days ago"""
+    created_at = utc_now() - timedelta(days=age_days)
+    DatabaseOperations.bulk_track_activities([
+        {'user_id': user_id, 'activity_type': activity_type, 'item_id': f"item-{i}", 'created_at': created_at}
+        for i in range(count)
+    ])
+
+
+def rollup_total(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(func.sum(ActivityDailyRollup.count))).scalar() or 0
+
+
+class TestRollup:
+    """rollup_activities should count each raw row exactly once"""
+
+    def test_incremental_runs_do_not_double_count(self, temp_db, user_id):
+        """Re-running only picks up rows added since the last run"""
+        add_activities(user_id, 25)
+        assert rollup_activities(temp_db, batch_size=10) == 25
+        assert rollup_activities(temp_db, batch_size=10) == 0
+
+        add_activities(user_id, 5, activity_type='prompt_saved')
+        assert rollup_activities(temp_db, batch_size=10) == 5
+        assert rollup_total(temp_db) == 30
+
+    def test_daily_counts_combine_rollups_and_new_rows(self, temp_db, user_id):
+        """The weekly chart query should include rows the job hasn't seen yet"""
+        add_activities(user_id, 4, age_days=2)
+        rollup_activities(temp_db)
+        add_activities(user_id, 3)
+
+        counts = DatabaseOperations.get_daily_activity_counts(user_id, days=7)
+
+        today = utc_now().date()
+        assert counts[today] == 3
+        assert counts[today - timedelta(days=2)] == 4
+
+
+class TestArchive:
+    """archive_activities should move old, rolled-up rows to gzip'd JSONL"""
+
+    def test_archives_old_rows_and_keeps_counts(self, temp_db, user_id, tmp_path):
+        """Old rows leave the table but stay in the rollups and the archive"""
+        add_activities(user_id, 12, age_days=200)
+        add_activities(user_id, 3)
+        rollup_activities(temp_db)
+
+        archived = archive_activities(temp_db, older_than_days=90, archive_dir=tmp_path, batch_size=5)
+
+        assert archived == 12
+        with temp_db.connect() as conn:
+            assert conn.execute(select(func.count()).select_from(Activity)).scalar() == 3
+        assert rollup_total(temp_db) == 15
+
+        files = list(tmp_path.glob("activities-*.jsonl.gz"))
+        assert len(files) == 1
+        with gzip.open(files[0], "rt") as fh:
+            records = [json.loads(line) for line in fh]
+        assert len(records) == 12
+        assert {r['user_id'] for r in records} == {user_id}
+
+    def test_skips_rows_not_yet_rolled_up(self, temp_db, user_id, tmp_path):
+        """Rows the rollup hasn't counted must not be archived"""
+        add_activities(user_id, 5, age_days=200)
+
+        assert archive_activities(temp_db, older_than_days=90, archive_dir=tmp_path) == 0
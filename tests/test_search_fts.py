@@ -0,0 +1,105 @@
+"""
+AI Nexus - FTS5 Search Index Tests
+Unit tests for the SQLite FTS5 search backend
+"""
+import pytest
+
+from data.search_fts import FtsSearchIndex, build_match_query, fts5_available
+from data.search_index import highlight_markdown
+
+pytestmark = pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+
+
+def doc(kind, id, title, body="", tags=""):
+    return kind, {'id': id}, {'title': title, 'tags': tags, 'description': "", 'body': body}
+
+
+DOCS = [
+    doc('prompt', 'p-1', "SQL Query Optimizer", "Rewrite the SQL query for speed"),
+    doc('prompt', 'p-2', "Email Writer", "Draft a short email; mention the query briefly"),
+    doc('tool', 't-1', "Pinecone", "Serverless vector database", tags="vector db"),
+    doc('hack', 'h-1', "Vector search tricks", "Use pinecone namespaces"),
+]
+
+
+def open_index(path):
+    return FtsSearchIndex(path, resolve=lambda kind, doc_id: {'id': doc_id})
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = open_index(tmp_path / "search.db")
+    index.sync(DOCS)
+    yield index
+    index.close()
+
+
+class TestBuildMatchQuery:
+    """Tests for translating user input into FTS5 syntax"""
+
+    def test_quotes_tokens_and_prefixes_last_word(self):
+        assert build_match_query("vector pinec") == '"vector" OR "pinec"*'
+        assert build_match_query("vector pinec ") == '"vector" OR "pinec"'
+
+    def test_fts_operators_in_input_are_inert(self):
+        assert build_match_query('NEAR(" OR *') == '"near"*'
+        assert build_match_query("the of") == ""
+
+
+class TestFtsSearch:
+    """Tests for ranking, prefixes and snippets"""
+
+    def test_ranks_title_matches_first(self, index):
+        assert [h.id for h in index.search("query")] == ['p-1', 'p-2']
+
+    def test_prefix_match_and_kind_filter(self, index):
+        assert index.search("pinec")[0].id == 't-1'
+        assert [h.id for h in index.search("vector", kinds=['hack'])] == ['h-1']
+        assert index.search("pinec ") == []
+
+    def test_highlight_offsets_point_at_matched_text(self, index):
+        hit = index.search("serverless")[0]
+        assert [hit.snippet[s:e] for s, e in hit.highlights] == ['Serverless']
+        assert "**Serverless**" in highlight_markdown(hit.snippet, hit.highlights)
+
+    def test_grouped_shape_matches_memory_index(self, index):
+        grouped = index.search_grouped("vector")
+        assert set(grouped) == {'prompt', 'tool', 'tutorial', 'hack'}
+        assert [r['id'] for r in grouped['tool']] == ['t-1']
+
+
+class TestIncrementalSync:
+    """Only documents whose content hash changed are re-indexed"""
+
+    def test_cold_start_reuses_existing_table(self, index, tmp_path):
+        reopened = open_index(tmp_path / "search.db")
+        stats = reopened.sync(DOCS)
+        assert (stats['inserted'], stats['updated'], stats['unchanged']) == (0, 0, len(DOCS))
+        assert [h.id for h in reopened.search("query")] == ['p-1', 'p-2']
+        reopened.close()
+
+    def test_changed_added_and_removed_documents(self, index):
+        changed = [
+            doc('prompt', 'p-1', "SQL Query Optimizer", "Rewrite the SQL query for zebras"),
+            DOCS[1], DOCS[2],
+            doc('hack', 'h-2', "Zebra prompts"),
+        ]
+        stats = index.sync(changed)
+        assert (stats['inserted'], stats['updated'], stats['deleted'], stats['unchanged']) == (1, 1, 1, 2)
+        assert {h.id for h in index.search("zebras")} == {'p-1'}
+        assert index.search("namespaces") == []
+        assert len(index) == 4
+
+
+class TestFtsFuzzy:
+    """Fuzzy mode reads the vocabulary from the fts5vocab table"""
+
+    def test_misspelling_is_corrected(self, index):
+        assert index.search("pinecnoe") == []
+        assert [h.id for h in index.search("pinecnoe", fuzzy=True)][0] == 't-1'
+        assert index.suggest("vectr pinecone") == "vector pinecone"
+
+    def test_vocabulary_reloads_after_sync(self, index):
+        assert index.suggest("zebrs") is None
+        index.sync(DOCS + [doc('hack', 'h-2', "Zebras")])
+        assert index.suggest("zebrs") == "zebras"
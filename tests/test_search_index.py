@@ -0,0 +1,68 @@
+"""
+AI Nexus - Search Index Tests
+Unit tests for the BM25 inverted index
+"""
+import pytest
+
+from data.search_index import SearchIndex, get_search_index, tokenize
+
+
+def doc(kind, id, title, body="", tags=""):
+    return kind, {'id': id}, {'title': title, 'tags': tags, 'description': "", 'body': body}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex.build([
+        doc('prompt', 'p-1', "SQL Query Optimizer", "Rewrite the SQL query for speed"),
+        doc('prompt', 'p-2', "Email Writer", "Draft a short email; mention the query briefly"),
+        doc('tool', 't-1', "Pinecone", "Serverless vector database", tags="vector db"),
+        doc('hack', 'h-1', "Vector search tricks", "Use pinecone namespaces"),
+    ])
+
+
+class TestTokenize:
+    """Tests for tokenize"""
+
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The RAG pipeline, in 10 Minutes!") == ['rag', 'pipeline', '10', 'minutes']
+
+
+class TestSearchIndex:
+    """Tests for BM25 ranking and query handling"""
+
+    def test_ranks_title_matches_first(self, index):
+        """A title hit should outrank a passing mention in a body"""
+        hits = index.search("query")
+        assert [h.id for h in hits] == ['p-1', 'p-2']
+        assert hits[0].score > hits[1].score
+
+    def test_multi_term_query_prefers_documents_matching_more_terms(self, index):
+        hits = index.search("pinecone vector")
+        assert {h.id for h in hits[:2]} == {'t-1', 'h-1'}
+
+    def test_last_word_matches_as_prefix_while_typing(self, index):
+        """'pinec' should already find Pinecone; 'pinec ' (finished word) should not"""
+        assert [h.id for h in index.search("pinec")][0] == 't-1'
+        assert index.search("pinec ") == []
+
+    def test_kind_filter_and_limit(self, index):
+        assert [h.id for h in index.search("vector", kinds={'hack'})] == ['h-1']
+        assert len(index.search("vector", limit=1)) == 1
+
+    def test_unknown_terms_return_nothing(self, index):
+        assert index.search("xyzzy") == []
+        assert index.search("") == []
+
+
+class TestSharedIndex:
+    """The process-wide index over the real catalogs"""
+
+    def test_covers_every_catalog_and_tutorial_sections(self):
+        """Words that only appear in TUTORIAL_CONTENT section bodies should be searchable"""
+        index = get_search_index()
+        assert index is get_search_index()
+        grouped = index.search_grouped("pinecone")
+        assert all(grouped[kind] for kind in ('tool', 'tutorial'))
+        assert 'qw-1' in [t['id'] for t in grouped['tutorial']]
+        assert 'hack-1' in [h.id for h in index.search("custom instructions", kinds={'hack'})]
@@ -0,0 +1,90 @@
+"""
+AI Nexus - Search Service Tests
+Unit tests for the cached, prefix-narrowing search service
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data.search_service import SearchService, normalize_query
+
+
+RECORDS = [
+    ({'id': 'p-1'}, {'title': "SQL Query Optimizer", 'body': "Rewrite the query for speed"}),
+    ({'id': 'p-2'}, {'title': "Email Writer", 'body': "Draft an email about the SQL migration"}),
+    ({'id': 'p-3'}, {'title': "Unit Test Generator", 'body': "Write pytest tests"}),
+]
+
+
+@pytest.fixture
+def loader():
+    return MagicMock(return_value=RECORDS)
+
+
+@pytest.fixture
+def service(loader):
+    service = SearchService(max_entries=8)
+    service.register('prompt', loader, fallback=lambda query: [{'id': 'fallback'}])
+    return service
+
+
+def ids(records):
+    return [r['id'] for r in records]
+
+
+class TestNormalizeQuery:
+    """Tests for cache keys"""
+
+    def test_case_punctuation_and_stopwords_are_ignored(self):
+        assert normalize_query("  The SQL, Query!") == normalize_query("sql query") == "sql query"
+
+
+class TestSearchService:
+    """Tests for matching, ranking and caching"""
+
+    def test_every_word_must_prefix_match(self, service):
+        assert ids(service.search('prompt', "sq")) == ['p-1', 'p-2']
+        assert ids(service.search('prompt', "sql qu")) == ['p-1']
+
+    def test_title_matches_rank_first(self, service):
+        assert ids(service.search('prompt', "sql")) == ['p-1', 'p-2']
+        assert ids(service.search('prompt', "email")) == ['p-2']
+
+    def test_repeat_query_is_a_cache_hit(self, service, loader):
+        service.search('prompt', "SQL")
+        service.search('prompt', "sql ")
+        stats = service.stats()
+        assert (stats['misses'], stats['hits']) == (1, 1)
+        assert loader.call_count == 1
+
+    def test_extended_query_narrows_cached_candidates(self, service):
+        """'sql q' only re-checks the two records cached for 'sql'"""
+        service.search('prompt', "sql")
+        with patch('data.search_service._Document.matches', autospec=True, side_effect=lambda doc, terms: True) as matches:
+            service.search('prompt', "sql q")
+        assert matches.call_count == 2
+        assert service.stats()['narrowed'] == 1
+
+    def test_no_word_match_uses_fallback(self, service):
+        assert ids(service.search('prompt', "sqll")) == ['fallback']
+        assert service.stats()['fallbacks'] == 1
+
+    def test_lru_evicts_oldest_entries(self, service):
+        for i in range(10):
+            service.search('prompt', f"word{i}")
+        assert service.stats()['entries'] == 8
+        assert service.stats()['evictions'] == 2
+
+    def test_invalidate_reloads_documents(self, service, loader):
+        service.search('prompt', "sql")
+        loader.return_value = RECORDS + [({'id': 'p-4'}, {'title': "SQL Tutor"})]
+        service.invalidate('prompt')
+        assert ids(service.search('prompt', "sql")) == ['p-1', 'p-4', 'p-2']
+
+    def test_ttl_expires_scope(self, loader):
+        service = SearchService()
+        service.register('news', loader, ttl=0)
+        service.search('news', "sql")
+        service.search('news', "sql")
+        assert loader.call_count == 2
+        assert service.stats()['hits'] == 0
@@ -0,0 +1,145 @@
+"""
+AI Nexus - Trending Topics Tests
+Decayed counts, the top-K heap, compaction and persistence
+"""
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from data.trending import TrendingEngine, headline_terms
+
+
+def _utcnow():
+    """Naive UTC now, the form articles store published times in"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _brute_force_top(engine, k):
+    """Exact ranking of every counter, for comparison with the heap"""
+    return sorted(((w, t) for t, w in engine._weights.items()), reverse=True)[:k]
+
+
+class TestHeadlineTerms:
+    """Tests for headline tokenization"""
+
+    def test_keeps_model_names_and_drops_filler(self):
+        terms = headline_terms("OpenAI says GPT-4.5 is now available for C++ developers")
+        assert {"openai", "gpt-4.5", "c++", "developers", "c++ developers"} <= set(terms)
+        assert "says" not in terms and "is" not in terms
+
+    def test_short_words_only_count_in_bigrams(self):
+        terms = headline_terms("AI agents reach Claude 3")
+        assert "ai" not in terms and "3" not in terms
+        assert "ai agents" in terms and "claude 3" in terms
+
+
+class TestTrendingEngine:
+    """Tests for the decayed counters and their top list"""
+
+    def test_recent_mentions_outweigh_older_ones(self):
+        engine = TrendingEngine(half_life_hours=24, path=None)
+        now = _utcnow()
+        for _ in range(3):
+            engine.add("Robotics", now - timedelta(days=3))
+        for _ in range(2):
+            engine.add("Quantum", now)
+
+        # Three mentions three half-lives ago are worth 3/8 of a mention today
+        (first, first_score), (second, second_score) = engine.top(2)
+        assert (first, second) == ("quantum", "robotics")
+        assert math.isclose(first_score, 2, rel_tol=0.01)
+        assert math.isclose(second_score, 3 / 8, rel_tol=0.01)
+
+    def test_bigram_replaces_words_it_carries(self):
+        engine = TrendingEngine(path=None)
+        for title in ["Open source model wins", "New open source toolkit", "Open source agents"]:
+            engine.add(title)
+        terms = [term for term, _ in engine.top(10)]
+        assert "open source" in terms
+        assert "open" not in terms and "source" not in terms
+
+    def test_heap_matches_a_full_sort(self):
+        rng = random.Random(7)
+        vocabulary = [f"term{i}" for i in range(300)]
+        engine = TrendingEngine(candidates=40, path=None)
+        start = _utcnow() - timedelta(days=10)
+        for i in range(3000):
+            words = rng.choices(vocabulary, weights=[1 / (r + 1) for r in range(300)], k=3)
+            engine.add(" ".join(words), start + timedelta(minutes=5 * i))
+
+        expected = _brute_force_top(engine, 40)
+        assert sorted(((w, t) for t, w in engine._in_heap.items()), reverse=True) == expected
+
+    def test_rebase_keeps_scores(self):
+        engine = TrendingEngine(half_life_hours=1, path=None)
+        start = _utcnow() - timedelta(days=5)
+        engine.add("Compiler release", start)
+        # 5 days of 1h half-lives pushes the exponent past the rebase threshold
+        engine.add("Compiler release", _utcnow())
+        assert engine._base > start.replace(tzinfo=timezone.utc).timestamp()
+        assert math.isclose(dict(engine.top(5))["compiler release"], 1.0, rel_tol=0.01)
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_naive_times_are_utc_on_any_host(self, monkeypatch):
+        monkeypatch.setenv("TZ", "Asia/Kolkata")
+        time.tzset()
+        try:
+            engine = TrendingEngine(half_life_hours=1, path=None)
+            engine.add("Compiler release", _utcnow())
+            engine.add("Kernel update", datetime.now(timezone.utc))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        # Read as local time, the naive headline would be 5.5 half-lives off
+        weights = dict(engine.top(5))
+        assert math.isclose(weights["compiler release"], 1.0, rel_tol=0.01)
+        assert math.isclose(weights["kernel update"], 1.0, rel_tol=0.01)
+
+    def test_compaction_bounds_the_counters_and_keeps_leaders(self):
+        engine = TrendingEngine(max_terms=500, candidates=10, path=None)
+        for _ in range(20):
+            engine.add("Leader headline")
+        for i in range(2000):
+            engine.add(f"unique{i}")
+        assert len(engine) <= 500
+        assert engine.top(1)[0][0] == "leader headline"
+
+
+class TestPersistence:
+    """Tests for saving counters between restarts"""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "trending.json"
+        engine = TrendingEngine(path=path)
+        engine.add_articles([
+            {'title': "Diffusion model tops benchmark", 'published': _utcnow()},
+            {'title': "Diffusion model goes open", 'published': None},
+        ])
+        engine.save()
+
+        restored = TrendingEngine(path=path)
+        assert restored.load()
+        assert restored.articles == 2
+        now = time.time()
+        assert restored.top(10, now=now) == engine.top(10, now=now)
+
+    def test_missing_or_corrupt_file(self, tmp_path):
+        path = tmp_path / "trending.json"
+        assert not TrendingEngine(path=path).load()
+        path.write_text("{not json")
+        assert not TrendingEngine(path=path).load()
+
+    def test_reload_picks_up_another_writer(self, tmp_path):
+        path = tmp_path / "trending.json"
+        reader = TrendingEngine(path=path)
+        reader.reload_if_changed()
+        assert reader.top() == []
+
+        writer = TrendingEngine(path=path)
+        writer.add("Inference chips shortage")
+        writer.save()
+        reader.reload_if_changed()
+        assert reader.top(1)[0][0] == writer.top(1)[0][0]
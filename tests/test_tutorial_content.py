@@ -0,0 +1,65 @@
+"""
+AI Nexus - Tutorial Content Store Tests
+Unit tests for lazily loaded tutorial bodies
+"""
+import pytest
+
+import data.tutorial_content as store
+from data.tutorial_content import TUTORIAL_CONTENT, load_section
+from data.final_tutorials import get_all_tutorials
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    TUTORIAL_CONTENT.reload()
+    yield
+    TUTORIAL_CONTENT.reload()
+
+
+class TestTutorialContentMapping:
+    """The store still behaves like the old TUTORIAL_CONTENT dict"""
+
+    def test_get_returns_title_sections_and_quiz(self):
+        content = TUTORIAL_CONTENT.get('qw-1')
+        assert content['title']
+        assert content['sections'][0]['title'] == "The RAG Blueprint"
+        assert "Retrieval Augmented Generation" in content['sections'][0].get('content', '')
+        assert content['quiz'][0]['options']
+
+    def test_unknown_and_unsafe_ids(self):
+        assert TUTORIAL_CONTENT.get('missing') is None
+        assert TUTORIAL_CONTENT.get('../tutorials/qw-1') is None
+        assert 'missing' not in TUTORIAL_CONTENT
+
+    def test_every_listed_tutorial_has_content(self):
+        tutorial_ids = {t['id'] for t in get_all_tutorials()}
+        assert set(TUTORIAL_CONTENT) <= tutorial_ids
+        assert len(TUTORIAL_CONTENT) == len(list(TUTORIAL_CONTENT))
+
+
+class TestLazyLoading:
+    """Section bodies are read only when rendered, and the resident set is bounded"""
+
+    def test_section_bodies_load_on_access(self):
+        content = TUTORIAL_CONTENT.get('dd-1')
+        assert load_section.cache_info().currsize == 0
+        content['sections'][0]['content']
+        assert load_section.cache_info().currsize == 1
+
+    def test_resident_sections_are_capped(self):
+        for tutorial_id in TUTORIAL_CONTENT:
+            for section in TUTORIAL_CONTENT[tutorial_id]['sections']:
+                section['content']
+        info = load_section.cache_info()
+        assert info.currsize <= info.maxsize
+
+    def test_reload_picks_up_new_tutorials(self, tmp_path, monkeypatch):
+        (tmp_path / "new-1").mkdir()
+        (tmp_path / "new-1" / "tutorial.json").write_text(
+            '{"title": "New", "sections": [{"title": "Intro", "file": "01.md"}]}', encoding="utf-8")
+        (tmp_path / "new-1" / "01.md").write_text("\nHello\n", encoding="utf-8")
+        monkeypatch.setattr(store, 'CONTENT_DIR', tmp_path)
+        TUTORIAL_CONTENT.reload()
+        assert list(TUTORIAL_CONTENT) == ['new-1']
+        assert TUTORIAL_CONTENT['new-1']['sections'][0]['content'] == "\nHello\n"
+        assert 'quiz' not in TUTORIAL_CONTENT['new-1']
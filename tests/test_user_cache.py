@@ -0,0 +1,119 @@
+"""
+AI Nexus - User Cache Tests
+Unit tests for the per-user favorites / progress membership cache
+"""
+import pytest
+from sqlalchemy import event
+
+from database.operations import DatabaseOperations
+from database.user_cache import UserStateCache
+
+
+@pytest.fixture
+def user_id(temp_db):
+    """Create a user with one favorite and one completed tutorial"""
+    user_id = DatabaseOperations.create_user(username="cache_user")['id']
+    DatabaseOperations.add_favorite(user_id, 'tools', 'cursor', {})
+    DatabaseOperations.mark_tutorial_complete(user_id, 'qw-1')
+    return user_id
+
+
+@pytest.fixture
+def queries(temp_db):
+    """Record statements sent to the temporary engine"""
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(temp_db, 'before_cursor_execute', capture)
+    yield statements
+    event.remove(temp_db, 'before_cursor_execute', capture)
+
+
+class TestUserStateCache:
+    """Membership checks should be served from memory after one load"""
+
+    def test_grid_of_checks_costs_one_query(self, user_id, queries):
+        """40 card checks should load the user once and then hit"""
+        cache = UserStateCache()
+
+        results = [cache.is_favorite(user_id, 'tools', f"tool-{i}") for i in range(20)]
+        results += [cache.is_tutorial_complete(user_id, f"qw-{i}") for i in range(20)]
+
+        assert len(queries) == 1
+        assert results.count(True) == 1
+        assert cache.is_favorite(user_id, 'tools', 'cursor')
+        stats = cache.stats()
+        assert (stats['misses'], stats['hits'], stats['loads']) == (1, 40, 1)
+
+    def test_writes_update_cached_sets(self, user_id, queries):
+        """Write paths should keep the entry exact without a reload"""
+        cache = UserStateCache()
+        cache.is_favorite(user_id, 'tools', 'cursor')
+
+        cache.add_favorite(user_id, 'tools', 'copilot')
+        cache.remove_favorite(user_id, 'tools', 'cursor')
+        cache.mark_tutorial_complete(user_id, 'qw-2')
+
+        assert cache.is_favorite(user_id, 'tools', 'copilot')
+        assert not cache.is_favorite(user_id, 'tools', 'cursor')
+        assert cache.is_tutorial_complete(user_id, 'qw-2')
+        assert cache.stats()['loads'] == 1
+
+    def test_load_racing_a_write_is_not_stored(self, user_id, monkeypatch):
+        """A load that started before a write must not overwrite it with stale IDs"""
+        cache = UserStateCache()
+        real_load = DatabaseOperations.get_user_item_ids
+
+        def load_then_write(uid):
+            ids = real_load(uid)
+            cache.add_favorite(uid, 'tools', 'copilot')
+            return ids
+
+        monkeypatch.setattr(DatabaseOperations, 'get_user_item_ids', staticmethod(load_then_write))
+        cache.is_favorite(user_id, 'tools', 'cursor')
+
+        assert cache.stats()['users'] == 0
+
+    def test_write_bookkeeping_stays_bounded(self, user_id, monkeypatch):
+        """Writes for users with no load in flight leave nothing behind; a racing load's counter is dropped"""
+        cache = UserStateCache(max_users=1)
+        for uid in range(1000, 1500):
+            cache.add_favorite(uid, 'tools', 'cursor')
+            cache.invalidate(uid)
+        assert cache._generations == {} and cache._loading == {}
+
+        real_load = DatabaseOperations.get_user_item_ids
+
+        def load_then_write(uid):
+            ids = real_load(uid)
+            cache.add_favorite(uid, 'tools', 'copilot')
+            assert cache._generations == {uid: 1}
+            return ids
+
+        monkeypatch.setattr(DatabaseOperations, 'get_user_item_ids', staticmethod(load_then_write))
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        assert cache._generations == {} and cache._loading == {}
+
+    def test_expired_and_evicted_entries_reload(self, temp_db, user_id):
+        """TTL expiry and LRU eviction should both force a fresh load"""
+        other_id = DatabaseOperations.create_user(username="other_user")['id']
+        cache = UserStateCache(max_users=1, ttl=0)
+
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        cache.is_favorite(user_id, 'tools', 'cursor')
+        assert cache.stats()['loads'] == 2
+
+        cache.ttl = 60
+        cache.is_favorite(other_id, 'tools', 'cursor')
+        assert cache.stats()['users'] == 1
+        assert cache.stats()['evictions'] == 1
+
+    def test_falls_back_to_point_query_on_load_error(self, user_id, monkeypatch):
+        """If the bulk load fails the answer should still be correct"""
+        cache = UserStateCache()
+        monkeypatch.setattr(DatabaseOperations, 'get_user_item_ids', staticmethod(lambda uid: None))
+
+        assert cache.is_favorite(user_id, 'tools', 'cursor')
+        assert cache.stats()['load_errors'] == 1
@@ -0,0 +1,104 @@
+"""
+AI Nexus - Cache Namespaces
+Per-domain version tokens for the in-process caches, so one domain can be invalidated without the rest
+"""
+from typing import Dict, Hashable
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+NEWS = "news"
+CATALOGS = "catalogs"
+USERS = "users"
+
+NAMESPACES = (NEWS, CATALOGS, USERS)
+
+# Fragment cache kinds and search scopes -> the namespace whose data they render
+KIND_NAMESPACES = {
+    'prompt': CATALOGS,
+    'tool': CATALOGS,
+    'tutorial': CATALOGS,
+    'hack': CATALOGS,
+    'global': CATALOGS,
+    'news': NEWS,
+}
+
+
+def namespace_of(kind: Hashable) -> str:
+    """Namespace of a fragment kind or search scope (catalogs unless it is news)"""
+    return KIND_NAMESPACES.get(kind, CATALOGS)
+
+
+class CacheNamespaces:
+    """
+    Version tokens and counters for the cache domains: news, catalogs
+    (prompts, tools, tutorials, hacks and the global search) and users.
+
+    Every cache that holds a domain's data puts version(namespace) in its
+    keys - FragmentCache, SearchService and UserStateCache do. invalidate()
+    bumps the token, so that domain's entries stop matching and age out
+    of their LRUs while every other domain, and every other user's
+    entries, stay warm. This replaces clearing all of st.cache_data.
+
+    The caches report their lookups here too, giving hits / misses /
+    evictions per domain across all caches (shown on the admin page).
+
+    Usage:
+        namespaces = get_cache_namespaces()
+        key = (kind, item_id, namespaces.version(NEWS))
+        namespaces.record(NEWS, hits=1)
+        namespaces.invalidate(NEWS)  # after new articles are stored
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {name: 0 for name in NAMESPACES}
+        self._metrics: Dict[str, Dict[str, int]] = {name: self._empty_metrics() for name in NAMESPACES}
+
+    @staticmethod
+    def _empty_metrics() -> Dict[str, int]:
+        return {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def version(self, namespace: str) -> int:
+        """Current version token of a namespace"""
+        return self._versions[namespace]
+
+    def invalidate(self, namespace: str) -> int:
+        """Retire every cached entry of one namespace; returns the new version"""
+        with self._lock:
+            self._versions[namespace] += 1
+            self._metrics[namespace]['invalidations'] += 1
+            version = self._versions[namespace]
+        logger.info(f"Cache namespace '{namespace}' invalidated (version {version})")
+        return version
+
+    def record(self, namespace: str, hits: int = 0, misses: int = 0, evictions: int = 0):
+        """Count lookups and evictions a cache made for a namespace"""
+        with self._lock:
+            metrics = self._metrics[namespace]
+            metrics['hits'] += hits
+            metrics['misses'] += misses
+            metrics['evictions'] += evictions
+
+    def stats(self) -> Dict[str, Dict]:
+        """Version, counters and hit rate per namespace"""
+        with self._lock:
+            stats = {name: dict(self._metrics[name], version=self._versions[name]) for name in NAMESPACES}
+        for metrics in stats.values():
+            lookups = metrics['hits'] + metrics['misses']
+            metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+_namespaces = None
+_namespaces_lock = threading.Lock()
+
+
+def get_cache_namespaces() -> CacheNamespaces:
+    """Get the process-wide cache namespaces"""
+    global _namespaces
+    with _namespaces_lock:
+        if _namespaces is None:
+            _namespaces = CacheNamespaces()
+        return _namespaces
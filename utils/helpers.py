@@ -5,16 +5,21 @@ Helper functions for the application with database persistence
 import streamlit as st
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+from database.snapshot import UserSnapshot
+
 # Import database operations
 try:
     from database.operations import DatabaseOperations
+    from database.activity_writer import get_activity_writer
+    from database.user_cache import get_user_cache
     DB_AVAILABLE = True
 except ImportError:
     logger.warning("Database not available, using session state fallback")
@@ -105,6 +110,7 @@ def add_to_favorites(item_type: str, item_id: str, item_data: dict) -> bool:
         if DB_AVAILABLE:
             success = DatabaseOperations.add_favorite(user_id, item_type, item_id, item_data)
             if success:
+                get_user_cache().add_favorite(user_id, item_type, item_id)
                 track_activity('favorite_added', item_id, {'type': item_type})
             return success
         else:
@@ -138,7 +144,10 @@ def remove_from_favorites(item_type: str, item_id: str) -> bool:
             return False
         
         if DB_AVAILABLE:
-            return DatabaseOperations.remove_favorite(user_id, item_type, item_id)
+            success = DatabaseOperations.remove_favorite(user_id, item_type, item_id)
+            if success:
+                get_user_cache().remove_favorite(user_id, item_type, item_id)
+            return success
         else:
             favorites = get_from_local_storage('favorites', {})
             if item_type in favorites and item_id in favorites[item_type]:
@@ -161,7 +170,7 @@ def is_favorite(item_type: str, item_id: str) -> bool:
             return item_type in favorites and item_id in favorites[item_type]
         
         if DB_AVAILABLE:
-            return DatabaseOperations.is_favorite(user_id, item_type, item_id)
+            return get_user_cache().is_favorite(user_id, item_type, item_id)
         else:
             favorites = get_from_local_storage('favorites', {})
             return item_type in favorites and item_id in favorites[item_type]
@@ -218,6 +227,7 @@ def mark_tutorial_complete(tutorial_id: str) -> bool:
         if DB_AVAILABLE:
             success = DatabaseOperations.mark_tutorial_complete(user_id, tutorial_id)
             if success:
+                get_user_cache().mark_tutorial_complete(user_id, tutorial_id)
                 track_activity('tutorial_completed', tutorial_id)
             return success
         else:
@@ -241,7 +251,7 @@ def is_tutorial_complete(tutorial_id: str) -> bool:
             return tutorial_id in completed
         
         if DB_AVAILABLE:
-            return DatabaseOperations.is_tutorial_complete(user_id, tutorial_id)
+            return get_user_cache().is_tutorial_complete(user_id, tutorial_id)
         else:
             completed = get_from_local_storage('completed_tutorials', [])
             return tutorial_id in completed
@@ -342,7 +352,8 @@ def track_activity(activity_type: str, item_id: str, details: dict = None) -> bo
             return True
         
         if DB_AVAILABLE:
-            return DatabaseOperations.track_activity(user_id, activity_type, item_id, details)
+            # Queued and bulk-inserted by a background thread so renders never wait on it
+            return get_activity_writer().enqueue(user_id, activity_type, item_id, details)
         else:
             activities = get_from_local_storage('activities', [])
             activity = {
@@ -385,38 +396,65 @@ def get_recent_activities(limit: int = 10) -> List[Dict]:
         return []
 
 
-def calculate_ai_score() -> int:
-    """Calculate user's AI proficiency score based on activities"""
+def get_weekly_activity() -> List[int]:
+    """Activity counts for the last 7 days, grouped by weekday (index 0 = Monday)"""
+    counts = [0] * 7
     try:
         user_id = get_current_user_id()
-        
         if user_id and DB_AVAILABLE:
-            stats = DatabaseOperations.get_user_stats(user_id)
-            if stats:
-                # Calculate score from stats
-                score = min(100, (
-                    stats.tutorials_completed * 5 +
-                    stats.prompts_saved * 2 +
-                    stats.tools_favorited * 1
-                ))
-                return int(score)
-        
-        # Fallback calculation
-        completed_tutorials = len(get_completed_tutorials())
-        saved_prompts = len(get_saved_prompts())
-        favorites = get_all_favorites()
-        total_favorites = sum(len(items) for items in favorites.values())
+            for day, count in DatabaseOperations.get_daily_activity_counts(user_id, days=7).items():
+                counts[day.weekday()] += count
+            return counts
+
+        since = datetime.now() - timedelta(days=7)
+        for activity in get_from_local_storage('activities', []):
+            try:
+                ts = datetime.fromisoformat(activity.get('timestamp', ''))
+            except ValueError:
+                continue
+            if ts >= since:
+                counts[ts.weekday()] += 1
+        return counts
+    except Exception as e:
+        logger.error(f"Error getting weekly activity: {e}")
+        return counts
+
+
+def get_user_snapshot(activity_limit: int = 50) -> UserSnapshot:
+    """
+    Get everything the dashboard, profile and home pages show about the current user.
+
+    One database session and a handful of queries instead of one call per
+    widget; falls back to session state when there is no user or database.
+    """
+    try:
+        user_id = get_current_user_id()
+        if user_id and DB_AVAILABLE:
+            snapshot = DatabaseOperations.get_user_snapshot(user_id, activity_limit)
+            if snapshot is not None:
+                return snapshot
+
         activities = get_from_local_storage('activities', [])
-        
-        score = min(100, (
-            completed_tutorials * 5 +
-            saved_prompts * 2 +
-            total_favorites * 1 +
-            len(activities) * 0.5
-        ))
-        
-        return int(score)
+        return UserSnapshot(
+            user_id=user_id,
+            completed_tutorials=frozenset(get_completed_tutorials()),
+            saved_prompts=frozenset(get_saved_prompts()),
+            favorites=MappingProxyType({
+                item_type: frozenset(items) for item_type, items in get_all_favorites().items()
+            }),
+            activities=tuple(MappingProxyType(a) for a in activities[::-1][:activity_limit]),
+        )
+    except Exception as e:
+        logger.error(f"Error getting user snapshot: {e}")
+        return UserSnapshot(user_id=None)
+
+
+def calculate_ai_score() -> int:
+    """Calculate user's AI proficiency score based on activities"""
+    try:
+        # DB users are scored from their stats row; session-state activities (capped at 100) all count
+        activity_limit = 0 if get_current_user_id() and DB_AVAILABLE else 100
+        return get_user_snapshot(activity_limit).ai_score
     except Exception as e:
         logger.error(f"Error calculating AI score: {e}")
         return 0
-